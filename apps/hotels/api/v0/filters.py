@@ -1,7 +1,8 @@
 import django_filters
 from apps.hotels.models import Hotel
+from travelsuz_back.geo import GeoFilterSet
 
-class HotelFilter(django_filters.FilterSet):
+class HotelFilter(GeoFilterSet):
     region = django_filters.NumberFilter(field_name='region__id')
 
     class Meta:
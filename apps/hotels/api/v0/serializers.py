@@ -2,11 +2,14 @@ from curses.ascii import isdigit
 from decimal import Decimal, InvalidOperation
 from typing import Dict, Optional, Any, List
 
+from django.db import transaction
 from drf_spectacular.utils import extend_schema_field
 from modeltranslation.utils import get_language
 from rest_framework import serializers
-from apps.hotels.models import Regions, Hotel, HotelImage, HotelComment
-from apps.travels.models import TravelImage
+from apps.hotels.models import Regions, RegionStats, Hotel, HotelImage, HotelComment
+from travelsuz_back.fast_serializers import ReadOnlySerializer, LANGUAGES
+from travelsuz_back.gallery import update_gallery
+from travelsuz_back.images import srcset
 
 
 class RegionSerializer(serializers.ModelSerializer):
@@ -31,6 +34,21 @@ class RegionSerializer(serializers.ModelSerializer):
         return getattr(obj, f'name_{lang}', obj.name_uz)
 
 
+class RegionStatsSerializer(serializers.ModelSerializer):
+    id = serializers.IntegerField(source='region_id', read_only=True)
+    name = serializers.SerializerMethodField()
+
+    class Meta:
+        model = RegionStats
+        fields = ['id', 'name', 'hotel_count', 'travel_count', 'restaurant_count',
+                  'hotel_min_price', 'hotel_avg_price', 'total_views']
+
+    def get_name(self, obj) -> str:
+        request = self.context.get('request')
+        lang = request.query_params.get('lang', 'uz') if request else 'uz'
+        return getattr(obj.region, f'name_{lang}', None) or obj.region.name_uz
+
+
 class RegionCreateSerializer(serializers.ModelSerializer):
     class Meta:
         model = Regions
@@ -49,6 +67,7 @@ class HotelSerializer(serializers.ModelSerializer):
     address = serializers.SerializerMethodField()
     region = serializers.SerializerMethodField()
     images = serializers.SerializerMethodField()
+    image_variants = serializers.SerializerMethodField()
     location = serializers.SerializerMethodField()
 
     class Meta:
@@ -61,6 +80,7 @@ class HotelSerializer(serializers.ModelSerializer):
             'phone_number',
             'price',
             'images',
+            'image_variants',
             'location',
             'created_at',
             'region',
@@ -68,6 +88,8 @@ class HotelSerializer(serializers.ModelSerializer):
         ]
 
     def get_lang(self) -> str:
+        if 'lang' in self.context:
+            return self.context['lang']
         request = self.context.get('request')
         if request:
             return request.query_params.get('lang', 'uz')  # Default: uz
@@ -91,6 +113,10 @@ class HotelSerializer(serializers.ModelSerializer):
     def get_images(self, obj) -> List[str]:
         return [img.image.url for img in obj.images.all()]
 
+    @extend_schema_field(serializers.ListField(child=serializers.DictField(child=serializers.CharField())))
+    def get_image_variants(self, obj) -> List[Dict[str, str]]:
+        return [srcset(img) for img in obj.images.all()]
+
     @extend_schema_field(
         serializers.DictField(
             child=serializers.FloatField(allow_null=True),
@@ -109,10 +135,21 @@ class HotelSerializer(serializers.ModelSerializer):
         lang = get_language()
         return getattr(obj.region, f'name_{lang}', obj.region.name)
 
+class HotelReadSerializer(ReadOnlySerializer):
+    model = Hotel
+    serializer_class = HotelSerializer
+    translated_fields = ('title', 'description', 'address')
+
+    @classmethod
+    def for_request(cls, request):
+        lang = request.GET.get('lang', 'uz')
+        return cls(lang if lang in LANGUAGES else 'uz', get_language())
+
+
 class HotelImageSerializer(serializers.ModelSerializer):
     class Meta:
-        model = TravelImage
-        fields = ['id', 'image']
+        model = HotelImage
+        fields = ['id', 'image', 'status']
 
 
 class HotelCreateSerializer(serializers.ModelSerializer):
@@ -196,8 +233,7 @@ class HotelCreateSerializer(serializers.ModelSerializer):
 
         hotel = Hotel.objects.create(**validated_data)
 
-        for img in uploaded_images:
-            HotelImage.objects.create(hotel=hotel, image=img)
+        update_gallery(hotel, uploaded=uploaded_images)
         return hotel
 
 
@@ -221,6 +257,14 @@ class HotelUpdateSerializer(serializers.ModelSerializer):
     uploaded_images = serializers.ListField(
         child=serializers.ImageField(), write_only=True, required=False, allow_empty=True, default=[]
     )
+    remove_image_ids = serializers.ListField(
+        child=serializers.IntegerField(), write_only=True, required=False,
+        help_text="O'chiriladigan rasm id larini kiriting"
+    )
+    image_order = serializers.ListField(
+        child=serializers.IntegerField(), write_only=True, required=False,
+        help_text="Rasm id larini kerakli tartibda kiriting"
+    )
 
     class Meta:
         model = Hotel
@@ -230,7 +274,7 @@ class HotelUpdateSerializer(serializers.ModelSerializer):
             'description_uz', 'description_ru', 'description_en',
             'address_uz', 'address_ru', 'address_en',  # 3 tilli address
             'phone_number', 'price', 'region',
-            'location', 'latitude', 'longitude', 'images', 'uploaded_images',
+            'location', 'latitude', 'longitude', 'images', 'uploaded_images', 'remove_image_ids', 'image_order',
         ]
         read_only_fields = ['id', 'created_at']
 
@@ -279,8 +323,11 @@ class HotelUpdateSerializer(serializers.ModelSerializer):
 
         return value
 
+    @transaction.atomic
     def update(self, instance, validated_data) -> Dict[str, Any]:
         uploaded_images = validated_data.pop('uploaded_images', None)
+        remove_image_ids = validated_data.pop('remove_image_ids', None)
+        image_order = validated_data.pop('image_order', None)
         latitude = validated_data.pop('latitude', None)
         longitude = validated_data.pop('longitude', None)
 
@@ -296,10 +343,7 @@ class HotelUpdateSerializer(serializers.ModelSerializer):
             setattr(instance, attr, value)
         instance.save()
 
-        if uploaded_images is not None:
-            instance.images.all().delete()
-            for img in uploaded_images:
-                HotelImage.objects.create(hotel=instance, image=img)
+        update_gallery(instance, uploaded=uploaded_images, remove_ids=remove_image_ids, order=image_order)
 
         return instance
 
@@ -313,4 +357,14 @@ class HotelCommentSerializer(serializers.ModelSerializer):
             'hotel': {'help_text': "hotel id ni kiriting !"},
             'text': {'help_text': "Comment text ni kiriting !", 'default':''},
         }
-        read_only_fields = ['id', 'created_at']
\ No newline at end of file
+        read_only_fields = ['id', 'created_at']
+
+
+class HotelCommentReadSerializer(ReadOnlySerializer):
+    model = HotelComment
+    serializer_class = HotelCommentSerializer
+
+
+class RegionReadSerializer(ReadOnlySerializer):
+    model = Regions
+    serializer_class = RegionSerializer
@@ -4,7 +4,10 @@ from .views import (hotels_views, hotel_detail_view,
                     regions_create_view, hotel_update_view,
                     hotel_delete_view, regions_update_view,
                     regions_delete_view, hotel_comment_create_view,
-                    hotel_comment_list_view)
+                    hotel_comment_list_view, hotels_async_view,
+                    hotel_detail_async_view, regions_async_view,
+                    hotel_comment_list_async_view, hotel_trending_view,
+                    regions_stats_view)
 
 app_name = 'hotels_api'
 urlpatterns = [
@@ -12,6 +15,7 @@ urlpatterns = [
     path( 'hotel_detail/<int:pk>/', hotel_detail_view, name='hotel_detail_view' ),
     path('hotel_create/', hotel_create_view, name='hotel_create_view' ),
     path('regions_list/', regions_views, name='regions_views' ),
+    path('regions_stats/', regions_stats_view, name='regions_stats_view'),
     path('region_create/', regions_create_view, name='regions_create_view' ),
     path('hotel_update/<int:pk>/', hotel_update_view, name='hotel_update_view' ),
     path('hotel_delete/<int:pk>/', hotel_delete_view, name='hotel_delete_view'),
@@ -19,5 +23,12 @@ urlpatterns = [
     path('region_delete/<int:pk>/', regions_delete_view, name='region_delete_view'),
     path('hotel_comment_create/', hotel_comment_create_view, name='hotel_comment_create_view' ),
     path('hotel_comment_list/<int:pk>/', hotel_comment_list_view, name='hotel_comment_list_view' ),
+    path('trending/', hotel_trending_view, name='hotel_trending_view'),
+
+    # ASGI uchun async (faqat o'qish) variantlar
+    path('async/hotel_list/', hotels_async_view, name='hotels_async_view'),
+    path('async/hotel_detail/<int:pk>/', hotel_detail_async_view, name='hotel_detail_async_view'),
+    path('async/regions_list/', regions_async_view, name='regions_async_view'),
+    path('async/hotel_comment_list/<int:pk>/', hotel_comment_list_async_view, name='hotel_comment_list_async_view'),
 
 ]
@@ -9,18 +9,28 @@ from rest_framework.generics import ListAPIView, RetrieveAPIView, CreateAPIView,
 from rest_framework.parsers import MultiPartParser, FormParser
 from rest_framework.permissions import IsAuthenticated, AllowAny
 
-from apps.hotels.models import Regions, Hotel, HotelComment
+from apps.hotels.models import Regions, RegionStats, Hotel, HotelComment
 from .filters import HotelFilter
+from apps.trending.api.v0.views import TrendingListView, TRENDING_PARAMETERS
+from apps.trending.models import TrendingScore
+from travelsuz_back import view_counter
+from travelsuz_back.async_views import AsyncListView, AsyncDetailView
+from travelsuz_back.cards import CardListMixin
+from travelsuz_back.conditional import ConditionalGetMixin
+from travelsuz_back.response_cache import CachedResponseMixin
+from travelsuz_back.throttling import WRITE_THROTTLES
 from .serializers import (HotelSerializer, HotelCreateSerializer,
                           RegionSerializer, RegionCreateSerializer,
-                          HotelUpdateSerializer, HotelCommentSerializer)
+                          HotelUpdateSerializer, HotelCommentSerializer, HotelReadSerializer,
+                          HotelCommentReadSerializer, RegionReadSerializer, RegionStatsSerializer)
 
 from django.utils import translation
 
 
-class HotelListAPIView(ListAPIView):
-    queryset = Hotel.objects.all()
+class HotelListAPIView(CachedResponseMixin, ConditionalGetMixin, CardListMixin, ListAPIView):
+    queryset = Hotel.objects.with_related()
     serializer_class = HotelSerializer
+    read_serializer_class = HotelReadSerializer
     filter_backends = [DjangoFilterBackend]
     filterset_class = HotelFilter
 
@@ -32,23 +42,20 @@ class HotelListAPIView(ListAPIView):
                 return super().get(request, *args, **kwargs)
         return super().get(request, *args, **kwargs)
 
-class HotelDetailView(RetrieveAPIView):
-    queryset = Hotel.objects.all()
+class HotelDetailView(CachedResponseMixin, ConditionalGetMixin, RetrieveAPIView):
+    queryset = Hotel.objects.with_related()
     serializer_class = HotelSerializer
     lookup_field = 'pk'
 
-    def retrieve(self, request, *args, **kwargs):
-        instance = self.get_object()
-        instance.views += 1
-        instance.save(update_fields=["views"])
-        return super().retrieve(request, *args, **kwargs)
+    def on_cache_hit(self, request, *args, **kwargs):
+        view_counter.record_view(Hotel, kwargs['pk'])
 
-    def get_object(self):
-        pk = self.kwargs.get("pk")
-        try:
-            return Hotel.objects.get(pk=pk)
-        except Hotel.DoesNotExist:
+    def retrieve(self, request, *args, **kwargs):
+        data = HotelReadSerializer.for_request(request).serialize(Hotel.objects.filter(pk=kwargs['pk']))
+        if not data:
             raise NotFound(detail="Bunday Hotel topilmadi.")
+        view_counter.record_view(Hotel, data[0]['id'])
+        return Response(data[0])
 
     @extend_schema(tags=["Hotels"], summary="Hotel ma'lumotlarini ko'rish")
     def get(self, request, *args, **kwargs):
@@ -172,19 +179,32 @@ class RegionUpdateView(UpdateAPIView):
             "data": serializer.data
         }, status=status.HTTP_200_OK)
 
-class RegionsListView(ListAPIView):
+class RegionsListView(CachedResponseMixin, ConditionalGetMixin, ListAPIView):
     queryset = Regions.objects.all()
     serializer_class = RegionSerializer
+    pagination_class = None
+    filter_backends = []
+    validator_fields = ('updated_at',)
 
     @extend_schema(tags=["Region"], summary="Barcha regionlar listini chiqarish")
-    def get(self, request):
+    def get(self, request, *args, **kwargs):
         lang = request.query_params.get('lang')
         if lang:
             translation.activate(lang)
+        return super().get(request, *args, **kwargs)
 
-        queryset = Regions.objects.all()
-        serializer = RegionSerializer(queryset, many=True)
-        return Response(serializer.data)
+
+class RegionStatsView(ConditionalGetMixin, ListAPIView):
+    # sonlar RegionStats jadvalidan o'qiladi (travelsuz_back/region_stats.py), har so'rovda COUNT yo'q
+    queryset = RegionStats.objects.select_related('region').order_by('region_id')
+    serializer_class = RegionStatsSerializer
+    pagination_class = None
+    filter_backends = []
+    validator_fields = ('updated_at', 'region__updated_at')
+
+    @extend_schema(tags=["Region"], summary="Regionlar bo'yicha hotel/travel/restaurant soni, narx va views")
+    def get(self, request, *args, **kwargs):
+        return super().get(request, *args, **kwargs)
 
 
 class RegionCreateView(CreateAPIView):
@@ -221,6 +241,8 @@ class HotelCommentCreateView(CreateAPIView):
     serializer_class = HotelCommentSerializer
     permission_classes = [AllowAny]
     parser_classes = (MultiPartParser, FormParser)
+    throttle_classes = WRITE_THROTTLES
+    throttle_scope = 'comment'
 
     @extend_schema(tags=["Hotels"], summary="Create hotel comment")
     def post(self, request, *args, **kwargs):
@@ -238,7 +260,7 @@ class HotelCommentListView(ListAPIView):
 
     def get_queryset(self):
         hotel_id = self.kwargs['pk']
-        return HotelComment.objects.filter(hotel_id=hotel_id).order_by('-created_at')
+        return HotelComment.objects.filter(hotel_id=hotel_id).order_by('-created_at', '-id')
 
 
     @extend_schema(tags=["Hotels"], summary="List hotel comment")
@@ -246,7 +268,50 @@ class HotelCommentListView(ListAPIView):
         return self.list(request, *args, **kwargs)
 
 
+class HotelListAsyncView(AsyncListView):
+    read_serializer_class = HotelReadSerializer
+    filterset_class = HotelFilter
+
+    async def get(self, request, *args, **kwargs):
+        # sinxron HotelListAPIView kabi: ?lang region nomi tilini ham belgilaydi
+        lang = request.GET.get('lang')
+        if lang in ['uz', 'ru', 'en']:
+            with translation.override(lang):
+                return await super().get(request, *args, **kwargs)
+        return await super().get(request, *args, **kwargs)
+
+
+class HotelDetailAsyncView(AsyncDetailView):
+    read_serializer_class = HotelReadSerializer
+    not_found_message = "Bunday Hotel topilmadi."
+
+
+class RegionsListAsyncView(AsyncListView):
+    read_serializer_class = RegionReadSerializer
+    ordering = ()
+    paginate = False
+
+
+class HotelCommentListAsyncView(AsyncListView):
+    read_serializer_class = HotelCommentReadSerializer
+
+    def get_queryset(self):
+        return HotelComment.objects.filter(hotel_id=self.kwargs['pk'])
+
+
+class HotelTrendingView(TrendingListView):
+    serializer_class = HotelSerializer
+    kind = TrendingScore.KIND_HOTEL
+
+    @extend_schema(tags=["Hotels"], summary="Trending hotellar (ko'rishlar va commentlar bo'yicha)", parameters=TRENDING_PARAMETERS)
+    def get(self, request, *args, **kwargs):
+        return super().get(request, *args, **kwargs)
+
 
+hotels_async_view = HotelListAsyncView.as_view()
+hotel_detail_async_view = HotelDetailAsyncView.as_view()
+regions_async_view = RegionsListAsyncView.as_view()
+hotel_comment_list_async_view = HotelCommentListAsyncView.as_view()
 hotel_comment_list_view = HotelCommentListView.as_view()
 hotel_comment_create_view = HotelCommentCreateView.as_view()
 hotel_delete_view = HotelDeleteView.as_view()
@@ -255,6 +320,8 @@ hotel_detail_view = HotelDetailView.as_view()
 hotels_views = HotelListAPIView.as_view()
 hotel_update_view = HotelUpdateView.as_view()
 regions_views = RegionsListView.as_view()
+regions_stats_view = RegionStatsView.as_view()
 regions_create_view = RegionCreateView.as_view()
 regions_update_view = RegionUpdateView.as_view()
 regions_delete_view = RegionDeleteView.as_view()
+hotel_trending_view = HotelTrendingView.as_view()
@@ -7,3 +7,12 @@ class HotelsConfig(AppConfig):
 
     def ready(self):
         import apps.hotels.translation
+        from travelsuz_back import cards, region_stats
+        from travelsuz_back.conditional import track_images
+        from travelsuz_back.response_cache import invalidate_on_change
+        from .models import Regions, Hotel, HotelImage, HotelCard
+
+        invalidate_on_change(Regions, Hotel, HotelImage)
+        cards.register(Hotel, HotelCard)
+        region_stats.register(Hotel, 'hotel_count')
+        track_images(HotelImage)
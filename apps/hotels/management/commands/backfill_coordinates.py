@@ -0,0 +1,27 @@
+from django.core.management.base import BaseCommand
+
+from apps.hotels.models import Hotel
+from apps.restaurants.models import Restaurant
+from apps.travels.models import Travel
+from travelsuz_back.geo import coordinates_from_location
+
+
+class Command(BaseCommand):
+    help = "Mavjud yozuvlar uchun location JSON dan latitude/longitude ustunlarini to'ldirish"
+
+    def add_arguments(self, parser):
+        parser.add_argument('--batch-size', type=int, default=500)
+
+    def handle(self, *args, **options):
+        batch_size = options['batch_size']
+        for model in (Hotel, Travel, Restaurant):
+            batch, updated = [], 0
+            for obj in model.objects.only('id', 'location', 'latitude', 'longitude').iterator(chunk_size=batch_size):
+                obj.latitude, obj.longitude = coordinates_from_location(obj.location)
+                batch.append(obj)
+                if len(batch) >= batch_size:
+                    updated += model.objects.bulk_update(batch, ['latitude', 'longitude'])
+                    batch = []
+            if batch:
+                updated += model.objects.bulk_update(batch, ['latitude', 'longitude'])
+            self.stdout.write(self.style.SUCCESS(f"{model.__name__}: {updated} ta yozuv yangilandi"))
@@ -0,0 +1,83 @@
+import asyncio
+import time
+from urllib.parse import urlsplit
+
+from django.core.management.base import BaseCommand
+
+# Oddiy HTTP/1.1 keep-alive yuk generatori (qo'shimcha kutubxonasiz).
+# docs/asgi_benchmark.md dagi ASGI va WSGI taqqoslashi shu buyruq bilan o'lchangan.
+
+
+async def _worker(host, port, request, deadline, stats):
+    reader = writer = None
+    while time.perf_counter() < deadline:
+        started = time.perf_counter()
+        try:
+            if writer is None:
+                reader, writer = await asyncio.open_connection(host, port)
+            writer.write(request)
+            await writer.drain()
+            status_line = await reader.readline()
+            length, close = 0, False
+            while True:
+                line = await reader.readline()
+                if line in (b'\r\n', b''):
+                    break
+                name, _, value = line.decode('latin-1').partition(':')
+                if name.lower() == 'content-length':
+                    length = int(value)
+                elif name.lower() == 'connection' and value.strip().lower() == 'close':
+                    close = True
+            await reader.readexactly(length)
+            ok = status_line.split(b' ')[1].startswith(b'2')
+        except (ConnectionError, asyncio.IncompleteReadError, IndexError):
+            stats['errors'] += 1
+            close = True
+        else:
+            stats['latencies'].append(time.perf_counter() - started)
+            if not ok:
+                stats['errors'] += 1
+        if close and writer is not None:
+            # gunicorn sync worker keep-alive qilmaydi: har so'rovdan keyin qayta ulanamiz
+            writer.close()
+            writer = None
+    if writer is not None:
+        writer.close()
+
+
+class Command(BaseCommand):
+    help = "Endpointga parallel ulanishlar bilan yuk berib, RPS va kechikishni o'lchash"
+
+    def add_arguments(self, parser):
+        parser.add_argument('url')
+        parser.add_argument('--connections', type=int, default=50)
+        parser.add_argument('--duration', type=float, default=10.0, help="sekund")
+
+    def handle(self, *args, **options):
+        url = urlsplit(options['url'])
+        path = url.path + (f'?{url.query}' if url.query else '')
+        request = (f"GET {path} HTTP/1.1\r\nHost: {url.netloc}\r\n"
+                   f"Accept: application/json\r\nConnection: keep-alive\r\n\r\n").encode()
+        stats = {'latencies': [], 'errors': 0}
+
+        async def run():
+            deadline = time.perf_counter() + options['duration']
+            await asyncio.gather(*(
+                _worker(url.hostname, url.port or 80, request, deadline, stats)
+                for _ in range(options['connections'])
+            ))
+
+        started = time.perf_counter()
+        asyncio.run(run())
+        elapsed = time.perf_counter() - started
+
+        latencies = sorted(stats['latencies'])
+        if not latencies:
+            self.stderr.write("Hech qanday javob olinmadi")
+            return
+        p50 = latencies[len(latencies) // 2] * 1000
+        p99 = latencies[min(len(latencies) - 1, int(len(latencies) * 0.99))] * 1000
+        self.stdout.write(
+            f"{len(latencies)} so'rov, {elapsed:.1f}s, {len(latencies) / elapsed:.0f} req/s, "
+            f"p50 {p50:.1f} ms, p99 {p99:.1f} ms, xatolar: {stats['errors']}"
+        )
@@ -0,0 +1,40 @@
+import sys
+
+from django.core.management.base import BaseCommand, CommandError
+from django.utils import timezone
+from rest_framework.exceptions import ValidationError
+
+from travelsuz_back import export
+
+
+class Command(BaseCommand):
+    help = "Katalogni (regions, hotels, travels, restaurants) NDJSON yoki CSV ga eksport qilish"
+
+    def add_arguments(self, parser):
+        parser.add_argument('--type', default='', help="regions,hotels,travels,restaurants (default: hammasi)")
+        parser.add_argument('--format', choices=export.FORMATS, default='ndjson')
+        parser.add_argument('--since', default='', help="Faqat shu vaqtdan keyin o'zgarganlar (ISO 8601)")
+        parser.add_argument('--output', default='-', help="Fayl yo'li (default: stdout)")
+        parser.add_argument('--chunk-size', type=int, default=export.DEFAULT_CHUNK_SIZE)
+
+    def handle(self, *args, **options):
+        try:
+            kinds = export.parse_kinds(options['type'])
+            since = export.parse_since(options['since'])
+            started_at = timezone.now()
+            lines = export.export_lines(options['format'], kinds, since, options['chunk_size'])
+        except ValidationError as exc:
+            raise CommandError(exc.detail)
+
+        if options['output'] == '-':
+            out = sys.stdout.buffer
+            self._write(out, lines)
+        else:
+            with open(options['output'], 'wb') as out:
+                self._write(out, lines)
+        self.stderr.write(f"Eksport tugadi. Keyingi incremental eksport uchun: --since {started_at.isoformat()}")
+
+    def _write(self, out, lines):
+        for line in lines:
+            out.write(line)
+        out.flush()
@@ -0,0 +1,21 @@
+import time
+
+from django.core.management.base import BaseCommand
+
+from travelsuz_back import view_counter
+
+
+class Command(BaseCommand):
+    help = "Yig'ilgan ko'rishlar (views) sonini bazaga yozish"
+
+    def add_arguments(self, parser):
+        parser.add_argument('--interval', type=float, default=0,
+                            help="Sekund; 0 bo'lsa bir marta yozib to'xtaydi (cron uchun)")
+
+    def handle(self, *args, **options):
+        while True:
+            updated = view_counter.flush()
+            self.stdout.write(self.style.SUCCESS(f"{updated} ta yozuvning views qiymati yangilandi"))
+            if not options['interval']:
+                break
+            time.sleep(options['interval'])
@@ -0,0 +1,31 @@
+from django.core.management.base import BaseCommand
+
+from apps.hotels.models import HotelImage
+from apps.restaurants.models import RestaurantImage
+from apps.travels.models import TravelImage
+from travelsuz_back.images import generate_variants, delete_variants
+
+
+class Command(BaseCommand):
+    help = "Mavjud rasmlar uchun thumbnail (WebP/JPEG) nusxalarini yaratish"
+
+    def add_arguments(self, parser):
+        parser.add_argument('--force', action='store_true',
+                            help="Nusxasi bor rasmlar uchun ham qaytadan yaratish")
+
+    def handle(self, *args, **options):
+        for model in (HotelImage, TravelImage, RestaurantImage):
+            done = failed = 0
+            for obj in model.objects.only('id', 'image', 'variants').iterator(chunk_size=200):
+                if obj.variants and not options['force']:
+                    continue
+                try:
+                    variants = generate_variants(obj.image)
+                except OSError as exc:
+                    failed += 1
+                    self.stderr.write(f"{model.__name__} #{obj.pk}: {exc}")
+                    continue
+                delete_variants(obj.image.storage, obj.variants)
+                model.objects.filter(pk=obj.pk).update(variants=variants)
+                done += 1
+            self.stdout.write(self.style.SUCCESS(f"{model.__name__}: {done} ta tayyor, {failed} ta xato"))
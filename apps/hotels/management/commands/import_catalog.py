@@ -0,0 +1,31 @@
+import json
+
+from django.core.management.base import BaseCommand, CommandError
+
+from travelsuz_back import importer
+
+
+class Command(BaseCommand):
+    help = "Hotels, travels va restaurants ni NDJSON yoki CSV fayldan ommaviy yuklash"
+
+    def add_arguments(self, parser):
+        parser.add_argument('path', help=".ndjson/.jsonl yoki .csv fayl")
+        parser.add_argument('--type', choices=list(importer.IMPORT_SERIALIZERS),
+                            help="CSV uchun majburiy; NDJSON da qatordagi \"type\" ishlatiladi")
+        parser.add_argument('--format', choices=('ndjson', 'csv'), help="Default: fayl kengaytmasidan")
+        parser.add_argument('--batch-size', type=int, default=importer.DEFAULT_BATCH_SIZE)
+
+    def handle(self, *args, **options):
+        fmt = options['format'] or importer.detect_format(options['path'])
+        if fmt is None:
+            raise CommandError("Formatni aniqlab bo'lmadi, --format ni kiriting")
+        if fmt == 'csv' and not options['type']:
+            raise CommandError("CSV uchun --type ni kiriting")
+
+        with open(options['path'], encoding='utf-8-sig', newline='') as stream:
+            result = importer.import_catalog(stream, fmt, options['type'], options['batch_size'])
+
+        for error in result['errors']:
+            self.stderr.write(f"{error['line']}-qator ({error['type']}): {json.dumps(error['errors'], ensure_ascii=False)}")
+        created = ', '.join(f"{kind}: {count}" for kind, count in result['created'].items())
+        self.stdout.write(self.style.SUCCESS(f"Yaratildi — {created}. Xatolar: {len(result['errors'])}"))
@@ -0,0 +1,81 @@
+import os
+import time
+from concurrent.futures import ProcessPoolExecutor, as_completed
+
+import django
+from django.core.management.base import BaseCommand
+from django.db import connections
+
+from travelsuz_back import image_queue
+from travelsuz_back.images import process_upload
+
+
+def _init_worker():
+    django.setup()
+
+
+class Command(BaseCommand):
+    help = "Navbatdagi (pending) rasmlarni background jarayonlarda qayta ishlash"
+
+    def add_arguments(self, parser):
+        parser.add_argument('--workers', type=int, default=os.cpu_count() or 2,
+                            help="Jarayonlar soni, 0 bo'lsa shu jarayonning o'zida ishlaydi")
+        parser.add_argument('--batch-size', type=int, default=20)
+        parser.add_argument('--poll-interval', type=float, default=2.0)
+        parser.add_argument('--once', action='store_true', help="Navbat bo'shagach to'xtash")
+
+    def handle(self, *args, **options):
+        reset = image_queue.reset_stale()
+        if reset:
+            self.stdout.write(f"{reset} ta to'xtab qolgan rasm navbatga qaytarildi")
+
+        workers = options['workers']
+        pool = None
+        if workers > 0:
+            # fork qilinganda bola jarayonlar ota jarayonning DB ulanishini ishlatmasligi kerak
+            connections.close_all()
+            pool = ProcessPoolExecutor(max_workers=workers, initializer=_init_worker)
+
+        processed = 0
+        try:
+            while True:
+                jobs = image_queue.claim(options['batch_size'])
+                if not jobs:
+                    if options['once']:
+                        break
+                    # boshqa (yiqilgan) worker ning muddati o'tgan rasmlari
+                    image_queue.reset_stale()
+                    time.sleep(options['poll_interval'])
+                    continue
+                processed += self.run_batch(pool, jobs)
+        finally:
+            if pool is not None:
+                pool.shutdown()
+
+        self.stdout.write(self.style.SUCCESS(f"{processed} ta rasm qayta ishlandi"))
+
+    def run_batch(self, pool, jobs):
+        done = 0
+        if pool is None:
+            for model, pk, name, claimed_at in jobs:
+                try:
+                    result = process_upload(name)
+                except Exception as exc:
+                    image_queue.fail(model, pk, exc, claimed_at)
+                    continue
+                image_queue.complete(model, pk, result, claimed_at)
+                done += 1
+            return done
+
+        futures = {pool.submit(process_upload, name): (model, pk, claimed_at)
+                   for model, pk, name, claimed_at in jobs}
+        for future in as_completed(futures):
+            model, pk, claimed_at = futures[future]
+            try:
+                result = future.result()
+            except Exception as exc:
+                image_queue.fail(model, pk, exc, claimed_at)
+                continue
+            image_queue.complete(model, pk, result, claimed_at)
+            done += 1
+        return done
@@ -0,0 +1,11 @@
+from django.core.management.base import BaseCommand
+
+from travelsuz_back import region_stats
+
+
+class Command(BaseCommand):
+    help = "RegionStats jadvalini barcha regionlar uchun qayta hisoblash (deploy dan keyin yoki tekshiruv uchun)"
+
+    def handle(self, *args, **options):
+        total = region_stats.refresh()
+        self.stdout.write(self.style.SUCCESS(f"Region statistikasi yangilandi: {total} ta region"))
@@ -0,0 +1,48 @@
+import os
+from datetime import timedelta
+
+from django.core.files.storage import default_storage
+from django.core.management.base import BaseCommand
+from django.utils import timezone
+
+from travelsuz_back import image_queue
+
+
+class Command(BaseCommand):
+    help = "Hech qaysi rasm yozuviga tegishli bo'lmagan (o'chirilgan) fayllarni tozalash"
+
+    def add_arguments(self, parser):
+        parser.add_argument('--grace-minutes', type=int, default=60,
+                            help="Bundan yangi fayllarga tegilmaydi (yuklanayotgan bo'lishi mumkin)")
+        parser.add_argument('--dry-run', action='store_true')
+
+    def walk(self, directory):
+        if not default_storage.exists(directory):
+            return
+        dirs, files = default_storage.listdir(directory)
+        for name in files:
+            yield os.path.join(directory, name)
+        for name in dirs:
+            yield from self.walk(os.path.join(directory, name))
+
+    def handle(self, *args, **options):
+        cutoff = timezone.now() - timedelta(minutes=options['grace_minutes'])
+        referenced, directories = set(), set()
+        for model in image_queue.image_models():
+            directories.add(str(model._meta.get_field('image').upload_to).strip('/'))
+            for image, variants in model.objects.values_list('image', 'variants').iterator(chunk_size=1000):
+                referenced.add(image)
+                for formats in (variants or {}).values():
+                    referenced.update(formats.values())
+
+        removed = 0
+        for directory in sorted(directories):
+            for name in self.walk(directory):
+                if name in referenced or default_storage.get_modified_time(name) > cutoff:
+                    continue
+                if not options['dry_run']:
+                    default_storage.delete(name)
+                removed += 1
+
+        action = "topildi" if options['dry_run'] else "o'chirildi"
+        self.stdout.write(self.style.SUCCESS(f"{removed} ta ortiqcha fayl {action}"))
@@ -0,0 +1,70 @@
+# Generated by Django 5.2.3 on 2026-10-18 10:43
+
+import django.db.models.deletion
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    initial = True
+
+    dependencies = [
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='Hotel',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('title', models.CharField(max_length=100)),
+                ('title_uz', models.CharField(max_length=100, null=True)),
+                ('title_ru', models.CharField(max_length=100, null=True)),
+                ('title_en', models.CharField(max_length=100, null=True)),
+                ('description', models.TextField()),
+                ('description_uz', models.TextField(null=True)),
+                ('description_ru', models.TextField(null=True)),
+                ('description_en', models.TextField(null=True)),
+                ('address', models.CharField(max_length=100)),
+                ('address_uz', models.CharField(max_length=100, null=True)),
+                ('address_ru', models.CharField(max_length=100, null=True)),
+                ('address_en', models.CharField(max_length=100, null=True)),
+                ('phone_number', models.CharField(blank=True, max_length=20, null=True)),
+                ('price', models.DecimalField(decimal_places=2, max_digits=10)),
+                ('location', models.JSONField(blank=True, null=True)),
+                ('created_at', models.DateTimeField(auto_now_add=True)),
+                ('views', models.PositiveIntegerField(default=0)),
+            ],
+        ),
+        migrations.CreateModel(
+            name='Regions',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('name', models.CharField(max_length=100)),
+                ('name_uz', models.CharField(max_length=100, null=True)),
+                ('name_ru', models.CharField(max_length=100, null=True)),
+                ('name_en', models.CharField(max_length=100, null=True)),
+            ],
+        ),
+        migrations.CreateModel(
+            name='HotelComment',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('text', models.TextField()),
+                ('created_at', models.DateTimeField(auto_now_add=True)),
+                ('hotel', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='comments', to='hotels.hotel')),
+            ],
+        ),
+        migrations.CreateModel(
+            name='HotelImage',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('image', models.ImageField(upload_to='hotel_images')),
+                ('hotel', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='images', to='hotels.hotel')),
+            ],
+        ),
+        migrations.AddField(
+            model_name='hotel',
+            name='region',
+            field=models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, to='hotels.regions'),
+        ),
+    ]
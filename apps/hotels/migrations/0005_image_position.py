@@ -0,0 +1,22 @@
+# Generated by Django 5.2.3 on 2026-10-18 10:43
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('hotels', '0004_image_status'),
+    ]
+
+    operations = [
+        migrations.AlterModelOptions(
+            name='hotelimage',
+            options={'ordering': ['position', 'id']},
+        ),
+        migrations.AddField(
+            model_name='hotelimage',
+            name='position',
+            field=models.PositiveIntegerField(default=0),
+        ),
+    ]
@@ -0,0 +1,29 @@
+# Generated by Django 5.2.3 on 2026-10-18 10:43
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('hotels', '0007_cards'),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='hotel',
+            index=models.Index(fields=['region', 'created_at', 'id'], name='hotel_region_created_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='hotel',
+            index=models.Index(fields=['created_at', 'id'], name='hotel_created_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='hotel',
+            index=models.Index(fields=['views'], name='hotel_views_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='hotelcomment',
+            index=models.Index(fields=['hotel', 'created_at', 'id'], name='hotel_comment_created_idx'),
+        ),
+    ]
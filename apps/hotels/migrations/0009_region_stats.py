@@ -0,0 +1,27 @@
+# Generated by Django 5.2.3 on 2026-10-18 10:43
+
+import django.db.models.deletion
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('hotels', '0008_catalog_indexes'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='RegionStats',
+            fields=[
+                ('region', models.OneToOneField(on_delete=django.db.models.deletion.CASCADE, primary_key=True, related_name='stats', serialize=False, to='hotels.regions')),
+                ('hotel_count', models.PositiveIntegerField(default=0)),
+                ('travel_count', models.PositiveIntegerField(default=0)),
+                ('restaurant_count', models.PositiveIntegerField(default=0)),
+                ('hotel_min_price', models.DecimalField(blank=True, decimal_places=2, max_digits=10, null=True)),
+                ('hotel_avg_price', models.DecimalField(blank=True, decimal_places=2, max_digits=12, null=True)),
+                ('total_views', models.PositiveBigIntegerField(default=0)),
+                ('updated_at', models.DateTimeField(auto_now=True)),
+            ],
+        ),
+    ]
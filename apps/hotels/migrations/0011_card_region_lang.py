@@ -0,0 +1,31 @@
+from django.db import migrations, models
+
+
+def copy_lang(apps, schema_editor):
+    # mavjud card lar region nomini ham lang tilida saqlagan
+    apps.get_model('hotels', 'HotelCard').objects.update(region_lang=models.F('lang'))
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('hotels', '0010_image_claimed_at'),
+    ]
+
+    operations = [
+        migrations.RemoveConstraint(
+            model_name='hotelcard',
+            name='unique_hotel_card_lang',
+        ),
+        migrations.AddField(
+            model_name='hotelcard',
+            name='region_lang',
+            field=models.CharField(default='uz', max_length=5),
+            preserve_default=False,
+        ),
+        migrations.RunPython(copy_lang, migrations.RunPython.noop),
+        migrations.AddConstraint(
+            model_name='hotelcard',
+            constraint=models.UniqueConstraint(fields=('hotel', 'lang', 'region_lang'), name='unique_hotel_card_lang'),
+        ),
+    ]
@@ -0,0 +1,20 @@
+# Generated by Django 5.2.3 on 2026-10-18 10:54
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('hotels', '0011_card_region_lang'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='AppliedViewSpool',
+            fields=[
+                ('name', models.CharField(max_length=64, primary_key=True, serialize=False)),
+                ('applied_at', models.DateTimeField(auto_now_add=True, db_index=True)),
+            ],
+        ),
+    ]
@@ -1,17 +1,112 @@
+from django.conf import settings
 from django.contrib.auth import get_user_model
 from django.db import models
 
+from travelsuz_back.geo import coordinates_from_location
+from travelsuz_back import image_queue
+
 
 Users = get_user_model()
 
 
+class CatalogQuerySet(models.QuerySet):
+    def with_related(self):
+        return self.select_related('region').prefetch_related('images')
+
+
+class GeoIndexedModel(models.Model):
+    # location JSON dan saqlash paytida to'ldiriladi, near/bbox filterlar shu ustunlardan foydalanadi
+    latitude = models.FloatField(null=True, blank=True, db_index=True, editable=False)
+    longitude = models.FloatField(null=True, blank=True, db_index=True, editable=False)
+
+    class Meta:
+        abstract = True
+
+    def save(self, *args, **kwargs):
+        self.latitude, self.longitude = coordinates_from_location(self.location)
+        update_fields = kwargs.get('update_fields')
+        if update_fields is not None and 'location' in update_fields:
+            kwargs['update_fields'] = {*update_fields, 'latitude', 'longitude'}
+        super().save(*args, **kwargs)
+
+
+class ResponsiveImageModel(models.Model):
+    STATUS_PENDING = 'pending'
+    STATUS_PROCESSING = 'processing'
+    STATUS_READY = 'ready'
+    STATUS_FAILED = 'failed'
+    STATUS_CHOICES = (
+        (STATUS_PENDING, 'Pending'),
+        (STATUS_PROCESSING, 'Processing'),
+        (STATUS_READY, 'Ready'),
+        (STATUS_FAILED, 'Failed'),
+    )
+
+    # yangi rasmlar `manage.py process_images` tomonidan qayta ishlanadi (travelsuz_back/image_queue.py)
+    status = models.CharField(max_length=20, choices=STATUS_CHOICES, default=STATUS_PENDING,
+                              db_index=True, editable=False)
+    # "processing" ga o'tgan payt: shundan IMAGE_PROCESSING_CLAIM_TIMEOUT o'tgan rasmlargina navbatga qaytadi
+    claimed_at = models.DateTimeField(null=True, blank=True, editable=False)
+    # kichik o'lchamdagi WebP/JPEG nusxalar, travelsuz_back/images.py ga qarang
+    variants = models.JSONField(default=dict, blank=True, editable=False)
+    position = models.PositiveIntegerField(default=0)
+
+    class Meta:
+        abstract = True
+        ordering = ['position', 'id']
+
+    @classmethod
+    def parent_field(cls):
+        return next(f for f in cls._meta.fields if f.is_relation and f.remote_field.related_name == 'images')
+
+    def save(self, *args, **kwargs):
+        super().save(*args, **kwargs)
+        if settings.IMAGE_PROCESSING_EAGER and self.status == self.STATUS_PENDING:
+            image_queue.process_now(self)
+
+
+class CatalogCard(models.Model):
+    # ro'yxat endpointlari uchun tayyor JSON (har bir til juftligi uchun alohida), travelsuz_back/cards.py
+    lang = models.CharField(max_length=5)
+    region_lang = models.CharField(max_length=5)
+    payload = models.TextField()
+    updated_at = models.DateTimeField(auto_now=True)
+
+    class Meta:
+        abstract = True
+
+
 class Regions(models.Model):
     name = models.CharField(max_length=100)
+    updated_at = models.DateTimeField(auto_now=True)
+
+    def __str__(self):
+        return self.name
+
+
+class RegionStats(models.Model):
+    # travelsuz_back/region_stats.py yozuvlar o'zgarganda shu jadvalni region bo'yicha yangilaydi
+    region = models.OneToOneField(Regions, on_delete=models.CASCADE, primary_key=True, related_name='stats')
+    hotel_count = models.PositiveIntegerField(default=0)
+    travel_count = models.PositiveIntegerField(default=0)
+    restaurant_count = models.PositiveIntegerField(default=0)
+    hotel_min_price = models.DecimalField(max_digits=10, decimal_places=2, null=True, blank=True)
+    hotel_avg_price = models.DecimalField(max_digits=12, decimal_places=2, null=True, blank=True)
+    total_views = models.PositiveBigIntegerField(default=0)
+    updated_at = models.DateTimeField(auto_now=True)
+
+    def __str__(self):
+        return f"{self.region_id} statistikasi"
+
+class AppliedViewSpool(models.Model):
+    # travelsuz_back/view_counter.py: bazaga qo'shilgan spool fayllar, bitta fayl ikki marta qo'shilmasin
+    name = models.CharField(max_length=64, primary_key=True)
+    applied_at = models.DateTimeField(auto_now_add=True, db_index=True)
 
     def __str__(self):
         return self.name
 
-class Hotel(models.Model):
+class Hotel(GeoIndexedModel):
     title = models.CharField(max_length=100)
     description = models.TextField()
     address = models.CharField(max_length=100)
@@ -20,23 +115,45 @@ class Hotel(models.Model):
     region = models.ForeignKey(Regions, on_delete=models.CASCADE)
     location = models.JSONField(null=True, blank=True)
     created_at = models.DateTimeField(auto_now_add=True)
+    updated_at = models.DateTimeField(auto_now=True)
     views = models.PositiveIntegerField(default=0)
 
+    objects = CatalogQuerySet.as_manager()
+
+    class Meta:
+        # ro'yxat: region bo'yicha filter + (-created_at, -id) tartib, mashhurlik bo'yicha tartib: views
+        indexes = [
+            models.Index(fields=['region', 'created_at', 'id'], name='hotel_region_created_idx'),
+            models.Index(fields=['created_at', 'id'], name='hotel_created_idx'),
+            models.Index(fields=['views'], name='hotel_views_idx'),
+        ]
 
     def __str__(self):
         return self.title
 
-class HotelImage(models.Model):
+class HotelImage(ResponsiveImageModel):
     hotel = models.ForeignKey(Hotel, on_delete=models.CASCADE , related_name='images')
     image = models.ImageField(upload_to='hotel_images')
 
     def __str__(self):
         return f"{self.hotel.title} - {self.image.name}"
 
+class HotelCard(CatalogCard):
+    hotel = models.ForeignKey(Hotel, on_delete=models.CASCADE, related_name='cards')
+
+    class Meta:
+        constraints = [models.UniqueConstraint(fields=['hotel', 'lang', 'region_lang'],
+                                               name='unique_hotel_card_lang')]
+
+
 class HotelComment(models.Model):
     hotel = models.ForeignKey('Hotel', on_delete=models.CASCADE, related_name='comments')
     text = models.TextField()
     created_at = models.DateTimeField(auto_now_add=True)
 
+    class Meta:
+        # comment ro'yxati: hotel_id bo'yicha filter, (-created_at, -id) tartib
+        indexes = [models.Index(fields=['hotel', 'created_at', 'id'], name='hotel_comment_created_idx')]
+
     def __str__(self):
         return f"{self.hotel.title_uz} - {self.text}"
\ No newline at end of file
@@ -1,3 +1,917 @@
-from django.test import TestCase
+import json
+import os
+import tempfile
+import time
+from unittest import mock
+from io import BytesIO
 
-# Create your tests here.
+from PIL import Image
+from asgiref.sync import sync_to_async
+from django.conf import settings
+from django.core.files.storage import default_storage
+from django.core.files.uploadedfile import SimpleUploadedFile
+from django.contrib.auth import get_user_model
+from django.core.cache import cache
+from django.core.management import call_command
+from django.test import TestCase, override_settings
+from django.urls import reverse
+from django.utils import timezone, translation
+from rest_framework.renderers import JSONRenderer
+from rest_framework.test import APIClient
+
+from apps.hotels.api.v0.serializers import HotelSerializer, HotelReadSerializer
+from apps.hotels.models import Regions, RegionStats, Hotel, HotelImage, HotelCard, HotelComment
+from apps.search.models import SearchIndex
+from travelsuz_back import view_counter
+from travelsuz_back.images import process_upload
+
+
+class HotelListQueryCountTest(TestCase):
+    @classmethod
+    def setUpTestData(cls):
+        cls.region = Regions.objects.create(name_uz="Samarqand", name_ru="Самарканд", name_en="Samarkand")
+
+    def create_hotels(self, count):
+        for i in range(count):
+            hotel = Hotel.objects.create(
+                title_uz=f"Hotel {i}", description_uz="Tavsif", address_uz="Manzil",
+                price="150000", region=self.region,
+                location={"latitude": 39.65, "longitude": 66.97},
+            )
+            HotelImage.objects.create(hotel=hotel, image=f"hotel_images/{i}_a.jpg")
+            HotelImage.objects.create(hotel=hotel, image=f"hotel_images/{i}_b.jpg")
+
+    def test_list_query_count_does_not_grow_with_rows(self):
+        url = reverse('hotels_api:hotels_views')
+
+        self.create_hotels(2)
+        with self.assertNumQueries(5):
+            response = self.client.get(url)
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(len(response.json()['results']), 2)
+
+        self.create_hotels(8)
+        with self.assertNumQueries(5):
+            response = self.client.get(url)
+        self.assertEqual(len(response.json()['results']), 10)
+        self.assertEqual(len(response.json()['results'][0]['images']), 2)
+
+    def test_detail_returns_images(self):
+        self.create_hotels(1)
+        hotel = Hotel.objects.get()
+        url = reverse('hotels_api:hotel_detail_view', kwargs={'pk': hotel.pk})
+        response = self.client.get(url)
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(len(response.json()['images']), 2)
+
+
+class HotelListPaginationTest(TestCase):
+    @classmethod
+    def setUpTestData(cls):
+        region = Regions.objects.create(name_uz="Toshkent")
+        for i in range(5):
+            Hotel.objects.create(title_uz=f"Hotel {i}", description_uz="Tavsif", address_uz="Manzil",
+                                 price="100000", region=region)
+
+    def test_cursor_pages_cover_all_rows_once(self):
+        url = reverse('hotels_api:hotels_views')
+        response = self.client.get(url, {'page_size': 2})
+        ids = [item['id'] for item in response.json()['results']]
+        next_url = response.json()['next']
+        while next_url:
+            response = self.client.get(next_url)
+            ids += [item['id'] for item in response.json()['results']]
+            next_url = response.json()['next']
+
+        expected = list(Hotel.objects.order_by('-created_at', '-id').values_list('id', flat=True))
+        self.assertEqual(ids, expected)
+
+    def test_offset_pagination_is_opt_in(self):
+        url = reverse('hotels_api:hotels_views')
+        response = self.client.get(url, {'offset': 2, 'limit': 2})
+        self.assertEqual(response.json()['count'], 5)
+        self.assertEqual(len(response.json()['results']), 2)
+
+
+class HotelViewCounterTest(TestCase):
+    @classmethod
+    def setUpTestData(cls):
+        region = Regions.objects.create(name_uz="Toshkent")
+        cls.hotel = Hotel.objects.create(title_uz="Hotel", description_uz="Tavsif", address_uz="Manzil",
+                                         price="100000", region=region)
+
+    def setUp(self):
+        spool_dir = tempfile.TemporaryDirectory()
+        self.addCleanup(spool_dir.cleanup)
+        settings_override = override_settings(VIEW_COUNTER_SPOOL_DIR=spool_dir.name,
+                                              VIEW_COUNTER_FLUSH_INTERVAL=3600)
+        settings_override.enable()
+        self.addCleanup(settings_override.disable)
+        view_counter._pending.clear()
+
+    def test_detail_get_is_read_only_until_flush(self):
+        url = reverse('hotels_api:hotel_detail_view', kwargs={'pk': self.hotel.pk})
+        for _ in range(3):
+            self.assertEqual(self.client.get(url).status_code, 200)
+
+        self.hotel.refresh_from_db()
+        self.assertEqual(self.hotel.views, 0)
+        etag = self.client.get(url)['ETag']
+
+        call_command('flush_views', stdout=open(os.devnull, 'w'))
+        self.hotel.refresh_from_db()
+        self.assertEqual(self.hotel.views, 4)
+        # views o'zgardi: eski ETag bilan 304 emas, yangi qiymat qaytadi
+        cache.clear()
+        response = self.client.get(url, headers={'If-None-Match': etag})
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(response.json()['views'], 4)
+
+    def test_failed_and_stale_claims_are_retried(self):
+        url = reverse('hotels_api:hotel_detail_view', kwargs={'pk': self.hotel.pk})
+        self.client.get(url)
+        with mock.patch.object(view_counter, '_apply', side_effect=RuntimeError):
+            with self.assertRaises(RuntimeError):
+                view_counter.flush()
+        self.assertEqual([name[-5:] for name in os.listdir(settings.VIEW_COUNTER_SPOOL_DIR)], ['.json'])
+
+        # flush o'rtasida yiqilgan jarayon: fayl ".claimed" holida qolib ketgan
+        name = os.listdir(settings.VIEW_COUNTER_SPOOL_DIR)[0]
+        path = os.path.join(settings.VIEW_COUNTER_SPOOL_DIR, name)
+        claimed_path = path.replace('.json', '.claimed')
+        os.rename(path, claimed_path)
+        self.assertEqual(view_counter.flush(), 0)
+        old = time.time() - settings.VIEW_COUNTER_CLAIM_TIMEOUT - 1
+        os.utime(claimed_path, (old, old))
+
+        self.assertEqual(view_counter.flush(), 1)
+        self.hotel.refresh_from_db()
+        self.assertEqual(self.hotel.views, 1)
+        self.assertEqual(os.listdir(settings.VIEW_COUNTER_SPOOL_DIR), [])
+
+    def test_reclaimed_spool_is_not_applied_twice(self):
+        url = reverse('hotels_api:hotel_detail_view', kwargs={'pk': self.hotel.pk})
+        self.client.get(url)
+        # commit bo'ldi, lekin jarayon fayllarni o'chirishdan oldin yiqildi
+        with mock.patch.object(view_counter.os, 'remove', side_effect=SystemExit):
+            with self.assertRaises(SystemExit):
+                view_counter.flush()
+        claimed_path = os.path.join(settings.VIEW_COUNTER_SPOOL_DIR, os.listdir(settings.VIEW_COUNTER_SPOOL_DIR)[0])
+        self.assertTrue(claimed_path.endswith('.claimed'))
+        old = time.time() - settings.VIEW_COUNTER_CLAIM_TIMEOUT - 1
+        os.utime(claimed_path, (old, old))
+
+        self.assertEqual(view_counter.flush(), 0)
+        self.hotel.refresh_from_db()
+        self.assertEqual(self.hotel.views, 1)
+        self.assertEqual(os.listdir(settings.VIEW_COUNTER_SPOOL_DIR), [])
+
+
+class HotelResponseCacheTest(TestCase):
+    @classmethod
+    def setUpTestData(cls):
+        cls.region = Regions.objects.create(name_uz="Navoiy")
+        cls.hotel = Hotel.objects.create(title_uz="Eski nom", description_uz="Tavsif", address_uz="Manzil",
+                                         price="100000", region=cls.region)
+
+    def setUp(self):
+        cache.clear()
+
+    def test_list_is_cached_per_language_and_invalidated_on_save(self):
+        url = reverse('hotels_api:hotels_views')
+        self.assertEqual(self.client.get(url)['X-Cache'], 'MISS')
+        with self.assertNumQueries(0):
+            response = self.client.get(url)
+        self.assertEqual(response['X-Cache'], 'HIT')
+
+        self.assertEqual(self.client.get(url, {'lang': 'ru'})['X-Cache'], 'MISS')
+
+        self.hotel.title_uz = "Yangi nom"
+        self.hotel.save()
+        response = self.client.get(url)
+        self.assertEqual(response['X-Cache'], 'MISS')
+        self.assertEqual(response.json()['results'][0]['title'], "Yangi nom")
+
+    def test_key_uses_negotiated_renderer_not_raw_accept(self):
+        from travelsuz_back import response_cache
+        url = reverse('hotels_api:hotels_views')
+        before = response_cache.get_stats()
+        self.assertEqual(self.client.get(url, HTTP_ACCEPT='application/json')['X-Cache'], 'MISS')
+        for accept in ('*/*', 'application/json, text/plain, */*', 'application/json;q=0.9'):
+            self.assertEqual(self.client.get(url, HTTP_ACCEPT=accept)['X-Cache'], 'HIT')
+        self.assertEqual(self.client.get(url, HTTP_ACCEPT='application/json; indent=2')['X-Cache'], 'MISS')
+
+        stats = response_cache.get_stats()
+        self.assertEqual((stats['hits'] - before['hits'], stats['misses'] - before['misses']), (3, 2))
+
+    def test_expired_worker_stats_are_dropped(self):
+        from travelsuz_back import response_cache
+        counters = response_cache.stats
+        before = response_cache.get_stats()
+        cache.set(counters._worker_key('dead'), {'hits': 5}, 60)
+        cache.set(counters.workers_key, cache.get(counters.workers_key) + ['dead'], 60)
+        self.assertEqual(response_cache.get_stats()['hits'], before['hits'] + 5)
+
+        cache.delete(counters._worker_key('dead'))  # TTL o'tdi
+        self.assertEqual(response_cache.get_stats()['hits'], before['hits'])
+        self.assertNotIn('dead', cache.get(counters.workers_key))
+
+
+class HotelCardTest(TestCase):
+    @classmethod
+    def setUpTestData(cls):
+        cls.region = Regions.objects.create(name_uz="Buxoro", name_ru="Бухара", name_en="Bukhara")
+        cls.hotel = Hotel.objects.create(title_uz="Mehmonxona", title_ru="Гостиница", description_uz="Tavsif",
+                                         address_uz="Manzil", price="100000", region=cls.region)
+        HotelImage.objects.create(hotel=cls.hotel, image="hotel_images/card.jpg")
+
+    def setUp(self):
+        cache.clear()
+
+    def test_cards_match_serializer_and_are_rebuilt_on_change(self):
+        url = reverse('hotels_api:hotels_views')
+        response = self.client.get(url, {'lang': 'ru'})
+        self.assertEqual(HotelCard.objects.filter(hotel=self.hotel).count(), 1)
+        with translation.override('ru'):
+            expected = HotelSerializer(Hotel.objects.with_related().get(), context={'lang': 'ru'}).data
+        self.assertEqual(response.json()['results'], [json.loads(JSONRenderer().render(expected))])
+        self.assertEqual(response.json()['results'][0]['region'], "Бухара")
+
+        cache.clear()
+        with self.assertNumQueries(2):
+            self.client.get(url, {'lang': 'ru'})
+
+        self.region.name_ru = "Бухоро"
+        self.region.save()
+        self.assertFalse(HotelCard.objects.exists())
+        self.assertEqual(self.client.get(url, {'lang': 'ru'}).json()['results'][0]['region'], "Бухоро")
+
+    def test_region_follows_accept_language_like_detail(self):
+        url = reverse('hotels_api:hotels_views')
+        detail_url = reverse('hotels_api:hotel_detail_view', kwargs={'pk': self.hotel.pk})
+        for accept in ('uz', 'ru', 'en'):
+            item = self.client.get(url, HTTP_ACCEPT_LANGUAGE=accept).json()['results'][0]
+            detail = self.client.get(detail_url, HTTP_ACCEPT_LANGUAGE=accept).json()
+            self.assertEqual((item['title'], item['region']), (detail['title'], detail['region']))
+        self.assertEqual(HotelCard.objects.filter(hotel=self.hotel, lang='uz').count(), 3)
+
+    def test_stream_returns_cards_as_one_array(self):
+        Hotel.objects.create(title_uz="Ikkinchi", description_uz="Tavsif", address_uz="Manzil",
+                             price="100000", region=self.region)
+        url = reverse('hotels_api:hotels_views')
+        # anonim mijoz butun jadvalni ololmaydi: odatiy sahifa qaytadi
+        anonymous = self.client.get(url, {'stream': 'true', 'lang': 'ru'})
+        self.assertFalse(anonymous.streaming)
+        self.assertIn('results', anonymous.json())
+
+        admin = APIClient()
+        admin.force_authenticate(get_user_model().objects.create_superuser(username='admin', password='p'))
+        response = admin.get(url, {'stream': 'true', 'lang': 'ru'})
+        self.assertTrue(response.streaming)
+        streamed = json.loads(b''.join(response.streaming_content))
+        self.assertEqual(streamed, self.client.get(url, {'lang': 'ru'}).json()['results'])
+        self.assertEqual(HotelCard.objects.count(), 2)
+
+
+class HotelReadSerializerParityTest(TestCase):
+    @classmethod
+    def setUpTestData(cls):
+        region = Regions.objects.create(name_uz="Toshkent", name_ru="Ташкент", name_en="Tashkent")
+        cls.hotel = Hotel.objects.create(title_uz="Mehmonxona", title_en="Hotel", description_uz="Tavsif",
+                                         address_uz="Manzil", price="123456.50", region=region,
+                                         location={"latitude": 41.31, "longitude": 69.24})
+        HotelImage.objects.create(hotel=cls.hotel, image="hotel_images/a.jpg",
+                                  variants={"320": {"webp": "hotel_images/a_320.webp", "jpeg": "hotel_images/a_320.jpg"}})
+
+    def test_matches_model_serializer_in_every_language(self):
+        for lang in ('uz', 'ru', 'en'):
+            with translation.override(lang):
+                expected = HotelSerializer(Hotel.objects.with_related(), many=True, context={'lang': lang}).data
+            self.assertEqual(HotelReadSerializer(lang).serialize(Hotel.objects.all()), expected)
+
+    def test_detail_is_served_by_read_serializer(self):
+        url = reverse('hotels_api:hotel_detail_view', kwargs={'pk': self.hotel.pk})
+        response = self.client.get(url, {'lang': 'en'}, HTTP_ACCEPT_LANGUAGE='ru')
+        self.assertEqual(response.json()['title'], "Hotel")
+        self.assertEqual(response.json()['price'], "123456.50")
+        self.assertEqual(self.client.get(reverse('hotels_api:hotel_detail_view', kwargs={'pk': 0})).status_code, 404)
+
+
+class HotelGeoFilterTest(TestCase):
+    @classmethod
+    def setUpTestData(cls):
+        region = Regions.objects.create(name_uz="Samarqand")
+        places = {
+            "Registon": (39.6548, 66.9757),
+            "Siyob": (39.6622, 66.9870),
+            "Buxoro": (39.7747, 64.4286),
+        }
+        for title, (lat, lng) in places.items():
+            Hotel.objects.create(title_uz=title, description_uz="Tavsif", address_uz="Manzil", price="100000",
+                                 region=region, location={"latitude": lat, "longitude": lng})
+
+    def test_coordinates_are_synced_from_location(self):
+        hotel = Hotel.objects.get(title_uz="Buxoro")
+        self.assertEqual((hotel.latitude, hotel.longitude), (39.7747, 64.4286))
+
+        hotel.location = {"latitude": 40.0, "longitude": 65.0}
+        hotel.save(update_fields=['location'])
+        hotel.refresh_from_db()
+        self.assertEqual((hotel.latitude, hotel.longitude), (40.0, 65.0))
+
+    def test_near_filters_by_radius_and_ranks_by_distance(self):
+        url = reverse('hotels_api:hotels_views')
+        response = self.client.get(url, {'near': '39.6620,66.9860', 'radius_km': 5})
+        titles = [item['title'] for item in response.json()['results']]
+        self.assertEqual(titles, ["Siyob", "Registon"])
+
+        response = self.client.get(url, {'near': '39.6620,66.9860', 'radius_km': 5, 'page_size': 1})
+        next_response = self.client.get(response.json()['next'])
+        self.assertEqual(next_response.json()['results'][0]['title'], "Registon")
+
+    def test_bbox(self):
+        url = reverse('hotels_api:hotels_views')
+        response = self.client.get(url, {'bbox': '39.5,64.0,40.0,65.0'})
+        titles = [item['title'] for item in response.json()['results']]
+        self.assertEqual(titles, ["Buxoro"])
+
+    def test_invalid_near_returns_400(self):
+        url = reverse('hotels_api:hotels_views')
+        self.assertEqual(self.client.get(url, {'near': '39.6'}).status_code, 400)
+
+
+class HotelImageProcessingTest(TestCase):
+    def setUp(self):
+        media_root = tempfile.TemporaryDirectory()
+        self.addCleanup(media_root.cleanup)
+        settings_override = override_settings(MEDIA_ROOT=media_root.name, IMAGE_VARIANT_WIDTHS=(320, 640, 4000))
+        settings_override.enable()
+        self.addCleanup(settings_override.disable)
+
+        region = Regions.objects.create(name_uz="Toshkent")
+        self.hotel = Hotel.objects.create(title_uz="Hotel", description_uz="Tavsif", address_uz="Manzil",
+                                          price="100000", region=region)
+
+    def upload(self, size=(1600, 1200)):
+        exif = Image.Exif()
+        exif[0x010F] = "Camera"
+        buffer = BytesIO()
+        Image.new('RGB', size, (200, 120, 40)).save(buffer, 'JPEG', exif=exif)
+        return SimpleUploadedFile('photo.jpg', buffer.getvalue(), content_type='image/jpeg')
+
+    def process_images(self):
+        call_command('process_images', '--once', '--workers', '0', stdout=open(os.devnull, 'w'))
+
+    def test_upload_is_queued_and_processed_by_worker(self):
+        image = HotelImage.objects.create(hotel=self.hotel, image=self.upload())
+        self.assertEqual(image.status, HotelImage.STATUS_PENDING)
+        self.assertEqual(image.variants, {})
+
+        self.process_images()
+        image.refresh_from_db()
+
+        self.assertEqual(image.status, HotelImage.STATUS_READY)
+        self.assertEqual(sorted(image.variants, key=int), ['320', '640'])
+        with image.image.open('rb') as f:
+            self.assertEqual(len(Image.open(f).getexif()), 0)
+        with image.image.storage.open(image.variants['320']['webp']) as f:
+            self.assertEqual(Image.open(f).size, (320, 240))
+
+    def test_broken_upload_is_marked_failed(self):
+        broken = SimpleUploadedFile('broken.jpg', b'not an image', content_type='image/jpeg')
+        image = HotelImage.objects.create(hotel=self.hotel, image=broken)
+        with self.assertLogs('travelsuz_back.image_queue', 'WARNING'):
+            self.process_images()
+        image.refresh_from_db()
+        self.assertEqual(image.status, HotelImage.STATUS_FAILED)
+
+    def test_original_is_deleted_only_after_commit(self):
+        from travelsuz_back import image_queue
+        image = HotelImage.objects.create(hotel=self.hotel, image=self.upload())
+        original = image.image.name
+        (model, pk, name, claimed_at), = image_queue.claim(10)
+        result = process_upload(name)
+        self.assertTrue(default_storage.exists(original))
+
+        with self.captureOnCommitCallbacks(execute=True) as callbacks:
+            image_queue.complete(model, pk, result, claimed_at)
+            self.assertTrue(default_storage.exists(original))
+        self.assertEqual(len(callbacks), 1)
+        self.assertFalse(default_storage.exists(original))
+
+    def test_second_worker_does_not_touch_fresh_or_finished_claims(self):
+        from travelsuz_back import image_queue
+        image = HotelImage.objects.create(hotel=self.hotel, image=self.upload())
+        (model, pk, name, claimed_at), = image_queue.claim(10)
+
+        # ikkinchi `process_images` ishga tushdi: yangi olingan rasm navbatga qaytmaydi
+        self.assertEqual(image_queue.reset_stale(), 0)
+        image_queue.complete(model, pk, process_upload(name), claimed_at)
+        with self.assertLogs('travelsuz_back.image_queue', 'WARNING'):
+            image_queue.fail(model, pk, ValueError("kech qolgan natija"), claimed_at)
+        image.refresh_from_db()
+        self.assertEqual(image.status, HotelImage.STATUS_READY)
+
+        HotelImage.objects.filter(pk=pk).update(status=HotelImage.STATUS_PROCESSING)
+        later = timezone.now() + timezone.timedelta(seconds=settings.IMAGE_PROCESSING_CLAIM_TIMEOUT + 1)
+        self.assertEqual(image_queue.reset_stale(now=later), 1)
+
+    @override_settings(IMAGE_PROCESSING_EAGER=True)
+    def test_eager_processing_error_is_marked_failed(self):
+        with mock.patch('travelsuz_back.image_queue.process_upload',
+                        side_effect=Image.DecompressionBombError("juda katta")):
+            with self.assertLogs('travelsuz_back.image_queue', 'WARNING'):
+                image = HotelImage.objects.create(hotel=self.hotel, image=self.upload())
+        image.refresh_from_db()
+        self.assertEqual(image.status, HotelImage.STATUS_FAILED)
+
+    def test_list_exposes_srcset(self):
+        HotelImage.objects.create(hotel=self.hotel, image=self.upload())
+        self.process_images()
+        response = self.client.get(reverse('hotels_api:hotels_views'))
+        variants = response.json()['results'][0]['image_variants'][0]
+        self.assertEqual(variants['status'], 'ready')
+        self.assertTrue(variants['original'].endswith('.jpg'))
+        self.assertRegex(variants['webp'], r'_320\.webp 320w, .*_640\.webp 640w$')
+
+
+class HotelGalleryUpdateTest(TestCase):
+    def setUp(self):
+        media_root = tempfile.TemporaryDirectory()
+        self.addCleanup(media_root.cleanup)
+        settings_override = override_settings(MEDIA_ROOT=media_root.name)
+        settings_override.enable()
+        self.addCleanup(settings_override.disable)
+
+        region = Regions.objects.create(name_uz="Toshkent")
+        self.hotel = Hotel.objects.create(title_uz="Hotel", description_uz="Tavsif", address_uz="Manzil",
+                                          price="100000", region=region)
+        self.images = [HotelImage.objects.create(hotel=self.hotel, image=self.upload(f'{i}.jpg'), position=i)
+                       for i in range(3)]
+        self.client = APIClient()
+        self.client.force_authenticate(get_user_model().objects.create_user('admin', password='x'))
+
+    def upload(self, name):
+        buffer = BytesIO()
+        Image.new('RGB', (10, 10)).save(buffer, 'JPEG')
+        return SimpleUploadedFile(name, buffer.getvalue(), content_type='image/jpeg')
+
+    def patch(self, data):
+        url = reverse('hotels_api:hotel_update_view', kwargs={'pk': self.hotel.pk})
+        return self.client.patch(url, data, format='multipart')
+
+    def test_add_remove_and_reorder_keep_untouched_rows(self):
+        first, second, third = self.images
+        response = self.patch({
+            'remove_image_ids': [second.pk],
+            'image_order': [third.pk, first.pk],
+            'uploaded_images': [self.upload('new.jpg')],
+        })
+        self.assertEqual(response.status_code, 200, response.content)
+
+        images = list(self.hotel.images.all())
+        self.assertEqual([img.pk for img in images[:2]], [third.pk, first.pk])
+        self.assertEqual(images[2].image.name, 'hotel_images/new.jpg')
+        self.assertEqual(images[2].position, 2)
+        self.assertEqual(images[2].status, HotelImage.STATUS_PENDING)
+
+    def test_unknown_image_id_is_rejected_without_changes(self):
+        response = self.patch({'remove_image_ids': [self.images[0].pk, 999], 'title_uz': "Boshqa"})
+        self.assertEqual(response.status_code, 400)
+        self.assertEqual(self.hotel.images.count(), 3)
+        self.hotel.refresh_from_db()
+        self.assertEqual(self.hotel.title_uz, "Hotel")
+
+    def test_sweep_removes_only_orphaned_files(self):
+        removed = self.images[0]
+        storage = removed.image.storage
+        removed.delete()
+
+        call_command('sweep_orphan_images', '--grace-minutes', '0', stdout=open(os.devnull, 'w'))
+        self.assertFalse(storage.exists(removed.image.name))
+        self.assertTrue(storage.exists(self.images[1].image.name))
+
+
+class HotelConditionalGetTest(TestCase):
+    @classmethod
+    def setUpTestData(cls):
+        cls.region = Regions.objects.create(name_uz="Jizzax")
+        cls.hotel = Hotel.objects.create(title_uz="Hotel", description_uz="Tavsif", address_uz="Manzil",
+                                         price="100000", region=cls.region)
+
+    def test_if_none_match_returns_304_until_data_changes(self):
+        url = reverse('hotels_api:hotels_views')
+        etag = self.client.get(url)['ETag']
+
+        with self.assertNumQueries(0):
+            response = self.client.get(url, headers={'If-None-Match': etag})
+        self.assertEqual(response.status_code, 304)
+
+        self.region.name_uz = "Jizzax viloyati"
+        self.region.save()
+        response = self.client.get(url, headers={'If-None-Match': etag})
+        self.assertEqual(response.status_code, 200)
+        self.assertNotEqual(response['ETag'], etag)
+
+    def test_uncached_detail_skips_serialization(self):
+        url = reverse('hotels_api:hotel_detail_view', kwargs={'pk': self.hotel.pk})
+        response = self.client.get(url)
+        cache.clear()
+
+        with self.assertNumQueries(1):
+            not_modified = self.client.get(url, headers={'If-Modified-Since': response['Last-Modified']})
+        self.assertEqual(not_modified.status_code, 304)
+        self.assertEqual(not_modified['ETag'], response['ETag'])
+
+    def test_image_delete_changes_detail_etag_and_304_counts_as_view(self):
+        image = HotelImage.objects.create(hotel=self.hotel, image="hotel_images/etag.jpg")
+        url = reverse('hotels_api:hotel_detail_view', kwargs={'pk': self.hotel.pk})
+        etag = self.client.get(url)['ETag']
+        cache.clear()
+        view_counter._pending.clear()
+
+        self.assertEqual(self.client.get(url, headers={'If-None-Match': etag}).status_code, 304)
+        self.assertEqual(view_counter._pending[('hotels.hotel', self.hotel.pk)], 1)
+
+        image.delete()
+        response = self.client.get(url, headers={'If-None-Match': etag})
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(response.json()['image_variants'], [])
+
+    def test_etag_differs_per_filter(self):
+        url = reverse('hotels_api:hotels_views')
+        self.assertNotEqual(self.client.get(url)['ETag'], self.client.get(url, {'region': self.region.pk})['ETag'])
+
+
+class CatalogExportTest(TestCase):
+    @classmethod
+    def setUpTestData(cls):
+        cls.user = get_user_model().objects.create_user(username='partner', password='parol12345')
+        region = Regions.objects.create(name_uz="Termiz", name_ru="Термез", name_en="Termez")
+        for i in range(3):
+            hotel = Hotel.objects.create(title_uz=f"Hotel {i}", title_ru=f"Отель {i}", description_uz="Tavsif",
+                                         address_uz="Manzil", price="100000", region=region,
+                                         location={"latitude": 37.22, "longitude": 67.27})
+            HotelImage.objects.create(hotel=hotel, image=f"hotel_images/export_{i}.jpg")
+
+    def setUp(self):
+        self.client = APIClient()
+        self.client.force_authenticate(self.user)
+        self.url = reverse('catalog_export')
+
+    def export(self, **params):
+        response = self.client.get(self.url, params)
+        self.assertEqual(response.status_code, 200)
+        return b''.join(response.streaming_content).decode()
+
+    def test_ndjson_has_every_language_and_images(self):
+        with self.assertNumQueries(3):
+            lines = [json.loads(line) for line in self.export(type='regions,hotels').splitlines()]
+        self.assertEqual([line['type'] for line in lines], ['regions'] + ['hotels'] * 3)
+        self.assertEqual(lines[1]['title_ru'], "Отель 0")
+        self.assertEqual(lines[1]['price'], "100000.00")
+        self.assertEqual(lines[1]['images'], ["/media/hotel_images/export_0.jpg"])
+        self.assertNotIn('title', lines[1])
+
+    def test_incremental_export_and_csv(self):
+        response = self.client.get(self.url, {'type': 'hotels', 'output': 'csv'}, HTTP_ACCEPT='text/csv')
+        rows = b''.join(response.streaming_content).decode().splitlines()
+        self.assertTrue(rows[0].startswith('id,'))
+        self.assertEqual(len(rows), 4)
+
+        since = response['X-Export-Timestamp']
+        Hotel.objects.filter(title_uz="Hotel 1").update(updated_at=timezone.now())
+        lines = self.export(type='hotels', since=since).splitlines()
+        self.assertEqual([json.loads(line)['title_uz'] for line in lines], ["Hotel 1"])
+
+        self.assertEqual(self.client.get(self.url, {'since': 'kecha'}).status_code, 400)
+        self.assertEqual(self.client.get(self.url, {'output': 'csv'}).status_code, 400)
+
+    def test_command_writes_file(self):
+        with tempfile.TemporaryDirectory() as tmp:
+            path = os.path.join(tmp, 'hotels.ndjson')
+            call_command('export_catalog', type='hotels', output=path, stderr=open(os.devnull, 'w'))
+            with open(path) as f:
+                self.assertEqual(len(f.readlines()), 3)
+
+
+class CatalogImportTest(TestCase):
+    @classmethod
+    def setUpTestData(cls):
+        cls.admin = get_user_model().objects.create_superuser(username='admin', password='parol12345', email='a@a.uz')
+        cls.region = Regions.objects.create(name_uz="Nukus")
+
+    def setUp(self):
+        self.client = APIClient()
+        self.client.force_authenticate(self.admin)
+
+    def upload(self, name, content, **data):
+        return self.client.post(reverse('catalog_import'),
+                                {'file': SimpleUploadedFile(name, content.encode()), **data}, format='multipart')
+
+    def test_ndjson_rows_are_validated_and_bulk_created(self):
+        rows = [
+            {'type': 'hotels', 'title_uz': "Qoraqalpog'iston", 'title_ru': "Каракалпакстан", 'price': "90000",
+             'region': self.region.pk, 'location': {'latitude': 42.46, 'longitude': 59.6}},
+            {'type': 'hotels', 'title_uz': "Arzon", 'price': "-5", 'region': self.region.pk,
+             'latitude': 1, 'longitude': 2},
+            {'type': 'travels', 'title_uz': "Mizdakxon", 'region_id': self.region.pk},
+            {'type': 'restaurants', 'name_uz': "Oshxona", 'region': 999},
+        ]
+        content = '\n'.join(json.dumps(row) for row in rows) + '\nbuzilgan qator\n'
+        with self.assertNumQueries(9):
+            response = self.upload('catalog.ndjson', content)
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(response.json()['created'], {'hotels': 1, 'travels': 1, 'restaurants': 0})
+        self.assertEqual([error['line'] for error in response.json()['errors']], [2, 4, 5])
+        self.assertIn('price', response.json()['errors'][0]['errors'])
+
+        hotel = Hotel.objects.get()
+        self.assertEqual((hotel.title_ru, hotel.latitude), ("Каракалпакстан", 42.46))
+        self.assertTrue(SearchIndex.objects.filter(object_id=hotel.pk, token='каракалпакстан').exists())
+
+    def test_csv_needs_type_and_round_trips_export(self):
+        self.assertEqual(self.upload('hotels.csv', 'title_uz\nX\n').status_code, 400)
+
+        content = (f"title_uz,title_en,price,region_id,location\n"
+                   f"Xiva,Khiva,120000,{self.region.pk},\"{{\"\"latitude\"\": 41.38, \"\"longitude\"\": 60.36}}\"\n")
+        response = self.upload('hotels.csv', content, type='hotels')
+        self.assertEqual(response.json()['created']['hotels'], 1)
+        self.assertEqual(Hotel.objects.get().longitude, 60.36)
+
+
+class HotelAsyncViewsTest(TestCase):
+    @classmethod
+    def setUpTestData(cls):
+        region = Regions.objects.create(name_uz="Qarshi", name_ru="Карши", name_en="Karshi")
+        cls.hotels = [
+            Hotel.objects.create(title_uz=f"Hotel {i}", title_ru=f"Отель {i}", description_uz="Tavsif",
+                                 address_uz="Manzil", price="100000", region=region)
+            for i in range(3)
+        ]
+        HotelImage.objects.create(hotel=cls.hotels[0], image="hotel_images/async.jpg")
+        HotelComment.objects.create(hotel=cls.hotels[0], text="Zo'r")
+        HotelComment.objects.create(hotel=cls.hotels[0], text="Yaxshi")
+
+    async def test_async_endpoints_match_sync_ones(self):
+        sync = await sync_to_async(self.client.get)(reverse('hotels_api:hotels_views'), {'lang': 'ru'})
+        response = await self.async_client.get(reverse('hotels_api:hotels_async_view'),
+                                               {'lang': 'ru', 'limit': 2})
+        self.assertEqual(response.json()['count'], 3)
+        self.assertEqual(response.json()['results'], sync.json()['results'][:2])
+        self.assertIn('offset=2', response.json()['next'])
+
+        pk = self.hotels[0].pk
+        for sync_name, async_name, kwargs in [
+            ('hotel_detail_view', 'hotel_detail_async_view', {'pk': pk}),
+            ('regions_views', 'regions_async_view', {}),
+        ]:
+            sync = await sync_to_async(self.client.get)(reverse(f'hotels_api:{sync_name}', kwargs=kwargs))
+            response = await self.async_client.get(reverse(f'hotels_api:{async_name}', kwargs=kwargs))
+            self.assertEqual(response.json(), sync.json())
+
+        sync = await sync_to_async(self.client.get)(reverse('hotels_api:hotel_comment_list_view', kwargs={'pk': pk}))
+        response = await self.async_client.get(reverse('hotels_api:hotel_comment_list_async_view', kwargs={'pk': pk}))
+        self.assertEqual(response.json()['results'], sync.json()['results'])
+
+        response = await self.async_client.get(reverse('hotels_api:hotel_detail_async_view', kwargs={'pk': 0}))
+        self.assertEqual(response.status_code, 404)
+        response = await self.async_client.get(reverse('hotels_api:hotels_async_view'), {'near': 'abc'})
+        self.assertEqual(response.status_code, 400)
+
+    async def test_async_detail_spools_views_without_orm_when_flush_is_due(self):
+        spool_dir = tempfile.TemporaryDirectory()
+        self.addCleanup(spool_dir.cleanup)
+        pk = self.hotels[1].pk
+        with override_settings(VIEW_COUNTER_SPOOL_DIR=spool_dir.name, VIEW_COUNTER_FLUSH_INTERVAL=0):
+            view_counter._pending.clear()
+            response = await self.async_client.get(reverse('hotels_api:hotel_detail_async_view', kwargs={'pk': pk}))
+            self.assertEqual(response.status_code, 200)
+            self.assertEqual(len(os.listdir(spool_dir.name)), 1)
+
+            await sync_to_async(call_command)('flush_views', stdout=open(os.devnull, 'w'))
+        self.assertEqual(await Hotel.objects.filter(pk=pk).values_list('views', flat=True).aget(), 1)
+
+    def test_middleware_chain_stays_async(self):
+        from django.conf import settings as project_settings
+        from django.utils.module_loading import import_string
+        # bitta sync-only middleware ham bo'lsa, ASGI da har bir async view thread ga o'raladi
+        for path in project_settings.MIDDLEWARE:
+            self.assertTrue(getattr(import_string(path), 'async_capable', True), path)
+
+
+class DatabaseSettingsTest(TestCase):
+    def test_sqlite_default_uses_wal(self):
+        from pathlib import Path
+        from travelsuz_back.database import database_settings
+
+        databases = database_settings(Path('/tmp'), env={})
+        self.assertEqual(list(databases), ['default'])
+        self.assertEqual(databases['default']['NAME'], Path('/tmp/db.sqlite3'))
+        self.assertIn('journal_mode=WAL', databases['default']['OPTIONS']['init_command'])
+
+    def test_postgres_pool_and_replica(self):
+        from travelsuz_back.database import database_settings
+
+        databases = database_settings(None, env={
+            'DB_ENGINE': 'postgres', 'DB_HOST': 'db1', 'DB_POOL': 'true', 'DB_REPLICA_HOST': 'db2',
+        })
+        default, replica = databases['default'], databases['replica']
+        self.assertEqual(default['ENGINE'], 'django.db.backends.postgresql')
+        self.assertEqual(default['CONN_MAX_AGE'], 0)
+        self.assertEqual(default['OPTIONS']['pool']['max_size'], 10)
+        self.assertEqual((replica['HOST'], replica['NAME']), ('db2', default['NAME']))
+        self.assertEqual(replica['TEST'], {'MIRROR': 'default'})
+
+        databases = database_settings(None, env={'DB_ENGINE': 'postgres', 'DB_CONN_MAX_AGE': '300'})
+        self.assertEqual(databases['default']['CONN_MAX_AGE'], 300)
+        self.assertTrue(databases['default']['CONN_HEALTH_CHECKS'])
+        self.assertNotIn('pool', databases['default']['OPTIONS'])
+
+
+class ReadReplicaRoutingTest(TestCase):
+    # primary (test bazasi) va replica uchun ikkita alohida SQLite fayl. Replica alias
+    # setUpClass da qo'shiladi, "__all__" uni test tranzaksiyasiga ham kiritadi.
+    databases = '__all__'
+
+    @classmethod
+    def setUpClass(cls):
+        from django.db import connections
+        cls.replica_dir = tempfile.mkdtemp()
+        connections.settings['replica'] = {
+            **connections['default'].settings_dict,
+            'NAME': os.path.join(cls.replica_dir, 'replica.sqlite3'),
+        }
+        with connections['replica'].schema_editor() as editor:
+            for model in (Regions, Hotel, HotelImage, HotelCard):
+                editor.create_model(model)
+        super().setUpClass()
+
+    @classmethod
+    def tearDownClass(cls):
+        from django.db import connections
+        super().tearDownClass()
+        connections['replica'].close()
+        del connections['replica']
+        del connections.settings['replica']
+
+    @classmethod
+    def setUpTestData(cls):
+        cls.create_hotel('default', 'Primary')
+        cls.create_hotel('replica', 'Replica')
+
+    @staticmethod
+    def create_hotel(alias, title):
+        region = Regions.objects.using(alias).create(pk=1, name='Toshkent')
+        Hotel.objects.using(alias).create(pk=1, region=region, title_uz=title, description_uz='d',
+                                          price=100, location={'latitude': 41.3, 'longitude': 69.2})
+
+    def setUp(self):
+        cache.clear()
+
+    def test_get_reads_replica_and_writer_reads_primary(self):
+        client = APIClient()
+        response = client.get(reverse('hotels_api:hotel_detail_view', kwargs={'pk': 1}))
+        self.assertEqual(response.json()['title'], 'Replica')
+
+        response = client.post(reverse('hotels_api:hotel_comment_create_view'), {'hotel': 1, 'text': 'zo‘r'})
+        self.assertEqual(response.status_code, 201)
+        self.assertEqual(HotelComment.objects.using('default').count(), 1)
+        self.assertIn('pin_primary', response.cookies)
+
+        cache.clear()
+        response = client.get(reverse('hotels_api:hotel_detail_view', kwargs={'pk': 1}))
+        self.assertEqual(response.json()['title'], 'Primary')
+
+    def test_write_in_request_pins_remaining_reads(self):
+        from travelsuz_back import db_router
+
+        with db_router.replica_reads():
+            self.assertEqual(Hotel.objects.get(pk=1).title, 'Replica')
+            Hotel.objects.filter(pk=1).update(views=5)
+            self.assertEqual(Hotel.objects.get(pk=1).title, 'Primary')
+        self.assertEqual(Hotel.objects.get(pk=1).title, 'Primary')
+        self.assertEqual(get_user_model().objects.db, 'default')
+
+
+class CatalogQueryPlanTest(TestCase):
+    # ro'yxat va comment so'rovlari indeks bo'yicha o'qilishi va alohida saralanmasligi kerak
+    def assertUsesIndex(self, queryset, index_name):
+        plan = queryset.explain()
+        self.assertIn(f'USING INDEX {index_name}', plan)
+        self.assertNotIn('TEMP B-TREE', plan)
+
+    def test_catalog_and_comment_queries_use_indexes(self):
+        from apps.restaurants.models import Restaurant, RestaurantComments
+        from apps.travels.models import Travel, TravelComments
+
+        newest = ('-created_at', '-id')
+        for model, comments, fk in ((Hotel, HotelComment, 'hotel'), (Travel, TravelComments, 'travel'),
+                                    (Restaurant, RestaurantComments, 'restaurant')):
+            with self.subTest(model=model.__name__):
+                self.assertUsesIndex(comments.objects.filter(**{f'{fk}_id': 1}).order_by(*newest)[:20],
+                                     f'{fk}_comment_created_idx')
+                self.assertUsesIndex(model.objects.filter(region__id=1).order_by(*newest)[:20],
+                                     f'{fk}_region_created_idx')
+                self.assertUsesIndex(model.objects.filter(created_at__lt=timezone.now()).order_by(*newest)[:20],
+                                     f'{fk}_created_idx')
+                self.assertUsesIndex(model.objects.order_by('-views', '-id')[:20], f'{fk}_views_idx')
+
+
+class CommentThrottleTest(TestCase):
+    @classmethod
+    def setUpTestData(cls):
+        region = Regions.objects.create(name_uz="Xiva")
+        cls.hotel = Hotel.objects.create(title_uz="Hotel", description_uz="d", address_uz="a", price=1, region=region)
+
+    def setUp(self):
+        from django.core.cache import caches
+        from travelsuz_back import throttling
+        cache.clear()
+        caches['throttle'].clear()
+        throttling.stats.clear()
+        self.addCleanup(caches['throttle'].clear)
+
+    def test_token_bucket_rejects_burst_and_reports_metrics(self):
+        from django.conf import settings
+        rates = {**settings.REST_FRAMEWORK, 'DEFAULT_THROTTLE_RATES': {'comment_ip': '2/min'}}
+        url = reverse('hotels_api:hotel_comment_create_view')
+        with override_settings(REST_FRAMEWORK=rates):
+            statuses = [self.client.post(url, {'hotel': self.hotel.pk, 'text': 'a'}).status_code for _ in range(3)]
+            self.assertEqual(statuses, [201, 201, 429])
+            response = self.client.post(url, {'hotel': self.hotel.pk, 'text': 'a'})
+            self.assertEqual(int(response['Retry-After']), 30)
+            # boshqa IP ning bucketi alohida
+            other = self.client.post(url, {'hotel': self.hotel.pk, 'text': 'a'}, REMOTE_ADDR='10.0.0.2')
+            self.assertEqual(other.status_code, 201)
+
+            admin = get_user_model().objects.create_superuser(username='admin', password='p', email='a@a.uz')
+            client = APIClient()
+            client.force_authenticate(admin)
+            stats = client.get(reverse('metrics')).json()['throttle']
+        self.assertEqual(stats, {'comment_ip': {'allowed': 3, 'rejected': 2}})
+        self.assertEqual(HotelComment.objects.count(), 3)
+
+    def test_forwarded_for_header_does_not_open_new_bucket(self):
+        from django.conf import settings
+        rates = {**settings.REST_FRAMEWORK, 'DEFAULT_THROTTLE_RATES': {'comment_ip': '1/min'}}
+        url = reverse('hotels_api:hotel_comment_create_view')
+        with override_settings(REST_FRAMEWORK=rates):
+            statuses = [self.client.post(url, {'hotel': self.hotel.pk, 'text': 'a'},
+                                         HTTP_X_FORWARDED_FOR=f'203.0.113.{i}').status_code for i in range(2)]
+        self.assertEqual(statuses, [201, 429])
+
+    def test_concurrent_requests_are_not_over_granted(self):
+        from concurrent.futures import ThreadPoolExecutor
+        from django.conf import settings
+        from rest_framework.test import APIRequestFactory
+        from travelsuz_back.throttling import IPTokenBucketThrottle
+
+        class View:
+            throttle_scope = 'comment'
+
+        request = APIRequestFactory().post('/')
+        rates = {**settings.REST_FRAMEWORK, 'DEFAULT_THROTTLE_RATES': {'comment_ip': '5/min'}}
+        with override_settings(REST_FRAMEWORK=rates), ThreadPoolExecutor(8) as pool:
+            results = list(pool.map(lambda _: IPTokenBucketThrottle().allow_request(request, View()), range(40)))
+        self.assertEqual(results.count(True), 5)
+
+
+class RegionStatsTest(TestCase):
+    def test_stats_follow_writes_and_match_grouped_queries(self):
+        from apps.restaurants.models import Restaurant
+        from apps.travels.models import Travel
+
+        with self.captureOnCommitCallbacks(execute=True):
+            samarqand = Regions.objects.create(name_uz="Samarqand", name_en="Samarkand")
+            buxoro = Regions.objects.create(name_uz="Buxoro")
+            hotel = Hotel.objects.create(title_uz="A", description_uz="d", address_uz="a", price="100.00",
+                                         region=samarqand, views=5)
+            Hotel.objects.create(title_uz="B", description_uz="d", address_uz="a", price="300.00",
+                                 region=samarqand, views=1)
+            Travel.objects.create(title_uz="T", description_uz="d", address_uz="a", region=samarqand, views=2)
+            Restaurant.objects.create(name_uz="R", description_uz="d", address_uz="a", category_uz="Milliy",
+                                      price_range_uz="Arzon", region=buxoro)
+
+        url = reverse('hotels_api:regions_stats_view')
+        # ETag uchun bitta aggregate + jadvalning o'zi
+        with self.assertNumQueries(2):
+            data = self.client.get(url, {'lang': 'en'}).json()
+        self.assertEqual(data[0], {
+            'id': samarqand.pk, 'name': 'Samarkand', 'hotel_count': 2, 'travel_count': 1, 'restaurant_count': 0,
+            'hotel_min_price': '100.00', 'hotel_avg_price': '200.00', 'total_views': 8,
+        })
+        self.assertEqual((data[1]['hotel_count'], data[1]['restaurant_count']), (0, 1))
+
+        # region almashsa ikkala region ham yangilanadi
+        with self.captureOnCommitCallbacks(execute=True):
+            hotel.region = buxoro
+            hotel.save()
+        stats = {row['id']: row for row in self.client.get(url).json()}
+        self.assertEqual((stats[samarqand.pk]['hotel_count'], stats[samarqand.pk]['hotel_min_price']), (1, '300.00'))
+        self.assertEqual((stats[buxoro.pk]['hotel_count'], stats[buxoro.pk]['total_views']), (1, 5))
+
+        with self.captureOnCommitCallbacks(execute=True):
+            hotel.delete()
+        self.assertEqual(RegionStats.objects.get(pk=buxoro.pk).hotel_count, 0)
+        self.assertIsNone(RegionStats.objects.get(pk=buxoro.pk).hotel_avg_price)
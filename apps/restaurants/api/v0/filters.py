@@ -1,7 +1,8 @@
 import django_filters
 from apps.restaurants.models import Restaurant
+from travelsuz_back.geo import GeoFilterSet
 
-class RestaurantsFilter(django_filters.FilterSet):
+class RestaurantsFilter(GeoFilterSet):
     region = django_filters.NumberFilter(field_name='region__id')
 
     class Meta:
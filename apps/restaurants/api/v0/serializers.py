@@ -1,11 +1,15 @@
 from typing import List, Dict, Optional, Any
 
+from django.db import transaction
 from drf_spectacular.utils import extend_schema_field
 from modeltranslation.utils import get_language
 from rest_framework import serializers
 
 from apps.hotels.models import Regions
 from apps.restaurants.models import Restaurant, RestaurantImage, RestaurantComments
+from travelsuz_back.fast_serializers import ReadOnlySerializer
+from travelsuz_back.gallery import update_gallery
+from travelsuz_back.images import srcset
 
 
 class RestaurantSerializer(serializers.ModelSerializer):
@@ -16,6 +20,7 @@ class RestaurantSerializer(serializers.ModelSerializer):
     price_range = serializers.SerializerMethodField()
     region = serializers.SerializerMethodField()
     images = serializers.SerializerMethodField()
+    image_variants = serializers.SerializerMethodField()
     location = serializers.SerializerMethodField()
 
     class Meta:
@@ -23,7 +28,7 @@ class RestaurantSerializer(serializers.ModelSerializer):
         fields = [
             'id', 'name', 'description', 'address', 'phone_number',
             'category', 'price_range', 'opening_time', 'closing_time',
-            'images', 'location',  'region', 'created_at','views'
+            'images', 'image_variants', 'location',  'region', 'created_at','views'
         ]
 
     def get_language(self) -> str:
@@ -48,6 +53,10 @@ class RestaurantSerializer(serializers.ModelSerializer):
     def get_images(self, obj) -> List[str]:
         return [img.image.url for img in obj.images.all()]
 
+    @extend_schema_field(serializers.ListField(child=serializers.DictField(child=serializers.CharField())))
+    def get_image_variants(self, obj) -> List[Dict[str, str]]:
+        return [srcset(img) for img in obj.images.all()]
+
     @extend_schema_field(
         serializers.DictField(
             child=serializers.FloatField(allow_null=True),
@@ -67,10 +76,16 @@ class RestaurantSerializer(serializers.ModelSerializer):
         return getattr(obj.region, f'name_{lang}', obj.region.name)
 
 
+class RestaurantReadSerializer(ReadOnlySerializer):
+    model = Restaurant
+    serializer_class = RestaurantSerializer
+    translated_fields = ('name', 'description', 'address', 'category', 'price_range')
+
+
 class RestaurantImageSerializer(serializers.ModelSerializer):
     class Meta:
         model = RestaurantImage
-        fields = ['id', 'image']
+        fields = ['id', 'image', 'status']
 
 
 class RestaurantCreateSerializer(serializers.ModelSerializer):
@@ -143,8 +158,7 @@ class RestaurantCreateSerializer(serializers.ModelSerializer):
 
         restaurant = Restaurant.objects.create(**validated_data)
 
-        for img in uploaded_images:
-            RestaurantImage.objects.create(restaurant=restaurant, image=img)
+        update_gallery(restaurant, uploaded=uploaded_images)
         return restaurant
 
 
@@ -170,6 +184,14 @@ class RestaurantUpdateSerializer(serializers.ModelSerializer):
     uploaded_images = serializers.ListField(
         child=serializers.ImageField(), write_only=True, required=False, allow_empty=True, default=[]
     )
+    remove_image_ids = serializers.ListField(
+        child=serializers.IntegerField(), write_only=True, required=False,
+        help_text="O'chiriladigan rasm id larini kiriting"
+    )
+    image_order = serializers.ListField(
+        child=serializers.IntegerField(), write_only=True, required=False,
+        help_text="Rasm id larini kerakli tartibda kiriting"
+    )
 
     class Meta:
         model = Restaurant
@@ -181,7 +203,7 @@ class RestaurantUpdateSerializer(serializers.ModelSerializer):
             'phone_number', 'price_range_uz', 'price_range_ru', 'price_range_en',
             'category_uz', 'category_ru', 'category_en',
             'images', 'location', 'created_at', 'region', 'opening_time', 'closing_time',
-            'latitude', 'longitude','uploaded_images'
+            'latitude', 'longitude','uploaded_images', 'remove_image_ids', 'image_order'
         ]
         read_only_fields = ['id', 'created_at']
 
@@ -223,8 +245,11 @@ class RestaurantUpdateSerializer(serializers.ModelSerializer):
         return value
 
 
+    @transaction.atomic
     def update(self, instance, validated_data) -> Dict[str, Any]:
         uploaded_images = validated_data.pop('uploaded_images', None)
+        remove_image_ids = validated_data.pop('remove_image_ids', None)
+        image_order = validated_data.pop('image_order', None)
         latitude = validated_data.pop('latitude', None)
         longitude = validated_data.pop('longitude', None)
 
@@ -243,10 +268,7 @@ class RestaurantUpdateSerializer(serializers.ModelSerializer):
             setattr(instance, attr, value)
         instance.save()
 
-        if uploaded_images is not None:
-            instance.images.all().delete()
-            for img in uploaded_images:
-                RestaurantImage.objects.create(restaurant=instance, image=img)
+        update_gallery(instance, uploaded=uploaded_images, remove_ids=remove_image_ids, order=image_order)
 
         return instance
 
@@ -261,4 +283,9 @@ class RestaurantCommentSerializer(serializers.ModelSerializer):
         extra_kwargs = {
             'restaurant': {'help_text': "Restaurant id ni kiriting !"},
             'comment': {'help_text': "Comment ni kiriting !", 'default': ''},
-        }
\ No newline at end of file
+        }
+
+
+class RestaurantCommentReadSerializer(ReadOnlySerializer):
+    model = RestaurantComments
+    serializer_class = RestaurantCommentSerializer
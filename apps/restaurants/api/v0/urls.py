@@ -2,7 +2,8 @@ from django.urls import path
 
 from .views import (resturant_list, restaurant_create_view, restaurant_detail_view,
                     restaurant_update_view, restaurant_delete_view, restaurant_comment_create_view,
-                    resraurant_comment_list_view)
+                    resraurant_comment_list_view, restaurant_list_async, restaurant_detail_async_view,
+                    restaurant_comment_list_async_view, restaurant_trending_view)
 
 app_name = 'restaurants_api'
 
@@ -14,4 +15,11 @@ urlpatterns = [
     path('restaurant_detail/<int:pk>/', restaurant_detail_view, name='restaurant_detail'),
     path('restaurant_coment_create/', restaurant_comment_create_view, name='restaurant_comment_create'),
     path('restaurant_comment_list/<int:pk>/', resraurant_comment_list_view, name='restaurant_comment_list'),
+    path('trending/', restaurant_trending_view, name='restaurant_trending'),
+
+    # ASGI uchun async (faqat o'qish) variantlar
+    path('async/restaurants/', restaurant_list_async, name='restaurants_list_async'),
+    path('async/restaurant_detail/<int:pk>/', restaurant_detail_async_view, name='restaurant_detail_async'),
+    path('async/restaurant_comment_list/<int:pk>/', restaurant_comment_list_async_view,
+         name='restaurant_comment_list_async'),
 ]
\ No newline at end of file
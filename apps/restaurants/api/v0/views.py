@@ -10,8 +10,17 @@ from rest_framework.permissions import IsAuthenticated, AllowAny
 
 from apps.restaurants.api.v0.filters import RestaurantsFilter
 from .serializers import (RestaurantCreateSerializer, RestaurantSerializer,
-                          RestaurantUpdateSerializer, RestaurantCommentSerializer)
+                          RestaurantUpdateSerializer, RestaurantCommentSerializer,
+                          RestaurantReadSerializer, RestaurantCommentReadSerializer)
 from apps.restaurants.models import Restaurant, RestaurantComments
+from apps.trending.api.v0.views import TrendingListView, TRENDING_PARAMETERS
+from apps.trending.models import TrendingScore
+from travelsuz_back import view_counter
+from travelsuz_back.async_views import AsyncListView, AsyncDetailView
+from travelsuz_back.cards import CardListMixin
+from travelsuz_back.conditional import ConditionalGetMixin
+from travelsuz_back.response_cache import CachedResponseMixin
+from travelsuz_back.throttling import WRITE_THROTTLES
 from rest_framework.generics import (ListAPIView, CreateAPIView, UpdateAPIView,
                                      DestroyAPIView, RetrieveAPIView)
 
@@ -19,12 +28,12 @@ from rest_framework.generics import (ListAPIView, CreateAPIView, UpdateAPIView,
 
 
 
-class RestaurantListView(ListAPIView):
-    queryset = Restaurant.objects.all()
+class RestaurantListView(CachedResponseMixin, ConditionalGetMixin, CardListMixin, ListAPIView):
+    queryset = Restaurant.objects.with_related()
     serializer_class = RestaurantSerializer
+    read_serializer_class = RestaurantReadSerializer
     filter_backends = [DjangoFilterBackend]
     filterset_class = RestaurantsFilter
-    search_fields = ['title', 'description']
 
     @extend_schema(tags=["Restaurant"],
                    summary="Restaurant listini chiqarish")
@@ -36,7 +45,7 @@ class RestaurantListView(ListAPIView):
         if lang not in ['uz', 'ru', 'en']:
             lang = 'uz'
         translation.activate(lang)
-        return Restaurant.objects.all()
+        return Restaurant.objects.with_related()
 
 
 class RestaurantCreateView(CreateAPIView):
@@ -120,25 +129,22 @@ class RestaurantDeleteView(DestroyAPIView):
         )
 
 
-class RestaurantDetailView(RetrieveAPIView):
-    queryset = Restaurant.objects.all()
+class RestaurantDetailView(CachedResponseMixin, ConditionalGetMixin, RetrieveAPIView):
+    queryset = Restaurant.objects.with_related()
     serializer_class = RestaurantSerializer
     parser_classes = (MultiPartParser, FormParser)
     lookup_field = 'pk'
 
 
-    def retrieve(self, request, *args, **kwargs):
-        instance = self.get_object()
-        instance.views += 1
-        instance.save(update_fields=["views"])
-        return super().retrieve(request, *args, **kwargs)
+    def on_cache_hit(self, request, *args, **kwargs):
+        view_counter.record_view(Restaurant, kwargs['pk'])
 
-    def get_object(self):
-        pk = self.kwargs.get("pk")
-        try:
-            return Restaurant.objects.get(pk=pk)
-        except Restaurant.DoesNotExist:
+    def retrieve(self, request, *args, **kwargs):
+        data = RestaurantReadSerializer.for_request(request).serialize(Restaurant.objects.filter(pk=kwargs['pk']))
+        if not data:
             raise NotFound(detail="Bunday restoran topilmadi.")
+        view_counter.record_view(Restaurant, data[0]['id'])
+        return Response(data[0])
 
     @extend_schema(tags=["Restaurant"], summary="Restaurant ma'lumotlarini ko'rish")
     def get(self, request, *args, **kwargs):
@@ -150,6 +156,8 @@ class RestaurantCommentCreateView(CreateAPIView):
     permission_classes = [AllowAny]
     parser_classes = (MultiPartParser, FormParser)
     serializer_class = RestaurantCommentSerializer
+    throttle_classes = WRITE_THROTTLES
+    throttle_scope = 'comment'
 
     @extend_schema(tags=["Restaurant"], summary="Create restaurant comment")
     def post(self, request, *args, **kwargs):
@@ -164,7 +172,7 @@ class RestaurantCommentListView(ListAPIView):
 
     def get_queryset(self):
         restaurant = self.kwargs['pk']
-        return RestaurantComments.objects.filter(restaurant_id=restaurant).order_by('-created_at')
+        return RestaurantComments.objects.filter(restaurant_id=restaurant).order_by('-created_at', '-id')
 
 
     @extend_schema(tags=["Restaurant"], summary="List Restaurant comment")
@@ -175,6 +183,35 @@ class RestaurantCommentListView(ListAPIView):
 
 
 
+class RestaurantListAsyncView(AsyncListView):
+    read_serializer_class = RestaurantReadSerializer
+    filterset_class = RestaurantsFilter
+
+
+class RestaurantDetailAsyncView(AsyncDetailView):
+    read_serializer_class = RestaurantReadSerializer
+    not_found_message = "Bunday restoran topilmadi."
+
+
+class RestaurantCommentListAsyncView(AsyncListView):
+    read_serializer_class = RestaurantCommentReadSerializer
+
+    def get_queryset(self):
+        return RestaurantComments.objects.filter(restaurant_id=self.kwargs['pk'])
+
+
+class RestaurantTrendingView(TrendingListView):
+    serializer_class = RestaurantSerializer
+    kind = TrendingScore.KIND_RESTAURANT
+
+    @extend_schema(tags=["Restaurant"], summary="Trending restoranlar (ko'rishlar va commentlar bo'yicha)", parameters=TRENDING_PARAMETERS)
+    def get(self, request, *args, **kwargs):
+        return super().get(request, *args, **kwargs)
+
+
+restaurant_list_async = RestaurantListAsyncView.as_view()
+restaurant_detail_async_view = RestaurantDetailAsyncView.as_view()
+restaurant_comment_list_async_view = RestaurantCommentListAsyncView.as_view()
 resraurant_comment_list_view = RestaurantCommentListView.as_view()
 restaurant_comment_create_view = RestaurantCommentCreateView.as_view()
 restaurant_detail_view = RestaurantDetailView.as_view()
@@ -182,4 +219,5 @@ restaurant_delete_view = RestaurantDeleteView.as_view()
 restaurant_update_view = RestaurantUpdateView.as_view()
 restaurant_create_view = RestaurantCreateView.as_view()
 resturant_list = RestaurantListView.as_view()
+restaurant_trending_view = RestaurantTrendingView.as_view()
 
@@ -4,3 +4,14 @@ from django.apps import AppConfig
 class RestaurantsConfig(AppConfig):
     default_auto_field = 'django.db.models.BigAutoField'
     name = 'apps.restaurants'
+
+    def ready(self):
+        from travelsuz_back import cards, region_stats
+        from travelsuz_back.conditional import track_images
+        from travelsuz_back.response_cache import invalidate_on_change
+        from .models import Restaurant, RestaurantImage, RestaurantCard
+
+        invalidate_on_change(Restaurant, RestaurantImage)
+        cards.register(Restaurant, RestaurantCard)
+        region_stats.register(Restaurant, 'restaurant_count')
+        track_images(RestaurantImage)
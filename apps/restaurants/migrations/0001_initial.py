@@ -0,0 +1,67 @@
+# Generated by Django 5.2.3 on 2026-10-18 10:43
+
+import datetime
+import django.db.models.deletion
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    initial = True
+
+    dependencies = [
+        ('hotels', '0001_initial'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='Restaurant',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('name', models.CharField(max_length=500)),
+                ('name_uz', models.CharField(max_length=500, null=True)),
+                ('name_ru', models.CharField(max_length=500, null=True)),
+                ('name_en', models.CharField(max_length=500, null=True)),
+                ('description', models.TextField()),
+                ('description_uz', models.TextField(null=True)),
+                ('description_ru', models.TextField(null=True)),
+                ('description_en', models.TextField(null=True)),
+                ('address', models.CharField(max_length=500)),
+                ('address_uz', models.CharField(max_length=500, null=True)),
+                ('address_ru', models.CharField(max_length=500, null=True)),
+                ('address_en', models.CharField(max_length=500, null=True)),
+                ('phone_number', models.CharField(blank=True, max_length=20, null=True)),
+                ('category', models.CharField(max_length=500)),
+                ('category_uz', models.CharField(max_length=500, null=True)),
+                ('category_ru', models.CharField(max_length=500, null=True)),
+                ('category_en', models.CharField(max_length=500, null=True)),
+                ('price_range', models.CharField(help_text="Arzon, O'rta, Qimmat", max_length=50)),
+                ('price_range_uz', models.CharField(help_text="Arzon, O'rta, Qimmat", max_length=50, null=True)),
+                ('price_range_ru', models.CharField(help_text="Arzon, O'rta, Qimmat", max_length=50, null=True)),
+                ('price_range_en', models.CharField(help_text="Arzon, O'rta, Qimmat", max_length=50, null=True)),
+                ('opening_time', models.TimeField(blank=True, default=datetime.time(9, 0), null=True)),
+                ('closing_time', models.TimeField(blank=True, default=datetime.time(21, 0), null=True)),
+                ('location', models.JSONField(blank=True, null=True)),
+                ('created_at', models.DateTimeField(auto_now_add=True)),
+                ('views', models.PositiveIntegerField(default=0)),
+                ('region', models.ForeignKey(blank=True, null=True, on_delete=django.db.models.deletion.CASCADE, to='hotels.regions')),
+            ],
+        ),
+        migrations.CreateModel(
+            name='RestaurantComments',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('comment', models.TextField()),
+                ('created_at', models.DateTimeField(auto_now_add=True)),
+                ('restaurant', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, to='restaurants.restaurant')),
+            ],
+        ),
+        migrations.CreateModel(
+            name='RestaurantImage',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('image', models.ImageField(upload_to='restaurant_images')),
+                ('restaurant', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='images', to='restaurants.restaurant')),
+            ],
+        ),
+    ]
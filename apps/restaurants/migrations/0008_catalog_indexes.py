@@ -0,0 +1,30 @@
+# Generated by Django 5.2.3 on 2026-10-18 10:43
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('hotels', '0008_catalog_indexes'),
+        ('restaurants', '0007_cards'),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='restaurant',
+            index=models.Index(fields=['region', 'created_at', 'id'], name='restaurant_region_created_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='restaurant',
+            index=models.Index(fields=['created_at', 'id'], name='restaurant_created_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='restaurant',
+            index=models.Index(fields=['views'], name='restaurant_views_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='restaurantcomments',
+            index=models.Index(fields=['restaurant', 'created_at', 'id'], name='restaurant_comment_created_idx'),
+        ),
+    ]
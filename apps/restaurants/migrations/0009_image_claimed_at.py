@@ -0,0 +1,18 @@
+# Generated by Django 5.2.3 on 2026-10-18 10:45
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('restaurants', '0008_catalog_indexes'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='restaurantimage',
+            name='claimed_at',
+            field=models.DateTimeField(blank=True, editable=False, null=True),
+        ),
+    ]
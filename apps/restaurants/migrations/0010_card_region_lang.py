@@ -0,0 +1,31 @@
+from django.db import migrations, models
+
+
+def copy_lang(apps, schema_editor):
+    # mavjud card lar region nomini ham lang tilida saqlagan
+    apps.get_model('restaurants', 'RestaurantCard').objects.update(region_lang=models.F('lang'))
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('restaurants', '0009_image_claimed_at'),
+    ]
+
+    operations = [
+        migrations.RemoveConstraint(
+            model_name='restaurantcard',
+            name='unique_restaurant_card_lang',
+        ),
+        migrations.AddField(
+            model_name='restaurantcard',
+            name='region_lang',
+            field=models.CharField(default='uz', max_length=5),
+            preserve_default=False,
+        ),
+        migrations.RunPython(copy_lang, migrations.RunPython.noop),
+        migrations.AddConstraint(
+            model_name='restaurantcard',
+            constraint=models.UniqueConstraint(fields=('restaurant', 'lang', 'region_lang'), name='unique_restaurant_card_lang'),
+        ),
+    ]
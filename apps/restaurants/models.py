@@ -1,10 +1,10 @@
 import datetime
 
 from django.db import models
-from apps.hotels.models import Regions
+from apps.hotels.models import Regions, CatalogQuerySet, GeoIndexedModel, ResponsiveImageModel, CatalogCard
 # Create your models here.
 
-class Restaurant(models.Model):
+class Restaurant(GeoIndexedModel):
     name = models.CharField(max_length=500)
     description = models.TextField()
     address = models.CharField(max_length=500)
@@ -19,12 +19,23 @@ class Restaurant(models.Model):
     closing_time = models.TimeField(default=datetime.time(21, 0), null=True, blank=True)
     location = models.JSONField(null=True, blank=True)
     created_at = models.DateTimeField(auto_now_add=True)
+    updated_at = models.DateTimeField(auto_now=True)
     views = models.PositiveIntegerField(default=0)
 
+    objects = CatalogQuerySet.as_manager()
+
+    class Meta:
+        # ro'yxat: region bo'yicha filter + (-created_at, -id) tartib, mashhurlik bo'yicha tartib: views
+        indexes = [
+            models.Index(fields=['region', 'created_at', 'id'], name='restaurant_region_created_idx'),
+            models.Index(fields=['created_at', 'id'], name='restaurant_created_idx'),
+            models.Index(fields=['views'], name='restaurant_views_idx'),
+        ]
+
     def __str__(self):
         return self.name
 
-class RestaurantImage(models.Model):
+class RestaurantImage(ResponsiveImageModel):
     restaurant = models.ForeignKey(Restaurant, on_delete=models.CASCADE, related_name='images')
     image = models.ImageField(upload_to='restaurant_images')
 
@@ -32,10 +43,22 @@ class RestaurantImage(models.Model):
         return f"{self.restaurant.name} - {self.image.name}"
 
 
+class RestaurantCard(CatalogCard):
+    restaurant = models.ForeignKey(Restaurant, on_delete=models.CASCADE, related_name='cards')
+
+    class Meta:
+        constraints = [models.UniqueConstraint(fields=['restaurant', 'lang', 'region_lang'],
+                                               name='unique_restaurant_card_lang')]
+
+
 class RestaurantComments(models.Model):
     restaurant = models.ForeignKey(Restaurant, on_delete=models.CASCADE)
     comment = models.TextField()
     created_at = models.DateTimeField(auto_now_add=True)
 
+    class Meta:
+        # comment ro'yxati: restaurant_id bo'yicha filter, (-created_at, -id) tartib
+        indexes = [models.Index(fields=['restaurant', 'created_at', 'id'], name='restaurant_comment_created_idx')]
+
     def __str__(self):
         return f'{str(self.restaurant.name)} - {self.comment} '
\ No newline at end of file
@@ -1,3 +1,55 @@
+import datetime
+
 from django.test import TestCase
+from django.urls import reverse
+from django.utils import translation
+
+from apps.hotels.models import Regions
+from apps.restaurants.api.v0.serializers import RestaurantSerializer, RestaurantReadSerializer
+from apps.restaurants.models import Restaurant, RestaurantImage
+
+
+class RestaurantListQueryCountTest(TestCase):
+    @classmethod
+    def setUpTestData(cls):
+        cls.region = Regions.objects.create(name_uz="Xiva", name_ru="Хива", name_en="Khiva")
+
+    def create_restaurants(self, count):
+        for i in range(count):
+            restaurant = Restaurant.objects.create(
+                name_uz=f"Restaurant {i}", description_uz="Tavsif", address_uz="Manzil",
+                category_uz="Milliy", price_range_uz="O'rta", region=self.region,
+                location={"latitude": 41.38, "longitude": 60.36},
+            )
+            RestaurantImage.objects.create(restaurant=restaurant, image=f"restaurant_images/{i}.jpg")
+
+    def test_list_query_count_does_not_grow_with_rows(self):
+        url = reverse('restaurants_api:restaurants_list')
+
+        self.create_restaurants(2)
+        with self.assertNumQueries(5):
+            response = self.client.get(url)
+        self.assertEqual(len(response.json()['results']), 2)
+
+        self.create_restaurants(8)
+        with self.assertNumQueries(5):
+            response = self.client.get(url)
+        self.assertEqual(len(response.json()['results']), 10)
+
+
+class RestaurantReadSerializerParityTest(TestCase):
+    @classmethod
+    def setUpTestData(cls):
+        region = Regions.objects.create(name_uz="Xiva", name_ru="Хива", name_en="Khiva")
+        restaurant = Restaurant.objects.create(
+            name_uz="Choyxona", name_en="Teahouse", description_uz="Tavsif", address_uz="Manzil",
+            category_uz="Milliy", price_range_uz="Arzon", region=region, phone_number="+998901234567",
+            opening_time=datetime.time(8, 30), closing_time=None,
+        )
+        RestaurantImage.objects.create(restaurant=restaurant, image="restaurant_images/a.jpg")
 
-# Create your tests here.
+    def test_matches_model_serializer_in_every_language(self):
+        for lang in ('uz', 'ru', 'en'):
+            with translation.override(lang):
+                expected = RestaurantSerializer(Restaurant.objects.with_related(), many=True).data
+            self.assertEqual(RestaurantReadSerializer(lang).serialize(Restaurant.objects.all()), expected)
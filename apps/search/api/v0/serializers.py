@@ -0,0 +1,12 @@
+from rest_framework import serializers
+
+from apps.search.models import SearchIndex
+
+
+class SearchResultSerializer(serializers.Serializer):
+    type = serializers.ChoiceField(choices=SearchIndex.KIND_CHOICES)
+    id = serializers.IntegerField()
+    title = serializers.CharField()
+    address = serializers.CharField(allow_null=True)
+    region = serializers.CharField(allow_null=True)
+    score = serializers.FloatField()
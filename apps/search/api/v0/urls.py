@@ -0,0 +1,9 @@
+from django.urls import path
+
+from .views import search_view
+
+app_name = 'search_api'
+
+urlpatterns = [
+    path('', search_view, name='search'),
+]
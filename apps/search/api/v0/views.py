@@ -0,0 +1,78 @@
+from drf_spectacular.utils import extend_schema, OpenApiParameter
+from rest_framework.exceptions import ValidationError
+from rest_framework.generics import GenericAPIView
+from rest_framework.permissions import AllowAny
+from rest_framework.response import Response
+
+from apps.search import indexing
+from apps.search.models import SearchIndex
+from travelsuz_back.response_cache import CachedResponseMixin
+from .serializers import SearchResultSerializer
+
+DEFAULT_LIMIT = 20
+MAX_LIMIT = 50
+
+
+def _translated(obj, field, lang):
+    return getattr(obj, f'{field}_{lang}', None) or getattr(obj, field, None)
+
+
+class SearchView(CachedResponseMixin, GenericAPIView):
+    serializer_class = SearchResultSerializer
+    permission_classes = [AllowAny]
+    pagination_class = None
+
+    @extend_schema(
+        tags=["Search"],
+        summary="Hotel, travel va restaurantlar bo'yicha qidiruv",
+        parameters=[
+            OpenApiParameter('q', str, description="Qidiruv so'zi"),
+            OpenApiParameter('type', str, description="hotel, travel yoki restaurant (vergul bilan bir nechta)"),
+            OpenApiParameter('limit', int, description=f"Natijalar soni (max {MAX_LIMIT})"),
+            OpenApiParameter('lang', str, description="uz, ru yoki en"),
+        ],
+    )
+    def get(self, request, *args, **kwargs):
+        query = request.query_params.get('q', '').strip()
+        if not query:
+            raise ValidationError({'q': "Qidiruv so'zini kiriting."})
+
+        kinds = [k for k in request.query_params.get('type', '').split(',') if k]
+        valid_kinds = dict(SearchIndex.KIND_CHOICES)
+        if any(kind not in valid_kinds for kind in kinds):
+            raise ValidationError({'type': f"Faqat {', '.join(valid_kinds)} bo‘lishi mumkin."})
+
+        try:
+            limit = min(int(request.query_params.get('limit', DEFAULT_LIMIT)), MAX_LIMIT)
+        except ValueError:
+            raise ValidationError({'limit': "limit butun son bo‘lishi kerak."})
+
+        lang = request.query_params.get('lang', 'uz')
+        if lang not in ['uz', 'ru', 'en']:
+            lang = 'uz'
+
+        hits = indexing.search(query, kinds=kinds, limit=max(limit, 1))
+        objects = {}
+        for kind in {hit['kind'] for hit in hits}:
+            model, _ = indexing.INDEXED_FIELDS[kind]
+            ids = [hit['object_id'] for hit in hits if hit['kind'] == kind]
+            objects[kind] = model.objects.select_related('region').in_bulk(ids)
+
+        results = []
+        for hit in hits:
+            obj = objects[hit['kind']].get(hit['object_id'])
+            if obj is None:
+                continue
+            title_field = 'name' if hit['kind'] == SearchIndex.KIND_RESTAURANT else 'title'
+            results.append({
+                'type': hit['kind'],
+                'id': obj.pk,
+                'title': _translated(obj, title_field, lang),
+                'address': _translated(obj, 'address', lang),
+                'region': _translated(obj.region, 'name', lang) if obj.region_id else None,
+                'score': hit['score'],
+            })
+        return Response(self.get_serializer(results, many=True).data)
+
+
+search_view = SearchView.as_view()
@@ -0,0 +1,118 @@
+import re
+from collections import Counter
+
+from django.conf import settings
+from django.db import transaction
+from django.db.models import Count, Q, Sum
+
+from apps.hotels.models import Hotel
+from apps.restaurants.models import Restaurant
+from apps.search.models import SearchIndex
+from apps.travels.models import Travel
+
+LANGUAGES = settings.MODELTRANSLATION_LANGUAGES
+MIN_TOKEN_LENGTH = 2
+MAX_TOKEN_LENGTH = 64
+PREFIX_MIN_LENGTH = 3
+
+# kind -> (model, {maydon: og'irlik}); har bir maydonning barcha til ustunlari indexlanadi
+INDEXED_FIELDS = {
+    SearchIndex.KIND_HOTEL: (Hotel, {'title': 3.0, 'address': 1.0, 'description': 1.0}),
+    SearchIndex.KIND_TRAVEL: (Travel, {'title': 3.0, 'address': 1.0, 'description': 1.0}),
+    SearchIndex.KIND_RESTAURANT: (Restaurant, {'name': 3.0, 'category': 2.0, 'address': 1.0, 'description': 1.0}),
+}
+REGION_WEIGHT = 1.0
+
+# o‘, g‘, ʻ kabi tutuq belgilari so'zni bo'lmasligi uchun olib tashlanadi
+_APOSTROPHES = re.compile(r"[‘’ʻʼ'`]")
+_WORD = re.compile(r'\w+')
+
+
+def tokenize(text):
+    if not text:
+        return []
+    text = _APOSTROPHES.sub('', str(text).lower()).replace('ё', 'е')
+    return [token[:MAX_TOKEN_LENGTH] for token in _WORD.findall(text) if len(token) >= MIN_TOKEN_LENGTH]
+
+
+def kind_for_model(model):
+    for kind, (indexed_model, _) in INDEXED_FIELDS.items():
+        if indexed_model is model:
+            return kind
+    return None
+
+
+def build_entries(kind, obj):
+    _, fields = INDEXED_FIELDS[kind]
+    weights = Counter()
+    for field, weight in fields.items():
+        for lang in LANGUAGES:
+            for token in tokenize(getattr(obj, f'{field}_{lang}', None)):
+                weights[token] += weight
+    if obj.region_id:
+        for lang in LANGUAGES:
+            for token in tokenize(getattr(obj.region, f'name_{lang}', None)):
+                weights[token] += REGION_WEIGHT
+    return [SearchIndex(kind=kind, object_id=obj.pk, token=token, weight=weight)
+            for token, weight in weights.items()]
+
+
+def index_object(obj):
+    kind = kind_for_model(type(obj))
+    with transaction.atomic():
+        SearchIndex.objects.filter(kind=kind, object_id=obj.pk).delete()
+        SearchIndex.objects.bulk_create(build_entries(kind, obj))
+
+
+def index_new_objects(objs):
+    entries = []
+    for obj in objs:
+        entries.extend(build_entries(kind_for_model(type(obj)), obj))
+    SearchIndex.objects.bulk_create(entries, batch_size=1000)
+
+
+def remove_object(obj):
+    SearchIndex.objects.filter(kind=kind_for_model(type(obj)), object_id=obj.pk).delete()
+
+
+def index_region(region):
+    for kind, (model, _) in INDEXED_FIELDS.items():
+        for obj in model.objects.filter(region=region).select_related('region'):
+            index_object(obj)
+
+
+def rebuild(batch_size=500):
+    total = 0
+    with transaction.atomic():
+        SearchIndex.objects.all().delete()
+        for kind, (model, _) in INDEXED_FIELDS.items():
+            entries = []
+            for obj in model.objects.select_related('region').iterator(chunk_size=batch_size):
+                entries.extend(build_entries(kind, obj))
+                if len(entries) >= batch_size:
+                    SearchIndex.objects.bulk_create(entries)
+                    total += len(entries)
+                    entries = []
+            SearchIndex.objects.bulk_create(entries)
+            total += len(entries)
+    return total
+
+
+def search(query, kinds=None, limit=20):
+    tokens = list(dict.fromkeys(tokenize(query)))
+    if not tokens:
+        return []
+
+    condition = Q(token__in=tokens)
+    last = tokens[-1]
+    if len(last) >= PREFIX_MIN_LENGTH:
+        condition |= Q(token__startswith=last)
+
+    entries = SearchIndex.objects.filter(condition)
+    if kinds:
+        entries = entries.filter(kind__in=kinds)
+    return list(
+        entries.values('kind', 'object_id')
+        .annotate(matched=Count('token', distinct=True), score=Sum('weight'))
+        .order_by('-matched', '-score', 'kind', 'object_id')[:limit]
+    )
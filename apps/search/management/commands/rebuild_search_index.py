@@ -0,0 +1,14 @@
+from django.core.management.base import BaseCommand
+
+from apps.search import indexing
+
+
+class Command(BaseCommand):
+    help = "Qidiruv indexini hotel, travel va restaurantlar uchun qaytadan qurish"
+
+    def add_arguments(self, parser):
+        parser.add_argument('--batch-size', type=int, default=500)
+
+    def handle(self, *args, **options):
+        total = indexing.rebuild(batch_size=options['batch_size'])
+        self.stdout.write(self.style.SUCCESS(f"Qidiruv indexi qurildi: {total} ta yozuv"))
@@ -0,0 +1,26 @@
+from django.db import models
+
+
+class SearchIndex(models.Model):
+    KIND_HOTEL = 'hotel'
+    KIND_TRAVEL = 'travel'
+    KIND_RESTAURANT = 'restaurant'
+    KIND_CHOICES = (
+        (KIND_HOTEL, 'Hotel'),
+        (KIND_TRAVEL, 'Travel'),
+        (KIND_RESTAURANT, 'Restaurant'),
+    )
+
+    kind = models.CharField(max_length=20, choices=KIND_CHOICES)
+    object_id = models.PositiveBigIntegerField()
+    token = models.CharField(max_length=64)
+    weight = models.FloatField()
+
+    class Meta:
+        indexes = [
+            models.Index(fields=['token', 'kind'], name='search_token_kind_idx'),
+            models.Index(fields=['kind', 'object_id'], name='search_kind_object_idx'),
+        ]
+
+    def __str__(self):
+        return f"{self.token} -> {self.kind}:{self.object_id}"
@@ -0,0 +1,35 @@
+from django.db.models.signals import post_save, post_delete
+from django.dispatch import receiver
+
+from apps.hotels.models import Hotel, Regions
+from apps.restaurants.models import Restaurant
+from apps.search import indexing
+from apps.travels.models import Travel
+from travelsuz_back.importer import catalog_imported
+
+
+@receiver(post_save, sender=Hotel)
+@receiver(post_save, sender=Travel)
+@receiver(post_save, sender=Restaurant)
+def update_search_index(sender, instance, **kwargs):
+    indexing.index_object(instance)
+
+
+@receiver(catalog_imported, sender=Hotel)
+@receiver(catalog_imported, sender=Travel)
+@receiver(catalog_imported, sender=Restaurant)
+def index_imported_objects(sender, objects, **kwargs):
+    indexing.index_new_objects(objects)
+
+
+@receiver(post_delete, sender=Hotel)
+@receiver(post_delete, sender=Travel)
+@receiver(post_delete, sender=Restaurant)
+def delete_from_search_index(sender, instance, **kwargs):
+    indexing.remove_object(instance)
+
+
+@receiver(post_save, sender=Regions)
+def update_region_in_search_index(sender, instance, created, **kwargs):
+    if not created:
+        indexing.index_region(instance)
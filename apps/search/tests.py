@@ -0,0 +1,50 @@
+from django.test import TestCase
+from django.urls import reverse
+
+from apps.hotels.models import Regions, Hotel
+from apps.restaurants.models import Restaurant
+from apps.search.indexing import tokenize
+from apps.search.models import SearchIndex
+
+
+class SearchTest(TestCase):
+    @classmethod
+    def setUpTestData(cls):
+        cls.region = Regions.objects.create(name_uz="Samarqand", name_ru="Самарканд", name_en="Samarkand")
+        cls.hotel = Hotel.objects.create(
+            title_uz="Registon mehmonxonasi", title_ru="Гостиница Регистан", title_en="Registan hotel",
+            description_uz="Shahar markazida", address_uz="Registon ko‘chasi", price="100000", region=cls.region,
+        )
+        cls.restaurant = Restaurant.objects.create(
+            name_uz="Osh markazi", name_ru="Центр плова", name_en="Plov center",
+            description_uz="Milliy taomlar, registon yaqinida", address_uz="Manzil",
+            category_uz="Milliy", price_range_uz="Arzon", region=cls.region,
+        )
+
+    def search(self, **params):
+        return self.client.get(reverse('search_api:search'), params)
+
+    def test_tokenize_normalizes_apostrophes(self):
+        self.assertEqual(tokenize("O‘zbekiston, Ko'cha"), ["ozbekiston", "kocha"])
+
+    def test_ranks_title_matches_across_apps(self):
+        response = self.search(q="registon")
+        results = response.json()
+        self.assertEqual([(r['type'], r['id']) for r in results],
+                         [('hotel', self.hotel.pk), ('restaurant', self.restaurant.pk)])
+
+    def test_translated_columns_and_prefix(self):
+        results = self.search(q="плов", lang='ru').json()
+        self.assertEqual(results[0]['title'], "Центр плова")
+        self.assertEqual(self.search(q="samarka").json()[0]['region'], "Samarqand")
+
+    def test_index_is_updated_on_save_and_delete(self):
+        self.hotel.title_en = "Silk road hotel"
+        self.hotel.save()
+        self.assertEqual(self.search(q="silk", type='hotel').json()[0]['id'], self.hotel.pk)
+
+        self.hotel.delete()
+        self.assertFalse(SearchIndex.objects.filter(kind='hotel').exists())
+
+    def test_empty_query_returns_400(self):
+        self.assertEqual(self.search(q="").status_code, 400)
@@ -1,7 +1,8 @@
 import django_filters
 from apps.travels.models import Travel
+from travelsuz_back.geo import GeoFilterSet
 
-class TravelsFilter(django_filters.FilterSet):
+class TravelsFilter(GeoFilterSet):
     region = django_filters.NumberFilter(field_name='region__id')
 
     class Meta:
@@ -1,11 +1,15 @@
 from typing import List, Dict, Optional, Any
 
+from django.db import transaction
 from drf_spectacular.utils import extend_schema_field
 from modeltranslation.utils import get_language
 from rest_framework import serializers
 import json
 from apps.hotels.models import Regions
 from apps.travels.models import Travel, TravelImage, TravelComments
+from travelsuz_back.fast_serializers import ReadOnlySerializer
+from travelsuz_back.gallery import update_gallery
+from travelsuz_back.images import srcset
 
 
 class TravelListSerializer(serializers.ModelSerializer):
@@ -14,6 +18,7 @@ class TravelListSerializer(serializers.ModelSerializer):
     address = serializers.SerializerMethodField()
     region = serializers.SerializerMethodField()
     images = serializers.SerializerMethodField()
+    image_variants = serializers.SerializerMethodField()
     location = serializers.SerializerMethodField()
 
     class Meta:
@@ -23,6 +28,7 @@ class TravelListSerializer(serializers.ModelSerializer):
             'title', 'description', 'address',
             'region',
             'images',
+            'image_variants',
             'location',
             'created_at',
             'views'
@@ -44,6 +50,10 @@ class TravelListSerializer(serializers.ModelSerializer):
     def get_images(self, obj) -> List[str]:
         return [img.image.url for img in obj.images.all()]
 
+    @extend_schema_field(serializers.ListField(child=serializers.DictField(child=serializers.CharField())))
+    def get_image_variants(self, obj) -> List[Dict[str, str]]:
+        return [srcset(img) for img in obj.images.all()]
+
     @extend_schema_field(
         serializers.DictField(
             child=serializers.FloatField(allow_null=True),
@@ -63,10 +73,16 @@ class TravelListSerializer(serializers.ModelSerializer):
         return getattr(obj.region, f'name_{lang}', obj.region.name)
 
 
+class TravelReadSerializer(ReadOnlySerializer):
+    model = Travel
+    serializer_class = TravelListSerializer
+    translated_fields = ('title', 'description', 'address')
+
+
 class TravelImageSerializer(serializers.ModelSerializer):
     class Meta:
         model = TravelImage
-        fields = ['id', 'image']
+        fields = ['id', 'image', 'status']
 
 
 class TravelCreateSerializer(serializers.ModelSerializer):
@@ -132,8 +148,7 @@ class TravelCreateSerializer(serializers.ModelSerializer):
 
         travel = Travel.objects.create(**validated_data)
 
-        for img in uploaded_images:
-            TravelImage.objects.create(travel=travel, image=img)
+        update_gallery(travel, uploaded=uploaded_images)
         return travel
 
 
@@ -168,6 +183,14 @@ class TravelUpdateSerializer(serializers.ModelSerializer):
     uploaded_images = serializers.ListField(
         child=serializers.ImageField(), write_only=True, required=False, allow_empty=True, default=[]
     )
+    remove_image_ids = serializers.ListField(
+        child=serializers.IntegerField(), write_only=True, required=False,
+        help_text="O'chiriladigan rasm id larini kiriting"
+    )
+    image_order = serializers.ListField(
+        child=serializers.IntegerField(), write_only=True, required=False,
+        help_text="Rasm id larini kerakli tartibda kiriting"
+    )
 
     class Meta:
         model = Travel
@@ -179,7 +202,7 @@ class TravelUpdateSerializer(serializers.ModelSerializer):
             'latitude', 'longitude',
             'location',
             'region',
-            'images', 'uploaded_images',
+            'images', 'uploaded_images', 'remove_image_ids', 'image_order',
             'created_at',
         ]
         read_only_fields = ['id', 'created_at']
@@ -200,8 +223,11 @@ class TravelUpdateSerializer(serializers.ModelSerializer):
         return value
 
 
+    @transaction.atomic
     def update(self, instance, validated_data) -> Dict[str, Any]:
         uploaded_images = validated_data.pop('uploaded_images', None)
+        remove_image_ids = validated_data.pop('remove_image_ids', None)
+        image_order = validated_data.pop('image_order', None)
         latitude = validated_data.pop('latitude', None)
         longitude = validated_data.pop('longitude', None)
 
@@ -220,10 +246,7 @@ class TravelUpdateSerializer(serializers.ModelSerializer):
             setattr(instance, attr, value)
         instance.save()
 
-        if uploaded_images is not None:
-            instance.images.all().delete()
-            for img in uploaded_images:
-                TravelImage.objects.create(travel=instance, image=img)
+        update_gallery(instance, uploaded=uploaded_images, remove_ids=remove_image_ids, order=image_order)
 
         return instance
 
@@ -237,4 +260,9 @@ class TravelCommentSerializer(serializers.ModelSerializer):
             'travel': {'help_text': "Travel id ni kiriting !"},
             'comment': {'help_text': "Comment ni kiriting !", 'default': ''},
         }
-        read_only_fields = ['id', 'created_at']
\ No newline at end of file
+        read_only_fields = ['id', 'created_at']
+
+
+class TravelCommentReadSerializer(ReadOnlySerializer):
+    model = TravelComments
+    serializer_class = TravelCommentSerializer
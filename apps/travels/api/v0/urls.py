@@ -1,6 +1,8 @@
 from django.urls import path
 from .views import (travel_list_view, travel_create_view, travel_detail_view,
-                    travel_update_view, travel_delete_view, travel_comment_create, travel_comment_list)
+                    travel_update_view, travel_delete_view, travel_comment_create, travel_comment_list,
+                    travel_list_async_view, travel_detail_async_view, travel_comment_list_async,
+                    travel_trending_view)
 
 app_name = 'travels_api'
 
@@ -13,4 +15,10 @@ urlpatterns = [
     path('travel_detail/<int:pk>/', travel_detail_view, name='travel_detail'),
     path('travel_comment_create/', travel_comment_create, name='travel_comment_create'),
     path('travel_comment_list/<int:pk>/', travel_comment_list, name='travel_comment_list'),
+    path('trending/', travel_trending_view, name='travel_trending'),
+
+    # ASGI uchun async (faqat o'qish) variantlar
+    path('async/travel_list/', travel_list_async_view, name='travel_list_async'),
+    path('async/travel_detail/<int:pk>/', travel_detail_async_view, name='travel_detail_async'),
+    path('async/travel_comment_list/<int:pk>/', travel_comment_list_async, name='travel_comment_list_async'),
 ]
\ No newline at end of file
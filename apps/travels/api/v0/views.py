@@ -11,13 +11,23 @@ from rest_framework.response import Response
 
 from apps.travels.api.v0.filters import TravelsFilter
 from apps.travels.api.v0.serializers import (TravelListSerializer, TravelCreateSerializer,
-                                             TravelUpdateSerializer, TravelCommentSerializer)
+                                             TravelUpdateSerializer, TravelCommentSerializer,
+                                             TravelReadSerializer, TravelCommentReadSerializer)
 from apps.travels.models import Travel, TravelImage, TravelComments
-
-
-class TravelListView(ListAPIView):
-    queryset = Travel.objects.all()
+from apps.trending.api.v0.views import TrendingListView, TRENDING_PARAMETERS
+from apps.trending.models import TrendingScore
+from travelsuz_back import view_counter
+from travelsuz_back.async_views import AsyncListView, AsyncDetailView
+from travelsuz_back.cards import CardListMixin
+from travelsuz_back.conditional import ConditionalGetMixin
+from travelsuz_back.response_cache import CachedResponseMixin
+from travelsuz_back.throttling import WRITE_THROTTLES
+
+
+class TravelListView(CachedResponseMixin, ConditionalGetMixin, CardListMixin, ListAPIView):
+    queryset = Travel.objects.with_related()
     serializer_class = TravelListSerializer
+    read_serializer_class = TravelReadSerializer
     filter_backends = [DjangoFilterBackend]
     filterset_class = TravelsFilter
 
@@ -32,7 +42,7 @@ class TravelListView(ListAPIView):
             lang = 'uz'
         translation.activate(lang)
 
-        queryset = Travel.objects.all()
+        queryset = Travel.objects.with_related()
         region_id = self.request.query_params.get('region')
         if region_id:
             queryset = queryset.filter(region_id=region_id)
@@ -107,24 +117,21 @@ class TravelDeleteView(DestroyAPIView):
                         status=status.HTTP_200_OK)
 
 
-class TravelDetailView(RetrieveAPIView):
-    queryset = Travel.objects.all()
+class TravelDetailView(CachedResponseMixin, ConditionalGetMixin, RetrieveAPIView):
+    queryset = Travel.objects.with_related()
     serializer_class = TravelListSerializer
     lookup_field = 'pk'
 
 
-    def retrieve(self, request, *args, **kwargs):
-        instance = self.get_object()
-        instance.views += 1
-        instance.save(update_fields=["views"])
-        return super().retrieve(request, *args, **kwargs)
+    def on_cache_hit(self, request, *args, **kwargs):
+        view_counter.record_view(Travel, kwargs['pk'])
 
-    def get_object(self):
-        pk = self.kwargs.get("pk")
-        try:
-            return Travel.objects.get(pk=pk)
-        except Travel.DoesNotExist:
+    def retrieve(self, request, *args, **kwargs):
+        data = TravelReadSerializer.for_request(request).serialize(Travel.objects.filter(pk=kwargs['pk']))
+        if not data:
             raise NotFound(detail="Bunday Travel topilmadi.")
+        view_counter.record_view(Travel, data[0]['id'])
+        return Response(data[0])
 
     @extend_schema(tags=["Travel"],summary="Travelning detailini chiqarish")
     def get(self, request, *args, **kwargs):
@@ -135,6 +142,8 @@ class TravelCommentCreateView(CreateAPIView):
     serializer_class = TravelCommentSerializer
     parser_classes = (MultiPartParser, FormParser)
     permission_classes = [AllowAny]
+    throttle_classes = WRITE_THROTTLES
+    throttle_scope = 'comment'
 
     @extend_schema(tags=["Travel"], summary="Travel comment yaratish")
     def post(self, request, *args, **kwargs):
@@ -147,13 +156,41 @@ class TravelCommentListView(ListAPIView):
 
     def get_queryset(self):
         travel_id = self.kwargs.get("pk")
-        return TravelComments.objects.filter(travel_id=travel_id).order_by("-created_at")
+        return TravelComments.objects.filter(travel_id=travel_id).order_by("-created_at", "-id")
 
     @extend_schema(tags=["Travel"], summary="Travel comment listini kurish ")
     def get(self, request, *args, **kwargs):
         return self.list(request, *args, **kwargs)
 
+class TravelListAsyncView(AsyncListView):
+    read_serializer_class = TravelReadSerializer
+    filterset_class = TravelsFilter
+
+
+class TravelDetailAsyncView(AsyncDetailView):
+    read_serializer_class = TravelReadSerializer
+    not_found_message = "Bunday Travel topilmadi."
+
+
+class TravelCommentListAsyncView(AsyncListView):
+    read_serializer_class = TravelCommentReadSerializer
+
+    def get_queryset(self):
+        return TravelComments.objects.filter(travel_id=self.kwargs['pk'])
+
+
+class TravelTrendingView(TrendingListView):
+    serializer_class = TravelListSerializer
+    kind = TrendingScore.KIND_TRAVEL
+
+    @extend_schema(tags=["Travel"], summary="Trending travellar (ko'rishlar va commentlar bo'yicha)", parameters=TRENDING_PARAMETERS)
+    def get(self, request, *args, **kwargs):
+        return super().get(request, *args, **kwargs)
+
 
+travel_list_async_view = TravelListAsyncView.as_view()
+travel_detail_async_view = TravelDetailAsyncView.as_view()
+travel_comment_list_async = TravelCommentListAsyncView.as_view()
 travel_delete_view = TravelDeleteView.as_view()
 travel_update_view = TravelUpdateView.as_view()
 travel_create_view = TravelCreateView.as_view()
@@ -161,5 +198,6 @@ travel_list_view = TravelListView.as_view()
 travel_detail_view = TravelDetailView.as_view()
 travel_comment_create = TravelCommentCreateView.as_view()
 travel_comment_list = TravelCommentListView.as_view()
+travel_trending_view = TravelTrendingView.as_view()
 
 
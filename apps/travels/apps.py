@@ -4,3 +4,14 @@ from django.apps import AppConfig
 class TravelsConfig(AppConfig):
     default_auto_field = 'django.db.models.BigAutoField'
     name = 'apps.travels'
+
+    def ready(self):
+        from travelsuz_back import cards, region_stats
+        from travelsuz_back.conditional import track_images
+        from travelsuz_back.response_cache import invalidate_on_change
+        from .models import Travel, TravelImage, TravelCard
+
+        invalidate_on_change(Travel, TravelImage)
+        cards.register(Travel, TravelCard)
+        region_stats.register(Travel, 'travel_count')
+        track_images(TravelImage)
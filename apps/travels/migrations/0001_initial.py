@@ -0,0 +1,56 @@
+# Generated by Django 5.2.3 on 2026-10-18 10:43
+
+import django.db.models.deletion
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    initial = True
+
+    dependencies = [
+        ('hotels', '0001_initial'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='Travel',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('title', models.CharField(max_length=500)),
+                ('title_uz', models.CharField(max_length=500, null=True)),
+                ('title_ru', models.CharField(max_length=500, null=True)),
+                ('title_en', models.CharField(max_length=500, null=True)),
+                ('description', models.TextField()),
+                ('description_uz', models.TextField(null=True)),
+                ('description_ru', models.TextField(null=True)),
+                ('description_en', models.TextField(null=True)),
+                ('location', models.JSONField(blank=True, null=True)),
+                ('address', models.CharField(max_length=500)),
+                ('address_uz', models.CharField(max_length=500, null=True)),
+                ('address_ru', models.CharField(max_length=500, null=True)),
+                ('address_en', models.CharField(max_length=500, null=True)),
+                ('created_at', models.DateTimeField(auto_now_add=True)),
+                ('views', models.PositiveIntegerField(default=0)),
+                ('region', models.ForeignKey(on_delete=django.db.models.deletion.PROTECT, to='hotels.regions')),
+                ('regions', models.ManyToManyField(related_name='travels', to='hotels.regions')),
+            ],
+        ),
+        migrations.CreateModel(
+            name='TravelComments',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('comment', models.TextField()),
+                ('created_at', models.DateTimeField(auto_now_add=True)),
+                ('travel', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='comments', to='travels.travel')),
+            ],
+        ),
+        migrations.CreateModel(
+            name='TravelImage',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('image', models.ImageField(upload_to='travel_images/')),
+                ('travel', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='images', to='travels.travel')),
+            ],
+        ),
+    ]
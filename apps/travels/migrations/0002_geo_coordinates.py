@@ -0,0 +1,23 @@
+# Generated by Django 5.2.3 on 2026-10-18 10:43
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('travels', '0001_initial'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='travel',
+            name='latitude',
+            field=models.FloatField(blank=True, db_index=True, editable=False, null=True),
+        ),
+        migrations.AddField(
+            model_name='travel',
+            name='longitude',
+            field=models.FloatField(blank=True, db_index=True, editable=False, null=True),
+        ),
+    ]
@@ -0,0 +1,22 @@
+# Generated by Django 5.2.3 on 2026-10-18 10:43
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('travels', '0004_image_status'),
+    ]
+
+    operations = [
+        migrations.AlterModelOptions(
+            name='travelimage',
+            options={'ordering': ['position', 'id']},
+        ),
+        migrations.AddField(
+            model_name='travelimage',
+            name='position',
+            field=models.PositiveIntegerField(default=0),
+        ),
+    ]
@@ -0,0 +1,18 @@
+# Generated by Django 5.2.3 on 2026-10-18 10:43
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('travels', '0005_image_position'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='travel',
+            name='updated_at',
+            field=models.DateTimeField(auto_now=True),
+        ),
+    ]
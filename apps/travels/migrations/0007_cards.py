@@ -0,0 +1,27 @@
+# Generated by Django 5.2.3 on 2026-10-18 10:43
+
+import django.db.models.deletion
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('travels', '0006_updated_at'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='TravelCard',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('lang', models.CharField(max_length=5)),
+                ('payload', models.TextField()),
+                ('updated_at', models.DateTimeField(auto_now=True)),
+                ('travel', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='cards', to='travels.travel')),
+            ],
+            options={
+                'constraints': [models.UniqueConstraint(fields=('travel', 'lang'), name='unique_travel_card_lang')],
+            },
+        ),
+    ]
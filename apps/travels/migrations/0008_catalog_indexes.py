@@ -0,0 +1,30 @@
+# Generated by Django 5.2.3 on 2026-10-18 10:43
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('hotels', '0008_catalog_indexes'),
+        ('travels', '0007_cards'),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='travel',
+            index=models.Index(fields=['region', 'created_at', 'id'], name='travel_region_created_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='travel',
+            index=models.Index(fields=['created_at', 'id'], name='travel_created_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='travel',
+            index=models.Index(fields=['views'], name='travel_views_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='travelcomments',
+            index=models.Index(fields=['travel', 'created_at', 'id'], name='travel_comment_created_idx'),
+        ),
+    ]
@@ -0,0 +1,31 @@
+from django.db import migrations, models
+
+
+def copy_lang(apps, schema_editor):
+    # mavjud card lar region nomini ham lang tilida saqlagan
+    apps.get_model('travels', 'TravelCard').objects.update(region_lang=models.F('lang'))
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('travels', '0009_image_claimed_at'),
+    ]
+
+    operations = [
+        migrations.RemoveConstraint(
+            model_name='travelcard',
+            name='unique_travel_card_lang',
+        ),
+        migrations.AddField(
+            model_name='travelcard',
+            name='region_lang',
+            field=models.CharField(default='uz', max_length=5),
+            preserve_default=False,
+        ),
+        migrations.RunPython(copy_lang, migrations.RunPython.noop),
+        migrations.AddConstraint(
+            model_name='travelcard',
+            constraint=models.UniqueConstraint(fields=('travel', 'lang', 'region_lang'), name='unique_travel_card_lang'),
+        ),
+    ]
@@ -1,9 +1,9 @@
 from django.db import models
-from apps.hotels.models import Regions
+from apps.hotels.models import Regions, CatalogQuerySet, GeoIndexedModel, ResponsiveImageModel, CatalogCard
 
 # Create your
 
-class Travel(models.Model):
+class Travel(GeoIndexedModel):
     title = models.CharField(max_length=500)
     description = models.TextField()
     location = models.JSONField(null=True, blank=True)
@@ -11,13 +11,24 @@ class Travel(models.Model):
     address = models.CharField(max_length=500)
     region = models.ForeignKey(Regions, on_delete=models.PROTECT)
     created_at = models.DateTimeField(auto_now_add=True)
+    updated_at = models.DateTimeField(auto_now=True)
     views = models.PositiveIntegerField(default=0)
 
+    objects = CatalogQuerySet.as_manager()
+
+    class Meta:
+        # ro'yxat: region bo'yicha filter + (-created_at, -id) tartib, mashhurlik bo'yicha tartib: views
+        indexes = [
+            models.Index(fields=['region', 'created_at', 'id'], name='travel_region_created_idx'),
+            models.Index(fields=['created_at', 'id'], name='travel_created_idx'),
+            models.Index(fields=['views'], name='travel_views_idx'),
+        ]
+
     def __str__(self):
         return f'{self.title} '
 
 
-class TravelImage(models.Model):
+class TravelImage(ResponsiveImageModel):
     travel = models.ForeignKey(Travel, on_delete=models.CASCADE, related_name='images')
     image = models.ImageField(upload_to='travel_images/')
 
@@ -25,10 +36,22 @@ class TravelImage(models.Model):
         return f'{self.travel.title} - {self.image} '
 
 
+class TravelCard(CatalogCard):
+    travel = models.ForeignKey(Travel, on_delete=models.CASCADE, related_name='cards')
+
+    class Meta:
+        constraints = [models.UniqueConstraint(fields=['travel', 'lang', 'region_lang'],
+                                               name='unique_travel_card_lang')]
+
+
 class TravelComments(models.Model):
     travel = models.ForeignKey(Travel, on_delete=models.CASCADE, related_name='comments')
     comment = models.TextField()
     created_at = models.DateTimeField(auto_now_add=True)
 
+    class Meta:
+        # comment ro'yxati: travel_id bo'yicha filter, (-created_at, -id) tartib
+        indexes = [models.Index(fields=['travel', 'created_at', 'id'], name='travel_comment_created_idx')]
+
     def __str__(self):
         return f'{self.travel.title} - {self.comment} '
\ No newline at end of file
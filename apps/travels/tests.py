@@ -1,3 +1,54 @@
 from django.test import TestCase
+from django.urls import reverse
+from django.utils import translation
 
-# Create your tests here.
+from apps.hotels.models import Regions
+from apps.travels.api.v0.serializers import TravelListSerializer, TravelReadSerializer
+from apps.travels.models import Travel, TravelImage
+
+
+class TravelListQueryCountTest(TestCase):
+    @classmethod
+    def setUpTestData(cls):
+        cls.region = Regions.objects.create(name_uz="Buxoro", name_ru="Бухара", name_en="Bukhara")
+
+    def create_travels(self, count):
+        for i in range(count):
+            travel = Travel.objects.create(
+                title_uz=f"Travel {i}", description_uz="Tavsif", address_uz="Manzil",
+                region=self.region, location={"latitude": 39.77, "longitude": 64.42},
+            )
+            TravelImage.objects.create(travel=travel, image=f"travel_images/{i}.jpg")
+
+    def test_list_query_count_does_not_grow_with_rows(self):
+        url = reverse('travels_api:travel_list')
+
+        self.create_travels(2)
+        with self.assertNumQueries(5):
+            response = self.client.get(url)
+        self.assertEqual(len(response.json()['results']), 2)
+
+        self.create_travels(8)
+        with self.assertNumQueries(5):
+            response = self.client.get(url)
+        self.assertEqual(len(response.json()['results']), 10)
+
+
+class TravelReadSerializerParityTest(TestCase):
+    @classmethod
+    def setUpTestData(cls):
+        region = Regions.objects.create(name_uz="Buxoro", name_ru="Бухара", name_en="Bukhara")
+        travel = Travel.objects.create(title_uz="Ark", title_ru="Арк", description_uz="Tavsif",
+                                       address_uz="Manzil", region=region,
+                                       location={"latitude": 39.77, "longitude": 64.42})
+        TravelImage.objects.create(travel=travel, image="travel_images/b.jpg", position=1)
+        TravelImage.objects.create(travel=travel, image="travel_images/a.jpg", position=0,
+                                   variants={"320": {"webp": "travel_images/a_320.webp"}})
+        Travel.objects.create(title_uz="Minorai Kalon", description_uz="Tavsif", address_uz="Manzil",
+                              region=region)
+
+    def test_matches_model_serializer_in_every_language(self):
+        for lang in ('uz', 'ru', 'en'):
+            with translation.override(lang):
+                expected = TravelListSerializer(Travel.objects.with_related().order_by('id'), many=True).data
+            self.assertEqual(TravelReadSerializer(lang).serialize(Travel.objects.order_by('id')), expected)
@@ -0,0 +1,10 @@
+from rest_framework import serializers
+
+from apps.trending.models import TrendingScore
+
+
+class TrendingResultSerializer(serializers.Serializer):
+    type = serializers.ChoiceField(choices=TrendingScore.KIND_CHOICES)
+    id = serializers.IntegerField()
+    score = serializers.FloatField()
+    item = serializers.DictField()
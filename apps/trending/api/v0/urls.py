@@ -0,0 +1,9 @@
+from django.urls import path
+
+from .views import trending_view
+
+app_name = 'trending_api'
+
+urlpatterns = [
+    path('', trending_view, name='trending'),
+]
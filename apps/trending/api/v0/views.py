@@ -0,0 +1,83 @@
+from drf_spectacular.utils import extend_schema, OpenApiParameter
+from rest_framework.exceptions import ValidationError
+from rest_framework.generics import GenericAPIView
+from rest_framework.permissions import AllowAny
+from rest_framework.response import Response
+
+from apps.hotels.api.v0.serializers import HotelReadSerializer
+from apps.restaurants.api.v0.serializers import RestaurantReadSerializer
+from apps.travels.api.v0.serializers import TravelReadSerializer
+from apps.trending import ranking
+from apps.trending.models import TrendingScore
+from travelsuz_back.response_cache import CachedResponseMixin
+from .serializers import TrendingResultSerializer
+
+DEFAULT_LIMIT = 20
+MAX_LIMIT = 50
+
+READ_SERIALIZERS = {
+    TrendingScore.KIND_HOTEL: HotelReadSerializer,
+    TrendingScore.KIND_TRAVEL: TravelReadSerializer,
+    TrendingScore.KIND_RESTAURANT: RestaurantReadSerializer,
+}
+
+TRENDING_PARAMETERS = [
+    OpenApiParameter('limit', int, description=f"Natijalar soni (max {MAX_LIMIT})"),
+    OpenApiParameter('lang', str, description="Hotel nomi tili: uz, ru yoki en (qolgan maydonlar Accept-Language bo‘yicha)"),
+]
+
+
+class TrendingListView(CachedResponseMixin, GenericAPIView):
+    """TrendingScore jadvalidan top-K: katalog har so'rovda saralanmaydi."""
+    permission_classes = [AllowAny]
+    pagination_class = None
+    kind = None
+
+    def get_limit(self) -> int:
+        try:
+            limit = int(self.request.query_params.get('limit', DEFAULT_LIMIT))
+        except ValueError:
+            raise ValidationError({'limit': "limit butun son bo‘lishi kerak."})
+        return min(max(limit, 1), MAX_LIMIT)
+
+    def ranked_items(self, ranked) -> dict:
+        """{(kind, id): item} - har bir kind uchun bitta values() so'rovi."""
+        items = {}
+        for kind in {kind for kind, _, _ in ranked}:
+            read_serializer = READ_SERIALIZERS[kind].for_request(self.request)
+            ids = [pk for k, pk, _ in ranked if k == kind]
+            for item in read_serializer.serialize(read_serializer.model.objects.filter(pk__in=ids)):
+                items[kind, item['id']] = item
+        return items
+
+    def get(self, request, *args, **kwargs):
+        ranked = ranking.top(self.kind, self.get_limit())
+        items = self.ranked_items(ranked)
+        # reytingdan keyin o'chirilgan obyektlar tashlab ketiladi
+        return Response([items[kind, pk] for kind, pk, _ in ranked if (kind, pk) in items])
+
+
+class TrendingView(TrendingListView):
+    serializer_class = TrendingResultSerializer
+
+    @extend_schema(
+        tags=["Trending"],
+        summary="Hotel, travel va restaurantlar bo'yicha umumiy trending",
+        parameters=[
+            OpenApiParameter('type', str, description="hotel, travel yoki restaurant"),
+            *TRENDING_PARAMETERS,
+        ],
+    )
+    def get(self, request, *args, **kwargs):
+        kind = request.query_params.get('type') or None
+        if kind is not None and kind not in READ_SERIALIZERS:
+            raise ValidationError({'type': f"Faqat {', '.join(READ_SERIALIZERS)} bo‘lishi mumkin."})
+
+        ranked = ranking.top(kind, self.get_limit())
+        items = self.ranked_items(ranked)
+        results = [{'type': kind, 'id': pk, 'score': score, 'item': items[kind, pk]}
+                   for kind, pk, score in ranked if (kind, pk) in items]
+        return Response(self.get_serializer(results, many=True).data)
+
+
+trending_view = TrendingView.as_view()
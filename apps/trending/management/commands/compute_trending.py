@@ -0,0 +1,24 @@
+import time
+
+from django.core.management.base import BaseCommand
+
+from apps.trending import ranking
+
+
+class Command(BaseCommand):
+    help = "Trending reytingini (TrendingScore) views va commentlardan qayta hisoblash"
+
+    def add_arguments(self, parser):
+        parser.add_argument('--type', choices=list(ranking.SOURCES), help="Faqat bitta tur uchun")
+        parser.add_argument('--batch-size', type=int, default=500)
+        parser.add_argument('--interval', type=float, default=0,
+                            help="Sekund; 0 bo'lsa bir marta hisoblab to'xtaydi (cron uchun)")
+
+    def handle(self, *args, **options):
+        kinds = [options['type']] if options['type'] else None
+        while True:
+            total = ranking.compute(kinds=kinds, batch_size=options['batch_size'])
+            self.stdout.write(self.style.SUCCESS(f"Trending reytingi yangilandi: {total} ta yozuv"))
+            if not options['interval']:
+                break
+            time.sleep(options['interval'])
@@ -0,0 +1,31 @@
+# Generated by Django 5.2.3 on 2026-10-18 10:43
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    initial = True
+
+    dependencies = [
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='TrendingScore',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('kind', models.CharField(choices=[('hotel', 'Hotel'), ('travel', 'Travel'), ('restaurant', 'Restaurant')], max_length=20)),
+                ('object_id', models.PositiveBigIntegerField()),
+                ('score', models.FloatField()),
+                ('view_score', models.FloatField(default=0)),
+                ('views_total', models.PositiveIntegerField(default=0)),
+                ('comment_velocity', models.FloatField(default=0)),
+                ('computed_at', models.DateTimeField()),
+            ],
+            options={
+                'indexes': [models.Index(fields=['kind', '-score', '-object_id'], name='trending_kind_score_idx'), models.Index(fields=['-score', '-object_id'], name='trending_score_idx')],
+                'constraints': [models.UniqueConstraint(fields=('kind', 'object_id'), name='unique_trending_kind_object')],
+            },
+        ),
+    ]
@@ -0,0 +1,33 @@
+from django.db import models
+
+
+class TrendingScore(models.Model):
+    KIND_HOTEL = 'hotel'
+    KIND_TRAVEL = 'travel'
+    KIND_RESTAURANT = 'restaurant'
+    KIND_CHOICES = (
+        (KIND_HOTEL, 'Hotel'),
+        (KIND_TRAVEL, 'Travel'),
+        (KIND_RESTAURANT, 'Restaurant'),
+    )
+
+    # `manage.py compute_trending` tomonidan davriy qayta hisoblanadi, apps/trending/ranking.py
+    kind = models.CharField(max_length=20, choices=KIND_CHOICES)
+    object_id = models.PositiveBigIntegerField()
+    score = models.FloatField()
+    # vaqt o'tishi bilan so'nadigan ko'rishlar va oxirgi hisobdagi views qiymati (farqni topish uchun)
+    view_score = models.FloatField(default=0)
+    views_total = models.PositiveIntegerField(default=0)
+    # oxirgi TRENDING_COMMENT_WINDOW_DAYS kundagi kunlik o'rtacha commentlar
+    comment_velocity = models.FloatField(default=0)
+    computed_at = models.DateTimeField()
+
+    class Meta:
+        constraints = [models.UniqueConstraint(fields=['kind', 'object_id'], name='unique_trending_kind_object')]
+        indexes = [
+            models.Index(fields=['kind', '-score', '-object_id'], name='trending_kind_score_idx'),
+            models.Index(fields=['-score', '-object_id'], name='trending_score_idx'),
+        ]
+
+    def __str__(self):
+        return f"{self.kind}:{self.object_id} -> {self.score:.2f}"
@@ -0,0 +1,84 @@
+from datetime import timedelta
+
+from django.conf import settings
+from django.db import transaction
+from django.db.models import Count
+from django.utils import timezone
+
+from apps.hotels.models import Hotel, HotelComment
+from apps.restaurants.models import Restaurant, RestaurantComments
+from apps.travels.models import Travel, TravelComments
+from apps.trending.models import TrendingScore
+from travelsuz_back import response_cache
+from travelsuz_back.renderers import batched
+
+# Trending reytingi so'rov paytida hisoblanmaydi: compute() uni TrendingScore jadvaliga yozadi,
+# endpointlar esa (kind, -score) indeksidan top-K ni o'qiydi.
+#
+#   view_score = oldingi view_score * 0.5 ** (o'tgan soat / TRENDING_HALF_LIFE_HOURS) + yangi ko'rishlar
+#   score      = view_score + TRENDING_COMMENT_WEIGHT * kunlik commentlar (oxirgi oyna ichida)
+#
+# Birinchi hisobda tarix yo'q, shuning uchun jami views boshlang'ich view_score bo'ladi va keyin so'nadi.
+
+# kind -> (model, comment modeli, comment dagi FK nomi)
+SOURCES = {
+    TrendingScore.KIND_HOTEL: (Hotel, HotelComment, 'hotel'),
+    TrendingScore.KIND_TRAVEL: (Travel, TravelComments, 'travel'),
+    TrendingScore.KIND_RESTAURANT: (Restaurant, RestaurantComments, 'restaurant'),
+}
+UPDATE_FIELDS = ['score', 'view_score', 'views_total', 'comment_velocity', 'computed_at']
+
+
+def decayed(view_score, elapsed_hours) -> float:
+    return view_score * 0.5 ** (max(elapsed_hours, 0) / settings.TRENDING_HALF_LIFE_HOURS)
+
+
+def compute_kind(kind, now, batch_size=500) -> int:
+    model, comment_model, fk = SOURCES[kind]
+    window_days = settings.TRENDING_COMMENT_WINDOW_DAYS
+    comments = dict(
+        comment_model.objects.filter(created_at__gte=now - timedelta(days=window_days))
+        .order_by().values_list(f'{fk}_id').annotate(n=Count('id'))
+    )
+    previous = {
+        row['object_id']: row
+        for row in TrendingScore.objects.filter(kind=kind).values('object_id', 'view_score', 'views_total', 'computed_at')
+    }
+
+    rows = []
+    for pk, views in model.objects.order_by().values_list('pk', 'views').iterator():
+        prev = previous.pop(pk, None)
+        if prev is None:
+            view_score = float(views)
+        else:
+            elapsed = (now - prev['computed_at']).total_seconds() / 3600
+            view_score = decayed(prev['view_score'], elapsed) + max(views - prev['views_total'], 0)
+        velocity = comments.get(pk, 0) / window_days
+        rows.append(TrendingScore(
+            kind=kind, object_id=pk, view_score=view_score, views_total=views, comment_velocity=velocity,
+            score=view_score + settings.TRENDING_COMMENT_WEIGHT * velocity, computed_at=now,
+        ))
+
+    with transaction.atomic():
+        for batch in batched(rows, batch_size):
+            TrendingScore.objects.bulk_create(batch, update_conflicts=True, unique_fields=['kind', 'object_id'],
+                                              update_fields=UPDATE_FIELDS)
+        # o'chirilgan obyektlar reytingdan chiqariladi
+        for batch in batched(previous, batch_size):
+            TrendingScore.objects.filter(kind=kind, object_id__in=batch).delete()
+    return len(rows)
+
+
+def compute(kinds=None, now=None, batch_size=500) -> int:
+    now = now or timezone.now()
+    total = sum(compute_kind(kind, now, batch_size) for kind in (kinds or SOURCES))
+    response_cache.invalidate()
+    return total
+
+
+def top(kind=None, limit=20) -> list:
+    """[(kind, object_id, score), ...] reyting bo'yicha kamayish tartibida."""
+    queryset = TrendingScore.objects.all()
+    if kind:
+        queryset = queryset.filter(kind=kind)
+    return list(queryset.order_by('-score', '-object_id').values_list('kind', 'object_id', 'score')[:limit])
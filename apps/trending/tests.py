@@ -0,0 +1,61 @@
+from datetime import timedelta
+
+from django.core.cache import cache
+from django.test import TestCase
+from django.urls import reverse
+from django.utils import timezone
+
+from apps.hotels.models import Regions, Hotel, HotelComment
+from apps.travels.models import Travel
+from apps.trending import ranking
+from apps.trending.models import TrendingScore
+
+
+class TrendingTest(TestCase):
+    @classmethod
+    def setUpTestData(cls):
+        cls.region = Regions.objects.create(name_uz="Buxoro")
+        cls.old = Hotel.objects.create(title_uz="Eski", description_uz="d", address_uz="a", price=1,
+                                       region=cls.region, views=100)
+        cls.new = Hotel.objects.create(title_uz="Yangi", description_uz="d", address_uz="a", price=1,
+                                       region=cls.region, views=10)
+        cls.travel = Travel.objects.create(title_uz="Sayohat", description_uz="d", address_uz="a",
+                                           region=cls.region, views=50)
+
+    def setUp(self):
+        cache.clear()
+
+    def score(self, obj):
+        return TrendingScore.objects.get(kind='hotel', object_id=obj.pk).score
+
+    def test_views_decay_and_comments_add_velocity(self):
+        now = timezone.now()
+        ranking.compute(now=now)
+        self.assertEqual(self.score(self.old), 100)
+
+        # ikki half-life o'tdi: eski ko'rishlar 4 baravar kamayadi, yangilari to'liq qo'shiladi
+        Hotel.objects.filter(pk=self.new.pk).update(views=70)
+        HotelComment.objects.create(hotel=self.new, text="zo'r")
+        later = now + timedelta(hours=48)
+        ranking.compute(now=later)
+        self.assertAlmostEqual(self.score(self.old), 25)
+        self.assertAlmostEqual(self.score(self.new), 10 / 4 + 60 + 10.0 / 7)
+
+        self.new.delete()
+        ranking.compute(now=later)
+        self.assertFalse(TrendingScore.objects.filter(kind='hotel', object_id=self.new.pk).exists())
+
+    def test_endpoints_return_top_k_in_rank_order(self):
+        ranking.compute()
+        response = self.client.get(reverse('hotels_api:hotel_trending_view'), {'limit': 1})
+        self.assertEqual([item['id'] for item in response.json()], [self.old.pk])
+        self.assertEqual(response.json()[0]['title'], "Eski")
+
+        # travel maydonlari detail dagi kabi Accept-Language bo'yicha
+        results = self.client.get(reverse('trending_api:trending'), HTTP_ACCEPT_LANGUAGE='uz').json()
+        self.assertEqual([(r['type'], r['id']) for r in results],
+                         [('hotel', self.old.pk), ('travel', self.travel.pk), ('hotel', self.new.pk)])
+        self.assertEqual(results[1]['item']['title'], "Sayohat")
+
+        response = self.client.get(reverse('trending_api:trending'), {'type': 'museum'})
+        self.assertEqual(response.status_code, 400)
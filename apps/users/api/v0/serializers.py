@@ -5,6 +5,8 @@ from django.contrib.auth import get_user_model
 from rest_framework.exceptions import ValidationError
 from rest_framework_simplejwt.serializers import TokenObtainPairSerializer
 
+from apps.users.authentication import VersionedRefreshToken
+
 User=get_user_model()
 
 from rest_framework import serializers
@@ -61,6 +63,7 @@ class RegisterSerializer(serializers.ModelSerializer):
 
 
 class CustomTokenObtainPairSerializer(TokenObtainPairSerializer):
+    token_class = VersionedRefreshToken
     username = serializers.CharField(write_only=True)
     password = serializers.CharField(write_only=True)
 
@@ -6,10 +6,15 @@ from rest_framework.response import Response
 from rest_framework.permissions import AllowAny, IsAdminUser, IsAuthenticated
 from rest_framework.parsers import MultiPartParser, FormParser
 from rest_framework.views import APIView
-from rest_framework_simplejwt.tokens import RefreshToken, TokenError
+from rest_framework_simplejwt.tokens import TokenError
 from rest_framework_simplejwt.views import TokenObtainPairView
 from drf_spectacular.utils import extend_schema, OpenApiResponse
 
+from apps.users.authentication import VersionedRefreshToken, invalidate_user
+from travelsuz_back.pagination import UserKeysetPagination
+from travelsuz_back.renderers import StreamingListMixin
+from travelsuz_back.throttling import WRITE_THROTTLES
+
 from rest_framework.generics import UpdateAPIView
 from rest_framework.permissions import IsAuthenticated
 
@@ -29,6 +34,8 @@ class RegisterView(CreateAPIView):
     serializer_class = RegisterSerializer
     permission_classes = [AllowAny]
     parser_classes = (MultiPartParser, FormParser)
+    throttle_classes = WRITE_THROTTLES
+    throttle_scope = 'register'
 
     @extend_schema(
         tags=["Auth"],
@@ -44,7 +51,7 @@ class RegisterView(CreateAPIView):
         serializer = RegisterSerializer(data=request.data)
         if serializer.is_valid():
             user = serializer.save()
-            refresh = RefreshToken.for_user(user)
+            refresh = VersionedRefreshToken.for_user(user)
             return Response({
                 'refresh': str(refresh),
                 'access': str(refresh.access_token),
@@ -64,6 +71,8 @@ class RegisterView(CreateAPIView):
 class LoginView(TokenObtainPairView):
     serializer_class = CustomTokenObtainPairSerializer
     parser_classes = (MultiPartParser, FormParser)
+    throttle_classes = WRITE_THROTTLES
+    throttle_scope = 'login'
 
     @extend_schema(
         tags=["Auth"],
@@ -103,8 +112,9 @@ class LogoutView(APIView):
         serializer.is_valid(raise_exception=True)
         refresh_token = serializer.validated_data['refresh']
         try:
-            token = RefreshToken(refresh_token)
+            token = VersionedRefreshToken(refresh_token)
             token.blacklist()
+            invalidate_user(request.user.pk)
             return Response({"detail": "Logout bo‘ldi"}, status=status.HTTP_205_RESET_CONTENT)
         except TokenError:
             return Response({"error": "Yaroqsiz yoki muddati o‘tgan token"}, status=status.HTTP_400_BAD_REQUEST)
@@ -152,10 +162,11 @@ class UserDetailView(RetrieveAPIView):
 
 
 
-class UserListView(ListAPIView):
+class UserListView(StreamingListMixin, ListAPIView):
     queryset = User.objects.all()
     serializer_class = UserListSerializer
     permission_classes = [IsAdminUser]
+    pagination_class = UserKeysetPagination
 
     @extend_schema(
         tags=["Auth"],
@@ -0,0 +1,102 @@
+import uuid
+
+from django.conf import settings
+from django.core.cache import cache, caches
+from rest_framework.permissions import SAFE_METHODS
+from rest_framework_simplejwt.authentication import JWTAuthentication
+from rest_framework_simplejwt.exceptions import AuthenticationFailed, InvalidToken, TokenError
+from rest_framework_simplejwt.models import TokenUser
+from rest_framework_simplejwt.serializers import TokenRefreshSerializer
+from rest_framework_simplejwt.settings import api_settings
+from rest_framework_simplejwt.tokens import RefreshToken
+from rest_framework_simplejwt.utils import get_md5_hash_password
+
+from apps.users import blacklist
+
+# Har bir autentifikatsiyali so'rov CustomUser qatorini bazadan o'qimaydi. Umumiy (fayl) cache da
+# foydalanuvchining faqat kichik yozuvi turadi: stamp, is_active va parol versiyasi (hash ning md5 i).
+# To'liq CustomUser obyekti (parol hash i bilan) diskka tushmaydi: u worker ichidagi "auth"
+# LocMem aliasida stamp bilan saqlanadi. Saqlash/o'chirish/logout umumiy yozuvni o'chiradi,
+# shunda barcha workerlardagi nusxalar stamp mos kelmagani uchun qayta o'qiladi.
+# Token ichidagi SIMPLE_JWT['REVOKE_TOKEN_CLAIM'] (parol hash idan, CHECK_REVOKE_TOKEN) bilan
+# solishtiriladi: parol o'zgarsa eski tokenlar, claim i yo'q tokenlar esa umuman ishlamaydi.
+# `jwt_claims_only = True` bo'lgan view larning GET/HEAD so'rovlari bazaga umuman murojaat
+# qilmaydi, foydalanuvchi token claim laridan (TokenUser) yig'iladi.
+
+LOCAL_CACHE_ALIAS = 'auth'
+
+
+def _cache_key(user_id) -> str:
+    return f'auth:user:{user_id}'
+
+
+def invalidate_user(user_id) -> None:
+    cache.delete(_cache_key(user_id))
+
+
+class ClaimsUser(TokenUser):
+    """TokenUser ning has_perms() doim False qaytaradi; GET uchun bo'sh ruxsat ro'yxati yetarli bo'lishi kerak."""
+
+    def has_perm(self, perm, obj=None) -> bool:
+        return self.is_superuser
+
+    def has_perms(self, perm_list, obj=None) -> bool:
+        return all(self.has_perm(perm, obj) for perm in perm_list)
+
+
+class VersionedRefreshToken(RefreshToken):
+    """Claims-only rejim uchun username/is_staff claim lari qo'shilgan token."""
+
+    @classmethod
+    def for_user(cls, user):
+        token = super().for_user(user)
+        token['username'] = user.get_username()
+        token['is_staff'] = user.is_staff
+        token['is_superuser'] = user.is_superuser
+        return token
+
+    def check_blacklist(self):
+        # har refresh da bazaga bormaslik uchun avval Bloom filtr (apps/users/blacklist.py)
+        if blacklist.is_blacklisted(self.payload[api_settings.JTI_CLAIM]):
+            raise TokenError("Token bekor qilingan (blacklist)")
+
+
+class VersionedTokenRefreshSerializer(TokenRefreshSerializer):
+    token_class = VersionedRefreshToken
+
+
+class CachedJWTAuthentication(JWTAuthentication):
+    def authenticate(self, request):
+        view = (request.parser_context or {}).get('view')
+        self.claims_only = request.method in SAFE_METHODS and getattr(view, 'jwt_claims_only', False)
+        return super().authenticate(request)
+
+    def get_user(self, validated_token):
+        try:
+            user_id = validated_token[api_settings.USER_ID_CLAIM]
+        except KeyError:
+            raise InvalidToken("Tokenda foydalanuvchi identifikatori yo‘q")
+        if self.claims_only:
+            return ClaimsUser(validated_token)
+
+        key = _cache_key(user_id)
+        record = cache.get(key)
+        if record is None:
+            user = super().get_user(validated_token)
+            record = {'stamp': uuid.uuid4().hex, 'is_active': user.is_active,
+                      'version': get_md5_hash_password(user.password)}
+            cache.set(key, record, settings.AUTH_USER_CACHE_TIMEOUT)
+            caches[LOCAL_CACHE_ALIAS].set(key, (record['stamp'], user), settings.AUTH_USER_CACHE_TIMEOUT)
+            return user
+
+        if api_settings.CHECK_USER_IS_ACTIVE and not record['is_active']:
+            raise AuthenticationFailed("Foydalanuvchi faol emas", code='user_inactive')
+        if api_settings.CHECK_REVOKE_TOKEN and validated_token.get(api_settings.REVOKE_TOKEN_CLAIM) != record['version']:
+            raise AuthenticationFailed("Parol o‘zgargan, qaytadan kiring", code='password_changed')
+
+        stamp, user = caches[LOCAL_CACHE_ALIAS].get(key, (None, None))
+        if stamp != record['stamp']:
+            # yozuvni boshqa worker yaratgan: bu worker foydalanuvchini bir marta o'qiydi
+            user = super().get_user(validated_token)
+            caches[LOCAL_CACHE_ALIAS].set(key, (record['stamp'], user), settings.AUTH_USER_CACHE_TIMEOUT)
+        return user
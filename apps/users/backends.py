@@ -0,0 +1,51 @@
+import uuid
+
+from django.conf import settings
+from django.contrib.auth.backends import ModelBackend
+from django.core.cache import cache
+
+# ModelBackend ruxsatlarni faqat bitta user obyekti ichida keshlaydi, shuning uchun har bir
+# create/update/delete so'rovi auth_permission JOIN larini qaytadan bajaradi. Bu backend
+# foydalanuvchining "user" va "group" ruxsatlari to'plamini umumiy cache da saqlaydi.
+# Foydalanuvchi o'zgarsa faqat uning kaliti, guruh/ruxsat o'zgarsa "generation" almashadi.
+
+GENERATION_KEY = 'perms:generation'
+PERMISSION_SOURCES = ('user', 'group')
+
+
+def get_generation() -> str:
+    generation = cache.get(GENERATION_KEY)
+    if generation is None:
+        cache.add(GENERATION_KEY, uuid.uuid4().hex, None)
+        generation = cache.get(GENERATION_KEY)
+    return generation
+
+
+def _cache_key(user_id) -> str:
+    return f'perms:{get_generation()}:{user_id}'
+
+
+def invalidate_permissions(user_ids) -> None:
+    cache.delete_many([_cache_key(user_id) for user_id in user_ids])
+
+
+def invalidate_all_permissions(**kwargs) -> None:
+    cache.set(GENERATION_KEY, uuid.uuid4().hex, None)
+
+
+class CachedModelBackend(ModelBackend):
+    def _get_permissions(self, user_obj, obj, from_name):
+        if not user_obj.is_active or user_obj.is_anonymous or obj is not None:
+            return set()
+
+        perm_cache_name = f'_{from_name}_perm_cache'
+        if not hasattr(user_obj, perm_cache_name):
+            key = _cache_key(user_obj.pk)
+            cached = cache.get(key)
+            if cached is None:
+                cached = {name: super(CachedModelBackend, self)._get_permissions(user_obj, obj, name)
+                          for name in PERMISSION_SOURCES}
+                cache.set(key, cached, settings.PERMISSION_CACHE_TIMEOUT)
+            for name, perms in cached.items():
+                setattr(user_obj, f'_{name}_perm_cache', perms)
+        return getattr(user_obj, perm_cache_name)
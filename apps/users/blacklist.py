@@ -0,0 +1,133 @@
+import hashlib
+import math
+import threading
+import uuid
+from datetime import timedelta
+
+from django.conf import settings
+from django.core.cache import cache
+from django.db import transaction
+from django.utils import timezone
+from rest_framework_simplejwt.token_blacklist.models import BlacklistedToken, OutstandingToken
+
+# Refresh token blacklist tekshiruvi har safar bazaga bormaydi: har bir worker blacklistdagi
+# jti larning Bloom filtrini xotirada saqlaydi. Filtrda yo'q jti aniq blacklistda emas;
+# filtr "bor" desa (yoki false positive) bazada aniq tekshiriladi.
+# Workerlar umumiy cache dagi ikki kalit orqali sinxronlanadi:
+#   epoch   - compaction dan keyin o'zgaradi, filtr bazadan to'liq qayta quriladi
+#   version - yangi token blacklistga tushganda o'zgaradi, faqat so'nggi yozuvlar qo'shiladi
+
+EPOCH_KEY = 'token_blacklist:epoch'
+VERSION_KEY = 'token_blacklist:version'
+# uzun tranzaksiyalar kechroq commit bo'lishi mumkin, shuning uchun oxirgi sinxronlashdan oldingi
+# shuncha vaqt ham qayta o'qiladi
+SYNC_OVERLAP = timedelta(seconds=60)
+
+
+class BloomFilter:
+    def __init__(self, capacity, error_rate=0.01):
+        self.capacity = max(capacity, 1)
+        self.size = math.ceil(-self.capacity * math.log(error_rate) / math.log(2) ** 2)
+        self.hashes = max(1, round(self.size / self.capacity * math.log(2)))
+        self.bits = bytearray((self.size + 7) // 8)
+        self.count = 0
+
+    def _positions(self, value):
+        digest = hashlib.blake2b(value.encode(), digest_size=16).digest()
+        h1, h2 = int.from_bytes(digest[:8], 'little'), int.from_bytes(digest[8:], 'little')
+        return ((h1 + i * h2) % self.size for i in range(self.hashes))
+
+    def add(self, value) -> None:
+        for position in self._positions(value):
+            self.bits[position >> 3] |= 1 << (position & 7)
+        self.count += 1
+
+    def __contains__(self, value) -> bool:
+        return all(self.bits[position >> 3] & (1 << (position & 7)) for position in self._positions(value))
+
+
+class BlacklistIndex:
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._bloom = None
+        self._state = (None, None)
+        self._synced_at = None
+
+    def _shared_state(self):
+        state = cache.get_many([EPOCH_KEY, VERSION_KEY])
+        if EPOCH_KEY not in state:
+            cache.add(EPOCH_KEY, uuid.uuid4().hex, None)
+            state = cache.get_many([EPOCH_KEY, VERSION_KEY])
+        return state.get(EPOCH_KEY), state.get(VERSION_KEY)
+
+    def _load(self, since=None):
+        queryset = BlacklistedToken.objects.order_by()
+        if since is not None:
+            queryset = queryset.filter(blacklisted_at__gte=since - SYNC_OVERLAP)
+        return queryset.values_list('token__jti', flat=True).iterator()
+
+    def _rebuild(self, state) -> None:
+        started = timezone.now()
+        jtis = list(self._load())
+        bloom = BloomFilter(max(len(jtis) * 2, settings.TOKEN_BLACKLIST_BLOOM_CAPACITY))
+        for jti in jtis:
+            bloom.add(jti)
+        self._bloom, self._state, self._synced_at = bloom, state, started
+
+    def sync(self) -> None:
+        state = self._shared_state()
+        if state == self._state and self._bloom is not None:
+            return
+        with self._lock:
+            if self._bloom is None or state[0] != self._state[0] or self._bloom.count >= self._bloom.capacity:
+                self._rebuild(state)
+            elif state != self._state:
+                started = timezone.now()
+                for jti in self._load(self._synced_at):
+                    self._bloom.add(jti)
+                self._state, self._synced_at = state, started
+
+    def add(self, jti) -> None:
+        """Shu worker darhol, qolganlari commit dan keyingi sync() da ko'radi."""
+        if self._bloom is not None:
+            with self._lock:
+                self._bloom.add(jti)
+        # commit dan oldin bump qilinsa boshqa worker yozuvni hali ko'rmay turib version ni
+        # qabul qilib oladi va keyingi bump gacha bu jti ni o'tkazib yuboradi
+        transaction.on_commit(lambda: cache.set(VERSION_KEY, uuid.uuid4().hex, None))
+
+    def contains(self, jti) -> bool:
+        self.sync()
+        if jti not in self._bloom:
+            return False
+        return BlacklistedToken.objects.filter(token__jti=jti).exists()
+
+    def reset(self) -> None:
+        """Compaction dan keyin barcha workerlar filtrni qayta quradi."""
+        cache.set(EPOCH_KEY, uuid.uuid4().hex, None)
+
+
+index = BlacklistIndex()
+
+
+def is_blacklisted(jti) -> bool:
+    return index.contains(jti)
+
+
+def compact(batch_size=1000, now=None) -> int:
+    """Muddati o'tgan outstanding (va ularning blacklist) tokenlarini partiyalab o'chirish."""
+    now = now or timezone.now()
+    deleted = 0
+    while True:
+        ids = list(OutstandingToken.objects.filter(expires_at__lte=now)
+                   .order_by('id').values_list('id', flat=True)[:batch_size])
+        if not ids:
+            break
+        # har partiya alohida tranzaksiya: jadval uzoq vaqt lock bo'lib qolmaydi
+        with transaction.atomic():
+            BlacklistedToken.objects.filter(token_id__in=ids).delete()
+            OutstandingToken.objects.filter(id__in=ids).delete()
+        deleted += len(ids)
+    if deleted:
+        index.reset()
+    return deleted
@@ -0,0 +1,22 @@
+import time
+
+from django.core.management.base import BaseCommand
+
+from apps.users import blacklist
+
+
+class Command(BaseCommand):
+    help = "Muddati o'tgan outstanding va blacklist tokenlarini partiyalab o'chirish (cron uchun)"
+
+    def add_arguments(self, parser):
+        parser.add_argument('--batch-size', type=int, default=1000)
+        parser.add_argument('--interval', type=float, default=0,
+                            help="Sekund; 0 bo'lsa bir marta tozalab to'xtaydi")
+
+    def handle(self, *args, **options):
+        while True:
+            deleted = blacklist.compact(batch_size=options['batch_size'])
+            self.stdout.write(self.style.SUCCESS(f"{deleted} ta muddati o'tgan token o'chirildi"))
+            if not options['interval']:
+                break
+            time.sleep(options['interval'])
@@ -1,3 +1,215 @@
+import json
+from datetime import timedelta
+from decimal import Decimal
+from io import StringIO
+from unittest import mock
+
+from django.contrib.auth import get_user_model
+from django.core.cache import cache, caches
+from django.core.management import call_command
+from django.db import connection
 from django.test import TestCase
+from django.test.utils import CaptureQueriesContext
+from django.urls import reverse
+from django.utils import timezone
+from rest_framework.renderers import JSONRenderer
+from rest_framework.test import APIClient
+from rest_framework_simplejwt.token_blacklist.models import BlacklistedToken, OutstandingToken
+
+from apps.users.api.v0.views import UserListView
+from apps.users.authentication import VersionedRefreshToken
+from apps.users.blacklist import BloomFilter
+from travelsuz_back.renderers import FastJSONRenderer
+
+
+class FastJSONRendererTest(TestCase):
+    def test_output_matches_drf_renderer(self):
+        data = {'title': "Registon – Самарканд", 'price': Decimal('10.50'), 'items': [1, None, True],
+                'text': "a\u2028b"}
+        self.assertEqual(FastJSONRenderer().render(data), JSONRenderer().render(data))
+
+
+class UserListStreamingTest(TestCase):
+    @classmethod
+    def setUpTestData(cls):
+        User = get_user_model()
+        cls.admin = User.objects.create_superuser(username='admin', password='parol12345', email='a@a.uz')
+        for i in range(7):
+            User.objects.create_user(username=f'user{i}', password='parol12345')
+
+    def test_stream_returns_every_user_as_one_array(self):
+        client = APIClient()
+        client.force_authenticate(self.admin)
+        url = reverse('users_api:user_list')
+
+        with mock.patch.object(UserListView, 'stream_batch_size', 3):
+            response = client.get(url, {'stream': 1})
+        self.assertTrue(response.streaming)
+        users = json.loads(b''.join(response.streaming_content))
+        self.assertEqual(len(users), 8)
+
+        paged = client.get(url, {'page_size': 100}).json()['results']
+        self.assertEqual(users, paged)
+
+
+class CachedJWTAuthenticationTest(TestCase):
+    @classmethod
+    def setUpTestData(cls):
+        cls.user = get_user_model().objects.create_user(username='ali', password='parol12345')
+
+    def setUp(self):
+        cache.clear()
+        caches['auth'].clear()
+        self.refresh = VersionedRefreshToken.for_user(self.user)
+        self.client = APIClient()
+        self.client.credentials(HTTP_AUTHORIZATION=f'Bearer {self.refresh.access_token}')
+
+    def user_selects(self, url):
+        with CaptureQueriesContext(connection) as ctx:
+            response = self.client.get(url)
+        self.assertEqual(response.status_code, 200)
+        return sum('"users_customuser"' in q['sql'] for q in ctx.captured_queries)
+
+    def test_user_is_loaded_once_and_invalidated_on_save(self):
+        url = reverse('users_api:user_detail')
+        self.assertEqual(self.user_selects(url), 1)
+        self.assertEqual(self.user_selects(url), 0)
+
+        self.user.first_name = "Vali"
+        self.user.save()
+        self.assertEqual(self.client.get(url).json()['first_name'], "Vali")
+
+    def test_shared_cache_keeps_no_password_hash(self):
+        url = reverse('users_api:user_detail')
+        self.client.get(url)
+        record = cache.get(f'auth:user:{self.user.pk}')
+        self.assertEqual(set(record), {'stamp', 'is_active', 'version'})
+        self.assertNotIn(self.user.password, repr(record))
+
+        # boshqa worker: umumiy yozuv bor, lekin xotirasida foydalanuvchi yo'q
+        caches['auth'].clear()
+        self.assertEqual(self.user_selects(url), 1)
+        self.assertEqual(self.user_selects(url), 0)
+
+    def test_password_change_revokes_old_tokens(self):
+        url = reverse('users_api:user_detail')
+        self.client.get(url)
+        self.user.set_password('yangi-parol-1')
+        self.user.save()
+        self.assertEqual(self.client.get(url).status_code, 401)
+
+    def test_token_without_revoke_claim_is_rejected(self):
+        from rest_framework_simplejwt.settings import api_settings
+        url = reverse('users_api:user_detail')
+        self.client.get(url)
+        access = self.refresh.access_token
+        del access[api_settings.REVOKE_TOKEN_CLAIM]
+        self.client.credentials(HTTP_AUTHORIZATION=f'Bearer {access}')
+        self.assertEqual(self.client.get(url).status_code, 401)
+
+    def test_stock_token_endpoint_tokens_pass_revoke_check(self):
+        response = self.client.post(reverse('token_obtain_pair'), {'username': 'ali', 'password': 'parol12345'})
+        self.client.credentials(HTTP_AUTHORIZATION=f"Bearer {response.json()['access']}")
+        self.assertEqual(self.client.get(reverse('users_api:user_detail')).status_code, 200)
+
+    def test_logout_drops_cached_user(self):
+        self.client.get(reverse('users_api:user_detail'))
+        response = self.client.post(reverse('users_api:logout'), {'refresh': str(self.refresh)})
+        self.assertEqual(response.status_code, 205)
+        self.assertIsNone(cache.get(f'auth:user:{self.user.pk}'))
+
+    def test_cached_read_endpoints_use_token_claims_only(self):
+        self.assertEqual(self.user_selects(reverse('hotels_api:hotels_views')), 0)
+
+
+class TokenBlacklistTest(TestCase):
+    @classmethod
+    def setUpTestData(cls):
+        cls.user = get_user_model().objects.create_user(username='ali', password='parol12345')
+
+    def setUp(self):
+        cache.clear()
+
+    def refresh(self, token):
+        return self.client.post(reverse('token_refresh'), {'refresh': str(token)})
+
+    def test_refresh_skips_blacklist_query_and_rejects_after_logout(self):
+        token = VersionedRefreshToken.for_user(self.user)
+        self.assertEqual(self.refresh(token).status_code, 200)
+        with CaptureQueriesContext(connection) as ctx:
+            self.assertEqual(self.refresh(token).status_code, 200)
+        self.assertFalse(any('token_blacklist_blacklistedtoken' in q['sql'] for q in ctx.captured_queries))
+
+        client = APIClient()
+        client.credentials(HTTP_AUTHORIZATION=f'Bearer {token.access_token}')
+        client.post(reverse('users_api:logout'), {'refresh': str(token)})
+        self.assertEqual(self.refresh(token).status_code, 401)
+
+    def test_version_is_bumped_after_commit(self):
+        from apps.users.blacklist import VERSION_KEY
+        token = VersionedRefreshToken.for_user(self.user)
+        cache.set(VERSION_KEY, 'old', None)
+        with self.captureOnCommitCallbacks(execute=False) as callbacks:
+            token.blacklist()
+        self.assertEqual(cache.get(VERSION_KEY), 'old')
+        for callback in callbacks:
+            callback()
+        self.assertNotEqual(cache.get(VERSION_KEY), 'old')
+
+    def test_bloom_filter_has_no_false_negatives(self):
+        bloom = BloomFilter(1000)
+        values = [f'jti-{i}' for i in range(1000)]
+        for value in values:
+            bloom.add(value)
+        self.assertTrue(all(value in bloom for value in values))
+        false_positives = sum(f'other-{i}' in bloom for i in range(10000))
+        self.assertLess(false_positives, 300)
+
+    def test_compaction_purges_expired_tokens_in_batches(self):
+        tokens = [VersionedRefreshToken.for_user(self.user) for _ in range(5)]
+        tokens[0].blacklist()
+        OutstandingToken.objects.filter(jti__in=[t['jti'] for t in tokens[:3]]).update(
+            expires_at=timezone.now() - timedelta(days=1))
+
+        call_command('compact_token_blacklist', batch_size=2, stdout=StringIO())
+        self.assertEqual(OutstandingToken.objects.count(), 2)
+        self.assertFalse(BlacklistedToken.objects.exists())
+
+
+class PermissionCacheTest(TestCase):
+    @classmethod
+    def setUpTestData(cls):
+        from django.contrib.auth.models import Group, Permission
+        cls.user = get_user_model().objects.create_user(username='editor', password='parol12345')
+        cls.group = Group.objects.create(name='editors')
+        cls.permission = Permission.objects.get(codename='add_hotel')
+        cls.group.permissions.add(cls.permission)
+        cls.user.groups.add(cls.group)
+
+    def setUp(self):
+        cache.clear()
+
+    def has_perm(self, perm='hotels.add_hotel'):
+        # har so'rovdagi kabi yangi user obyekti
+        user = get_user_model().objects.get(pk=self.user.pk)
+        with CaptureQueriesContext(connection) as ctx:
+            result = user.has_perm(perm)
+        return result, sum('auth_permission' in q['sql'] for q in ctx.captured_queries)
+
+    def test_permissions_are_cached_across_requests(self):
+        self.assertEqual(self.has_perm(), (True, 2))
+        self.assertEqual(self.has_perm(), (True, 0))
+        self.assertEqual(self.has_perm('hotels.delete_hotel'), (False, 0))
+
+    def test_group_and_membership_changes_invalidate(self):
+        self.has_perm()
+        self.group.permissions.remove(self.permission)
+        self.assertFalse(self.has_perm()[0])
+
+        self.group.permissions.add(self.permission)
+        self.assertTrue(self.has_perm()[0])
+        self.group.user_set.remove(self.user)
+        self.assertFalse(self.has_perm()[0])
 
-# Create your tests here.
+        self.user.user_permissions.add(self.permission)
+        self.assertTrue(self.has_perm()[0])
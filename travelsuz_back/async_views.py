@@ -0,0 +1,93 @@
+from django.conf import settings
+from django.http import HttpResponse
+from django.views import View
+from rest_framework.exceptions import ValidationError
+from rest_framework.utils.urls import remove_query_param, replace_query_param
+
+from travelsuz_back import view_counter
+from travelsuz_back.renderers import FastJSONRenderer
+
+# ASGI (uvicorn) ostida thread band qilmaydigan faqat o'qish uchun endpointlar.
+# DRF view lari async emas, shuning uchun bular oddiy Django `async def` view lari:
+# ma'lumot async ORM va ReadOnlySerializer.aserialize() bilan olinadi.
+# Sahifalash limit/offset ko'rinishida: {"count", "next", "previous", "results"}.
+
+MAX_LIMIT = 100
+
+
+def json_response(data, status=200):
+    return HttpResponse(FastJSONRenderer().render(data), status=status, content_type='application/json')
+
+
+def _positive_int(value, default, cutoff=None):
+    try:
+        value = int(value)
+    except (TypeError, ValueError):
+        return default
+    if value < 0:
+        return default
+    return min(value, cutoff) if cutoff else value
+
+
+class AsyncListView(View):
+    http_method_names = ['get', 'head', 'options']
+    read_serializer_class = None
+    filterset_class = None
+    ordering = ('-created_at', '-id')
+    paginate = True
+
+    def get_queryset(self):
+        return self.read_serializer_class.model.objects.all()
+
+    def get_read_serializer(self, request):
+        return self.read_serializer_class.for_request(request)
+
+    def filter_queryset(self, queryset):
+        if self.filterset_class is None:
+            return queryset
+        filterset = self.filterset_class(self.request.GET, queryset=queryset, request=self.request)
+        if not filterset.is_valid():
+            raise ValidationError(filterset.errors)
+        return filterset.qs
+
+    async def get(self, request, *args, **kwargs):
+        try:
+            queryset = self.filter_queryset(self.get_queryset())
+        except ValidationError as exc:
+            return json_response(exc.detail, status=400)
+        if self.ordering and not queryset.query.order_by:
+            queryset = queryset.order_by(*self.ordering)
+
+        serializer = self.get_read_serializer(request)
+        if not self.paginate:
+            return json_response(await serializer.aserialize(queryset))
+
+        limit = _positive_int(request.GET.get('limit'), settings.REST_FRAMEWORK['PAGE_SIZE'], MAX_LIMIT) or 1
+        offset = _positive_int(request.GET.get('offset'), 0)
+        count = await queryset.acount()
+        results = await serializer.aserialize(queryset[offset:offset + limit])
+        url = request.build_absolute_uri()
+        return json_response({
+            'count': count,
+            'next': replace_query_param(url, 'offset', offset + limit) if offset + limit < count else None,
+            'previous': (None if offset <= 0 else
+                         remove_query_param(url, 'offset') if offset - limit <= 0 else
+                         replace_query_param(url, 'offset', offset - limit)),
+            'results': results,
+        })
+
+
+class AsyncDetailView(View):
+    http_method_names = ['get', 'head', 'options']
+    read_serializer_class = None
+    not_found_message = "Topilmadi."
+    count_views = True
+
+    async def get(self, request, pk, *args, **kwargs):
+        model = self.read_serializer_class.model
+        data = await self.read_serializer_class.for_request(request).aserialize(model.objects.filter(pk=pk))
+        if not data:
+            return json_response({'detail': self.not_found_message}, status=404)
+        if self.count_views:
+            await view_counter.arecord_view(model, pk)
+        return json_response(data[0])
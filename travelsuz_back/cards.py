@@ -0,0 +1,106 @@
+from django.db.models import F, FilteredRelation, Q
+from django.db.models.signals import post_save, post_delete
+from django.http import HttpResponse
+
+from travelsuz_back.renderers import FastJSONRenderer, StreamingListMixin, batched
+
+# Ro'yxat endpointlari har bir yozuvni har so'rovda serializer orqali qayta yig'maydi:
+# har bir til juftligi uchun tayyor JSON ("card") alohida jadvalda saqlanadi va sahifa bitta
+# LEFT JOIN bilan o'qiladi. Manba o'zgarsa card o'chiriladi va keyingi o'qishda qayta yig'iladi.
+# Juftlik (lang, region_lang) read serializerning for_request() idan olinadi, shuning uchun
+# ro'yxat detail bilan bir xil til manbalariga (?lang, Accept-Language) amal qiladi.
+
+_registry = {}
+
+
+def invalidate(model, pks) -> None:
+    card_model = _registry.get(model)
+    if card_model is None or not pks:
+        return
+    card_model.objects.filter(**{f'{_fk_name(card_model)}__in': list(pks)}).delete()
+
+
+def _fk_name(card_model) -> str:
+    return next(f.name for f in card_model._meta.concrete_fields
+                if f.is_relation and f.remote_field.related_name == 'cards')
+
+
+def register(model, card_model) -> None:
+    _registry[model] = card_model
+    image_model = model._meta.get_field('images').related_model
+    label = model._meta.label_lower
+
+    def parent_changed(sender, instance, **kwargs):
+        invalidate(model, [instance.pk])
+
+    def image_changed(sender, instance, **kwargs):
+        invalidate(model, [getattr(instance, image_model.parent_field().attname)])
+
+    def region_changed(sender, instance, **kwargs):
+        invalidate(model, model.objects.filter(region=instance).values_list('pk', flat=True))
+
+    post_save.connect(parent_changed, sender=model, weak=False, dispatch_uid=f'cards_{label}')
+    post_save.connect(image_changed, sender=image_model, weak=False, dispatch_uid=f'cards_save_{label}_images')
+    post_delete.connect(image_changed, sender=image_model, weak=False, dispatch_uid=f'cards_delete_{label}_images')
+    post_save.connect(region_changed, sender=model._meta.get_field('region').related_model, weak=False,
+                      dispatch_uid=f'cards_{label}_region')
+
+
+def build(model, read_serializer, queryset) -> dict:
+    card_model = _registry[model]
+    renderer = FastJSONRenderer()
+    payloads = {item['id']: renderer.render(item).decode() for item in read_serializer.serialize(queryset)}
+    card_model.objects.bulk_create(
+        [card_model(**{f'{_fk_name(card_model)}_id': pk}, lang=read_serializer.lang,
+                    region_lang=read_serializer.region_lang, payload=payload)
+         for pk, payload in payloads.items()],
+        update_conflicts=True,
+        unique_fields=[_fk_name(card_model), 'lang', 'region_lang'],
+        update_fields=['payload', 'updated_at'],
+    )
+    return payloads
+
+
+class CardListMixin(StreamingListMixin):
+    """ListAPIView uchun: JSON javobni tayyor card lardan yig'adi."""
+    read_serializer_class = None
+
+    def uses_cards(self, request) -> bool:
+        return (self.read_serializer_class is not None and self.get_queryset().model in _registry
+                and getattr(request.accepted_renderer, 'format', None) == 'json')
+
+    def card_queryset(self, queryset, read_serializer):
+        condition = Q(cards__lang=read_serializer.lang, cards__region_lang=read_serializer.region_lang)
+        return queryset.select_related(None).prefetch_related(None).only('pk', 'created_at').annotate(
+            card_row=FilteredRelation('cards', condition=condition),
+            card=F('card_row__payload'),
+        )
+
+    def card_payloads(self, rows, read_serializer) -> list:
+        missing = [obj.pk for obj in rows if obj.card is None]
+        if missing:
+            model = self.get_queryset().model
+            built = build(model, read_serializer, model.objects.filter(pk__in=missing))
+            for obj in rows:
+                if obj.card is None:
+                    obj.card = built[obj.pk]
+        return [obj.card.encode() for obj in rows]
+
+    def stream_chunks(self, queryset):
+        if not self.uses_cards(self.request):
+            return super().stream_chunks(queryset)
+        # til shu yerda (view ichida) olinadi: generator javob qaytgandan keyin ishlaydi
+        read_serializer = self.read_serializer_class.for_request(self.request)
+        rows = self.card_queryset(queryset, read_serializer).iterator(chunk_size=self.stream_batch_size)
+        return (b','.join(self.card_payloads(batch, read_serializer))
+                for batch in batched(rows, self.stream_batch_size))
+
+    def list(self, request, *args, **kwargs):
+        if not self.uses_cards(request) or self.wants_stream(request):
+            return super().list(request, *args, **kwargs)
+
+        read_serializer = self.read_serializer_class.for_request(request)
+        page = self.paginate_queryset(self.card_queryset(self.filter_queryset(self.get_queryset()), read_serializer))
+        items = b'[' + b','.join(self.card_payloads(page, read_serializer)) + b']'
+        envelope = request.accepted_renderer.render(self.get_paginated_response([]).data)
+        return HttpResponse(envelope[:-len(b'[]}')] + items + b'}', content_type='application/json')
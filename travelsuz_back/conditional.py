@@ -0,0 +1,84 @@
+import hashlib
+
+from django.db.models import Count, Max
+from django.db.models.signals import post_save, post_delete
+from django.utils import timezone, translation
+from django.utils.cache import get_conditional_response, patch_vary_headers, quote_etag
+from django.utils.http import http_date
+
+# ETag / Last-Modified filterlangan queryset ning max(updated_at) va soni bo'yicha hisoblanadi.
+# Mijoz yuborgan If-None-Match / If-Modified-Since mos kelsa, serializer umuman ishlamaydi (304).
+# Rasm qo'shilsa/o'chirilsa/tartibi o'zgarsa ota yozuvning updated_at i yangilanadi, aks holda
+# javobdagi images o'zgarsa ham ETag eskisicha qolardi.
+
+
+def touch_parent(image_model, parent_ids) -> None:
+    parent_ids = [pk for pk in parent_ids if pk is not None]
+    if parent_ids:
+        image_model.parent_field().related_model.objects.filter(pk__in=parent_ids).update(updated_at=timezone.now())
+
+
+def track_images(image_model) -> None:
+    attname = image_model.parent_field().attname
+
+    def image_changed(sender, instance, **kwargs):
+        touch_parent(image_model, [getattr(instance, attname)])
+
+    label = image_model._meta.label_lower
+    post_save.connect(image_changed, sender=image_model, weak=False, dispatch_uid=f'conditional_save_{label}')
+    post_delete.connect(image_changed, sender=image_model, weak=False, dispatch_uid=f'conditional_delete_{label}')
+
+
+def conditional_headers(response, etag, last_modified):
+    if etag:
+        response['ETag'] = etag
+    if last_modified:
+        response['Last-Modified'] = http_date(last_modified)
+    patch_vary_headers(response, ['Accept-Language'])
+    return response
+
+
+class ConditionalGetMixin:
+    validator_fields = ('updated_at', 'region__updated_at')
+
+    def get_validators(self, request, *args, **kwargs):
+        queryset = self.get_queryset().order_by()
+        lookup = self.kwargs.get(getattr(self, 'lookup_field', 'pk'))
+        if lookup is not None:
+            queryset = queryset.filter(pk=lookup)
+        else:
+            queryset = self.filter_queryset(queryset).order_by()
+
+        aggregates = {f'last_{i}': Max(field) for i, field in enumerate(self.validator_fields)}
+        row = queryset.aggregate(count=Count('pk'), **aggregates)
+        if not row['count']:
+            return None, None
+
+        stamps = [row[f'last_{i}'] for i in range(len(self.validator_fields))]
+        raw = '|'.join([
+            request.path,
+            request.META.get('QUERY_STRING', ''),
+            translation.get_language() or '',
+            str(row['count']),
+            *(stamp.isoformat() if stamp else '' for stamp in stamps),
+        ])
+        etag = quote_etag(hashlib.md5(raw.encode()).hexdigest())
+        last_modified = max((stamp for stamp in stamps if stamp), default=None)
+        return etag, int(last_modified.timestamp()) if last_modified else None
+
+    def on_not_modified(self, request, *args, **kwargs) -> None:
+        # CachedResponseMixin.on_cache_hit bilan bir xil: 304 ham ko'rish hisoblanadi
+        on_cache_hit = getattr(self, 'on_cache_hit', None)
+        if on_cache_hit is not None:
+            on_cache_hit(request, *args, **kwargs)
+
+    def get(self, request, *args, **kwargs):
+        etag, last_modified = self.get_validators(request, *args, **kwargs)
+        response = get_conditional_response(request, etag=etag, last_modified=last_modified)
+        if response is None:
+            response = super().get(request, *args, **kwargs)
+        elif response.status_code == 304:
+            self.on_not_modified(request, *args, **kwargs)
+        if response.status_code in (200, 304):
+            conditional_headers(response, etag, last_modified)
+        return response
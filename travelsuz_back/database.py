@@ -0,0 +1,73 @@
+import os
+
+# DATABASES sozlamasi environment o'zgaruvchilaridan yig'iladi:
+#   DB_ENGINE=sqlite (default, dev uchun) yoki postgres (production)
+#   DB_NAME, DB_USER, DB_PASSWORD, DB_HOST, DB_PORT
+#   DB_CONN_MAX_AGE (sekund, default 60), DB_CONN_HEALTH_CHECKS (default true)
+#   DB_POOL=true -> psycopg connection pool (DB_POOL_MIN_SIZE, DB_POOL_MAX_SIZE, DB_POOL_TIMEOUT)
+#   DB_REPLICA_HOST / DB_REPLICA_NAME -> faqat o'qish uchun "replica" alias
+#   DB_SQLITE_TIMEOUT (busy_timeout, sekund, default 20)
+
+TRUE_VALUES = ('1', 'true', 'yes', 'on')
+
+
+def env_bool(env, name, default=False) -> bool:
+    value = env.get(name)
+    return default if value is None else value.strip().lower() in TRUE_VALUES
+
+
+def _sqlite(env, base_dir, name) -> dict:
+    return {
+        'ENGINE': 'django.db.backends.sqlite3',
+        'NAME': name or base_dir / 'db.sqlite3',
+        'OPTIONS': {
+            # WAL: o'qish yozishni bloklamaydi; busy timeout: "database is locked" o'rniga kutadi
+            'init_command': 'PRAGMA journal_mode=WAL; PRAGMA synchronous=NORMAL;',
+            'timeout': int(env.get('DB_SQLITE_TIMEOUT', 20)),
+            # yozuvchi tranzaksiya lock ni boshida oladi, shared -> exclusive deadlock bo'lmaydi
+            'transaction_mode': 'IMMEDIATE',
+        },
+    }
+
+
+def _postgres(env, prefix='DB_') -> dict:
+    def get(name, default=None):
+        return env.get(f'{prefix}{name}', env.get(f'DB_{name}', default))
+
+    config = {
+        'ENGINE': 'django.db.backends.postgresql',
+        'NAME': get('NAME', 'travelsuz'),
+        'USER': get('USER', 'travelsuz'),
+        'PASSWORD': get('PASSWORD', ''),
+        'HOST': get('HOST', 'localhost'),
+        'PORT': get('PORT', '5432'),
+        'CONN_MAX_AGE': int(env.get('DB_CONN_MAX_AGE', 60)),
+        'CONN_HEALTH_CHECKS': env_bool(env, 'DB_CONN_HEALTH_CHECKS', True),
+        'OPTIONS': {},
+    }
+    if get('SSLMODE'):
+        config['OPTIONS']['sslmode'] = get('SSLMODE')
+    if env_bool(env, 'DB_POOL'):
+        # pool bilan doimiy ulanish (CONN_MAX_AGE) ishlatib bo'lmaydi, ulanishni pool o'zi saqlaydi
+        config['CONN_MAX_AGE'] = 0
+        config['OPTIONS']['pool'] = {
+            'min_size': int(env.get('DB_POOL_MIN_SIZE', 2)),
+            'max_size': int(env.get('DB_POOL_MAX_SIZE', 10)),
+            'timeout': int(env.get('DB_POOL_TIMEOUT', 10)),
+        }
+    return config
+
+
+def database_settings(base_dir, env=os.environ) -> dict:
+    engine = env.get('DB_ENGINE', 'sqlite').strip().lower()
+    if engine in ('postgres', 'postgresql'):
+        databases = {'default': _postgres(env)}
+        if env.get('DB_REPLICA_HOST'):
+            databases['replica'] = {**_postgres(env, prefix='DB_REPLICA_'), 'TEST': {'MIRROR': 'default'}}
+    elif engine == 'sqlite':
+        databases = {'default': _sqlite(env, base_dir, env.get('DB_NAME'))}
+        if env.get('DB_REPLICA_NAME'):
+            databases['replica'] = {**_sqlite(env, base_dir, env['DB_REPLICA_NAME']), 'TEST': {'MIRROR': 'default'}}
+    else:
+        raise ValueError(f"DB_ENGINE noto'g'ri: {engine!r} (sqlite yoki postgres)")
+    return databases
@@ -0,0 +1,56 @@
+from contextlib import contextmanager
+from contextvars import ContextVar
+
+from django.db import connections
+
+# Katalog (hotels, travels, restaurants) o'qishlari "replica" aliasidan, yozishlar doim
+# "default" dan. Replica faqat ReplicaRoutingMiddleware yoqqan GET/HEAD so'rovlarda ishlatiladi.
+# So'rov ichida birinchi yozishdan keyin qolgan o'qishlar ham primary ga boradi
+# (read-your-writes), yozgan mijoz esa REPLICA_PIN_SECONDS davomida cookie orqali primary da qoladi.
+
+REPLICA = 'replica'
+CATALOG_APPS = frozenset({'hotels', 'travels', 'restaurants'})
+
+_replica_reads = ContextVar('replica_reads', default=False)
+_pinned = ContextVar('pinned_to_primary', default=False)
+
+
+def replica_configured() -> bool:
+    return REPLICA in connections.settings
+
+
+@contextmanager
+def replica_reads():
+    """Blok ichida katalog o'qishlarini replica ga yo'naltirish."""
+    enabled, pinned = _replica_reads.set(True), _pinned.set(False)
+    try:
+        yield
+    finally:
+        _replica_reads.reset(enabled)
+        _pinned.reset(pinned)
+
+
+def pin_primary() -> None:
+    _pinned.set(True)
+
+
+class ReplicaRouter:
+    def db_for_read(self, model, **hints):
+        if model._meta.app_label not in CATALOG_APPS:
+            return None
+        if _replica_reads.get() and not _pinned.get() and replica_configured():
+            return REPLICA
+        # replica dan olingan obyektning relation lari ham primary dan o'qilsin
+        return 'default'
+
+    def db_for_write(self, model, **hints):
+        pin_primary()
+        return 'default'
+
+    def allow_relation(self, obj1, obj2, **hints):
+        # replica primary ning nusxasi: ikkala bazadagi obyektlar bir xil
+        return True
+
+    def allow_migrate(self, db, app_label, model_name=None, **hints):
+        # replica ga sxema replikatsiya orqali keladi
+        return db != REPLICA
@@ -0,0 +1,121 @@
+import csv
+import datetime
+import json
+from decimal import Decimal
+
+from django.apps import apps
+from django.utils import timezone
+from django.utils.dateparse import parse_datetime
+from modeltranslation.translator import NotRegistered, translator
+from rest_framework.exceptions import ValidationError
+
+# Katalogni hamkorlar uchun to'liq (yoki `since` dan keyin o'zgargan qismini) NDJSON/CSV
+# ko'rinishida oqim bilan eksport qilish. Har bir til ustuni (title_uz, title_ru, ...) alohida.
+# O'chirilgan yozuvlar incremental eksportda ko'rinmaydi.
+
+EXPORT_MODELS = {
+    'regions': 'hotels.Regions',
+    'hotels': 'hotels.Hotel',
+    'travels': 'travels.Travel',
+    'restaurants': 'restaurants.Restaurant',
+}
+FORMATS = ('ndjson', 'csv')
+CONTENT_TYPES = {'ndjson': 'application/x-ndjson', 'csv': 'text/csv'}
+SKIPPED_FIELDS = ('latitude', 'longitude')
+DEFAULT_CHUNK_SIZE = 500
+
+
+def parse_kinds(value) -> list:
+    kinds = [kind.strip() for kind in (value or '').split(',') if kind.strip()] or list(EXPORT_MODELS)
+    unknown = [kind for kind in kinds if kind not in EXPORT_MODELS]
+    if unknown:
+        raise ValidationError({'type': f"Noma'lum tur: {', '.join(unknown)}. Mumkin: {', '.join(EXPORT_MODELS)}"})
+    return kinds
+
+
+def parse_since(value):
+    if not value:
+        return None
+    try:
+        since = parse_datetime(value)
+    except ValueError:
+        since = None
+    if since is None:
+        raise ValidationError({'since': "Vaqtni ISO 8601 formatida kiriting, masalan: 2025-01-31T12:00:00Z"})
+    if timezone.is_naive(since):
+        since = timezone.make_aware(since)
+    return since
+
+
+def export_columns(model) -> list:
+    try:
+        translated = set(translator.get_options_for_model(model).fields)
+    except NotRegistered:
+        translated = set()
+    columns = [field.attname if field.is_relation else field.name for field in model._meta.concrete_fields
+               if field.name not in translated and field.name not in SKIPPED_FIELDS]
+    if _has_images(model):
+        columns.append('images')
+    return columns
+
+
+def _has_images(model) -> bool:
+    return any(rel.get_accessor_name() == 'images' for rel in model._meta.related_objects)
+
+
+def _value(value):
+    if isinstance(value, (datetime.datetime, datetime.date, datetime.time)):
+        return value.isoformat()
+    if isinstance(value, Decimal):
+        return str(value)
+    return value
+
+
+def iter_records(kind, since=None, chunk_size=DEFAULT_CHUNK_SIZE):
+    model = apps.get_model(EXPORT_MODELS[kind])
+    columns = export_columns(model)
+    queryset = model._default_manager.order_by('pk')
+    if since is not None:
+        queryset = queryset.filter(updated_at__gte=since)
+    if 'images' in columns:
+        queryset = queryset.prefetch_related('images')
+    for obj in queryset.iterator(chunk_size=chunk_size):
+        record = {column: _value(getattr(obj, column)) for column in columns if column != 'images'}
+        if 'images' in columns:
+            record['images'] = [img.image.url for img in obj.images.all()]
+        yield record
+
+
+def ndjson_lines(kinds, since=None, chunk_size=DEFAULT_CHUNK_SIZE):
+    for kind in kinds:
+        for record in iter_records(kind, since, chunk_size):
+            yield json.dumps({'type': kind, **record}, ensure_ascii=False).encode() + b'\n'
+
+
+class _Echo:
+    def write(self, value):
+        return value
+
+
+def csv_lines(kind, since=None, chunk_size=DEFAULT_CHUNK_SIZE):
+    columns = export_columns(apps.get_model(EXPORT_MODELS[kind]))
+    writer = csv.writer(_Echo())
+    yield writer.writerow(columns).encode()
+    for record in iter_records(kind, since, chunk_size):
+        yield writer.writerow([_csv_value(record[column]) for column in columns]).encode()
+
+
+def _csv_value(value):
+    if value is None:
+        return ''
+    if isinstance(value, (dict, list)):
+        return json.dumps(value, ensure_ascii=False)
+    return value
+
+
+def export_lines(fmt, kinds, since=None, chunk_size=DEFAULT_CHUNK_SIZE):
+    if fmt == 'csv':
+        if len(kinds) != 1:
+            raise ValidationError({'type': "CSV eksport uchun bitta tur tanlang"})
+        return csv_lines(kinds[0], since, chunk_size)
+    return ndjson_lines(kinds, since, chunk_size)
@@ -0,0 +1,105 @@
+from functools import lru_cache
+
+from modeltranslation.utils import get_language
+from rest_framework.relations import RelatedField
+
+from travelsuz_back.images import srcset_from_values
+
+# Public ro'yxat/detail javoblari uchun faqat o'qiladigan serializer: model obyektlari
+# yaratilmaydi, ma'lumot `.values()` bilan olinadi va har bir til uchun oldindan
+# tuzilgan maydonlar xaritasi bo'yicha yig'iladi. Natija `serializer_class` bilan bir xil.
+
+LANGUAGES = ('uz', 'ru', 'en')
+
+
+class ReadOnlySerializer:
+    model = None
+    serializer_class = None
+    translated_fields = ()
+
+    def __init__(self, lang, region_lang=None):
+        self.lang = lang
+        self.region_lang = region_lang or lang
+        self.columns, self.plan = self.compile(self.lang, self.region_lang)
+
+    @classmethod
+    def for_request(cls, request):
+        lang = get_language()
+        return cls(lang, lang)
+
+    @classmethod
+    @lru_cache(maxsize=None)
+    def compile(cls, lang, region_lang):
+        model_fields = cls.serializer_class().fields
+        columns = ['id']
+        plan = []
+        for name in cls.serializer_class.Meta.fields:
+            if name in cls.translated_fields:
+                column = f'{name}_{lang}'
+                plan.append((name, lambda row, images, column=column: row[column]))
+            elif name == 'region':
+                column = f'region__name_{region_lang}'
+                plan.append((name, lambda row, images, column=column: row[column]))
+            elif name == 'images':
+                plan.append((name, lambda row, images: [img['url'] for img in images.get(row['id'], ())]))
+                continue
+            elif name == 'image_variants':
+                plan.append((name, lambda row, images: [img['srcset'] for img in images.get(row['id'], ())]))
+                continue
+            elif name == 'location':
+                column = 'location'
+                plan.append((name, lambda row, images: {
+                    'latitude': (row['location'] or {}).get('latitude'),
+                    'longitude': (row['location'] or {}).get('longitude'),
+                }))
+            elif isinstance(model_fields[name], RelatedField):
+                # values() FK ning o'zini (id) qaytaradi
+                column = name
+                plan.append((name, lambda row, images, column=column: row[column]))
+            else:
+                column = name
+                convert = model_fields[name].to_representation
+                plan.append((name, lambda row, images, column=column, convert=convert:
+                             None if row[column] is None else convert(row[column])))
+            if column not in columns:
+                columns.append(column)
+        return columns, plan
+
+    def image_rows(self, ids):
+        names = self.serializer_class.Meta.fields
+        if not ids or ('images' not in names and 'image_variants' not in names):
+            return None
+        image_model = self.model._meta.get_field('images').related_model
+        parent = image_model.parent_field().attname
+        return image_model.objects.filter(**{f'{parent}__in': ids}).values(
+            'id', parent, 'image', 'status', 'variants')
+
+    def group_images(self, rows) -> dict:
+        image_model = self.model._meta.get_field('images').related_model
+        parent = image_model.parent_field().attname
+        storage = image_model._meta.get_field('image').storage
+        grouped = {}
+        for row in rows:
+            grouped.setdefault(row[parent], []).append({
+                'url': storage.url(row['image']),
+                'srcset': srcset_from_values(storage, row['id'], row['status'], row['image'], row['variants']),
+            })
+        return grouped
+
+    def rows(self, queryset):
+        return queryset.select_related(None).prefetch_related(None).values(*self.columns)
+
+    def assemble(self, rows, images) -> list:
+        return [{name: getter(row, images) for name, getter in self.plan} for row in rows]
+
+    def serialize(self, queryset) -> list:
+        rows = list(self.rows(queryset))
+        image_rows = self.image_rows([row['id'] for row in rows])
+        return self.assemble(rows, self.group_images(image_rows) if image_rows is not None else {})
+
+    async def aserialize(self, queryset) -> list:
+        """serialize() ning async ORM dagi varianti (ASGI view lar uchun)."""
+        rows = [row async for row in self.rows(queryset)]
+        image_rows = self.image_rows([row['id'] for row in rows])
+        images = self.group_images([row async for row in image_rows]) if image_rows is not None else {}
+        return self.assemble(rows, images)
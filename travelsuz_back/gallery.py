@@ -0,0 +1,59 @@
+from django.conf import settings
+from django.db import transaction
+from django.db.models import Max
+from rest_framework.exceptions import ValidationError
+
+from travelsuz_back import cards, image_queue
+from travelsuz_back.conditional import touch_parent
+
+# Rasmlarni hammasini o'chirib qayta yaratish o'rniga faqat o'zgarganini yozish:
+# yangi rasmlar bulk_create bilan qo'shiladi, id bo'yicha o'chiriladi va tartiblanadi.
+# O'chirilgan rasmlarning fayllarini `manage.py sweep_orphan_images` tozalaydi.
+
+
+def update_gallery(instance, uploaded=None, remove_ids=None, order=None):
+    images = instance.images
+    model = images.model
+    remove_ids = set(remove_ids or [])
+    order = list(dict.fromkeys(order or []))
+
+    existing = {img.pk: img for img in images.all()}
+    unknown = remove_ids - set(existing)
+    if unknown:
+        raise ValidationError({'remove_image_ids': f"Bunday rasm id lar topilmadi: {sorted(unknown)}"})
+    unknown = set(order) - (set(existing) - remove_ids)
+    if unknown:
+        raise ValidationError({'image_order': f"Bunday rasm id lar topilmadi: {sorted(unknown)}"})
+
+    created = []
+    with transaction.atomic():
+        if remove_ids:
+            images.filter(pk__in=remove_ids).delete()
+
+        if order:
+            kept = [existing[pk] for pk in order]
+            kept += sorted((img for pk, img in existing.items() if pk not in remove_ids and pk not in order),
+                           key=lambda img: (img.position, img.pk))
+            changed = []
+            for position, img in enumerate(kept):
+                if img.position != position:
+                    img.position = position
+                    changed.append(img)
+            model.objects.bulk_update(changed, ['position'])
+
+        if uploaded:
+            start = images.aggregate(last=Max('position'))['last']
+            start = 0 if start is None else start + 1
+            created = model.objects.bulk_create([
+                model(**{images.field.name: instance}, image=image, position=start + i)
+                for i, image in enumerate(uploaded)
+            ])
+
+        cards.invalidate(type(instance), [instance.pk])
+        # bulk_create/bulk_update signal yubormaydi: ETag o'zgarishi uchun
+        touch_parent(model, [instance.pk])
+
+    if settings.IMAGE_PROCESSING_EAGER:
+        for obj in created:
+            image_queue.process_now(obj)
+    return created
@@ -0,0 +1,80 @@
+import math
+
+import django_filters
+from django.db.models import F
+from django.db.models.functions import ASin, Cos, Radians, Sin, Sqrt, Power
+from rest_framework.exceptions import ValidationError
+
+EARTH_RADIUS_KM = 6371.0
+KM_PER_DEGREE_LAT = 111.32
+DEFAULT_RADIUS_KM = 10.0
+MAX_RADIUS_KM = 500.0
+
+
+def coordinates_from_location(location):
+    loc = location or {}
+    try:
+        latitude = float(loc.get('latitude'))
+        longitude = float(loc.get('longitude'))
+    except (TypeError, ValueError):
+        return None, None
+    return latitude, longitude
+
+
+def haversine_km(latitude, longitude):
+    # Django SQLite uchun ham RADIANS/SIN/COS/ASIN funksiyalarini ro'yxatdan o'tkazadi
+    d_lat = Radians(F('latitude') - latitude) / 2
+    d_lng = Radians(F('longitude') - longitude) / 2
+    a = (Power(Sin(d_lat), 2)
+         + math.cos(math.radians(latitude)) * Cos(Radians(F('latitude'))) * Power(Sin(d_lng), 2))
+    return 2 * EARTH_RADIUS_KM * ASin(Sqrt(a))
+
+
+def within_bbox(queryset, min_lat, min_lng, max_lat, max_lng):
+    return queryset.filter(
+        latitude__gte=min_lat, latitude__lte=max_lat,
+        longitude__gte=min_lng, longitude__lte=max_lng,
+    )
+
+
+def nearest(queryset, latitude, longitude, radius_km):
+    # Avval indexli lat/lng ustunlarida bounding box, keyin haversine bo'yicha aniq masofa
+    d_lat = radius_km / KM_PER_DEGREE_LAT
+    cos_lat = max(math.cos(math.radians(latitude)), 0.01)
+    d_lng = min(radius_km / (KM_PER_DEGREE_LAT * cos_lat), 180.0)
+    queryset = within_bbox(queryset, latitude - d_lat, longitude - d_lng, latitude + d_lat, longitude + d_lng)
+    return (queryset
+            .annotate(distance_km=haversine_km(latitude, longitude))
+            .filter(distance_km__lte=radius_km)
+            .order_by('distance_km', 'id'))
+
+
+class NumberCSVFilter(django_filters.BaseCSVFilter, django_filters.NumberFilter):
+    pass
+
+
+class GeoFilterSet(django_filters.FilterSet):
+    near = NumberCSVFilter(method='filter_near', help_text="lat,lng (masalan: 39.654321,66.975432)")
+    radius_km = django_filters.NumberFilter(method='filter_radius_km',
+                                            help_text=f"Radius km da (default: {DEFAULT_RADIUS_KM:g})")
+    bbox = NumberCSVFilter(method='filter_bbox', help_text="min_lat,min_lng,max_lat,max_lng")
+
+    def filter_near(self, queryset, name, value):
+        if len(value) != 2:
+            raise ValidationError({'near': "near=lat,lng formatida kiriting."})
+        latitude, longitude = (float(v) for v in value)
+        radius_km = self.form.cleaned_data.get('radius_km')
+        radius_km = float(radius_km) if radius_km else DEFAULT_RADIUS_KM
+        if not 0 < radius_km <= MAX_RADIUS_KM:
+            raise ValidationError({'radius_km': f"radius_km 0 dan katta va {MAX_RADIUS_KM:g} dan kichik bo‘lishi kerak."})
+        return nearest(queryset, latitude, longitude, radius_km)
+
+    def filter_radius_km(self, queryset, name, value):
+        # near bilan birga ishlatiladi
+        return queryset
+
+    def filter_bbox(self, queryset, name, value):
+        if len(value) != 4:
+            raise ValidationError({'bbox': "bbox=min_lat,min_lng,max_lat,max_lng formatida kiriting."})
+        min_lat, min_lng, max_lat, max_lng = (float(v) for v in value)
+        return within_bbox(queryset, min_lat, min_lng, max_lat, max_lng)
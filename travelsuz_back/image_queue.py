@@ -0,0 +1,104 @@
+import logging
+from datetime import timedelta
+
+from django.apps import apps
+from django.conf import settings
+from django.core.files.storage import default_storage
+from django.db import transaction
+from django.db.models import Q
+from django.utils import timezone
+
+from travelsuz_back import cards, response_cache
+from travelsuz_back.images import process_upload, delete_variants
+
+logger = logging.getLogger(__name__)
+
+# Rasm modellarining status maydoni navbat vazifasini bajaradi: yangi yuklangan rasm
+# "pending" bo'ladi, `manage.py process_images` ularni olib background jarayonlarda qayta ishlaydi.
+
+IMAGE_MODELS = ('hotels.HotelImage', 'travels.TravelImage', 'restaurants.RestaurantImage')
+
+
+def image_models():
+    return [apps.get_model(label) for label in IMAGE_MODELS]
+
+
+def reset_stale(now=None):
+    # to'xtab qolgan worker ning rasmlari navbatga qaytariladi; boshqa ishlayotgan worker
+    # olgan (claimed_at yangi) rasmlarga tegilmaydi
+    stale_before = (now or timezone.now()) - timedelta(seconds=settings.IMAGE_PROCESSING_CLAIM_TIMEOUT)
+    reset = 0
+    for model in image_models():
+        reset += model.objects.filter(status=model.STATUS_PROCESSING).filter(
+            Q(claimed_at__lt=stale_before) | Q(claimed_at__isnull=True)
+        ).update(status=model.STATUS_PENDING, claimed_at=None)
+    return reset
+
+
+def claim(batch_size):
+    """[(model, pk, image nomi, claimed_at), ...]; claimed_at complete()/fail() uchun belgi."""
+    jobs = []
+    for model in image_models():
+        remaining = batch_size - len(jobs)
+        if remaining <= 0:
+            break
+        pending = model.objects.filter(status=model.STATUS_PENDING).order_by('id')
+        for pk, name in pending.values_list('pk', 'image')[:remaining]:
+            claimed_at = timezone.now()
+            claimed = model.objects.filter(pk=pk, status=model.STATUS_PENDING).update(
+                status=model.STATUS_PROCESSING, claimed_at=claimed_at)
+            if claimed:
+                jobs.append((model, pk, name, claimed_at))
+    return jobs
+
+
+def _claimed(model, pk, claimed_at):
+    # faqat shu worker olgan holat: qayta navbatga qo'yilgan yoki tayyor rasm o'zgarmaydi
+    return model.objects.filter(pk=pk, status=model.STATUS_PROCESSING, claimed_at=claimed_at)
+
+
+def complete(model, pk, result, claimed_at):
+    with transaction.atomic():
+        updated = _claimed(model, pk, claimed_at).update(
+            image=result['image'], variants=result['variants'], status=model.STATUS_READY,
+        )
+        if updated:
+            # ota yozuvning ETag/Last-Modified va keshi yangilanishi uchun
+            field = model.parent_field()
+            parent_id = model.objects.filter(pk=pk).values_list(field.attname, flat=True).first()
+            field.related_model.objects.filter(pk=parent_id).update(updated_at=timezone.now())
+            cards.invalidate(field.related_model, [parent_id])
+            original = result.get('original')
+            if original and original != result['image']:
+                # asl fayl yangi nom commit bo'lgandan keyingina o'chiriladi
+                transaction.on_commit(lambda: default_storage.delete(original))
+    if updated:
+        response_cache.invalidate()
+    else:
+        # rasm ishlov paytida o'chirilgan yoki almashtirilgan
+        default_storage.delete(result['image'])
+        delete_variants(default_storage, result['variants'])
+
+
+def fail(model, pk, exc, claimed_at):
+    logger.warning("Image %s #%s could not be processed: %s", model.__name__, pk, exc, exc_info=exc)
+    _claimed(model, pk, claimed_at).update(status=model.STATUS_FAILED)
+
+
+def process_now(obj):
+    model = type(obj)
+    claimed_at = timezone.now()
+    if not model.objects.filter(pk=obj.pk, status=model.STATUS_PENDING).update(
+            status=model.STATUS_PROCESSING, claimed_at=claimed_at):
+        return
+    try:
+        result = process_upload(obj.image.name)
+    except Exception as exc:
+        # DecompressionBombError, noto'g'ri mode (ValueError) va h.k.: rasm "processing" da qolib ketmasin
+        fail(model, obj.pk, exc, claimed_at)
+        obj.status = model.STATUS_FAILED
+        return
+    complete(model, obj.pk, result, claimed_at)
+    obj.image.name = result['image']
+    obj.variants = result['variants']
+    obj.status = model.STATUS_READY
@@ -0,0 +1,95 @@
+import os
+from io import BytesIO
+
+from django.conf import settings
+from django.core.files.base import ContentFile
+from django.core.files.storage import default_storage
+from PIL import Image, ImageOps
+
+# Yuklangan rasmlardan IMAGE_VARIANT_WIDTHS kengliklarida WebP va JPEG nusxalar yasaladi.
+# Natija image modelining `variants` maydonida saqlanadi: {"320": {"webp": "...", "jpeg": "..."}}
+
+ORIGINAL_JPEG_OPTIONS = {'quality': 88, 'optimize': True, 'progressive': True}
+
+FORMATS = {
+    'webp': ('WEBP', {'quality': 80, 'method': 4}),
+    'jpeg': ('JPEG', {'quality': 82, 'optimize': True, 'progressive': True}),
+}
+
+
+def _to_rgb(img):
+    if img.mode in ('RGBA', 'LA') or (img.mode == 'P' and 'transparency' in img.info):
+        img = img.convert('RGBA')
+        background = Image.new('RGB', img.size, (255, 255, 255))
+        background.paste(img, mask=img.getchannel('A'))
+        return background
+    return img.convert('RGB')
+
+
+def variant_name(name, width, ext):
+    directory, filename = os.path.split(name)
+    stem, _ = os.path.splitext(filename)
+    return os.path.join(directory, 'variants', f'{stem}_{width}.{ext}')
+
+
+def _build_variants(img, name, storage):
+    variants = {}
+    for width in settings.IMAGE_VARIANT_WIDTHS:
+        if width >= img.width:
+            continue
+        height = round(img.height * width / img.width)
+        resized = img.resize((width, height), Image.LANCZOS)
+        variants[str(width)] = {}
+        for ext, (pil_format, options) in FORMATS.items():
+            buffer = BytesIO()
+            resized.save(buffer, pil_format, **options)
+            variants[str(width)][ext] = storage.save(variant_name(name, width, ext), ContentFile(buffer.getvalue()))
+    return variants
+
+
+def generate_variants(field_file):
+    with field_file.open('rb') as f:
+        img = _to_rgb(ImageOps.exif_transpose(Image.open(f)))
+    return _build_variants(img, field_file.name, field_file.storage)
+
+
+def process_upload(name):
+    # Background worker uchun: rasmni decode qiladi, EXIF ni olib tashlab JPEG qilib
+    # qayta saqlaydi va nusxalarni yasaydi. Bazaga tegmaydi, natijani qaytaradi.
+    storage = default_storage
+    with storage.open(name, 'rb') as f:
+        img = _to_rgb(ImageOps.exif_transpose(Image.open(f)))
+
+    buffer = BytesIO()
+    img.save(buffer, 'JPEG', **ORIGINAL_JPEG_OPTIONS)
+    stem, _ = os.path.splitext(name)
+    new_name = storage.save(f'{stem}.jpg', ContentFile(buffer.getvalue()))
+
+    # asl fayl shu yerda o'chirilmaydi: yangi nom bazaga yozilib commit bo'lgach
+    # image_queue.complete() o'chiradi, aks holda yiqilishda yozuv yo'q faylga qarab qoladi
+    return {'image': new_name, 'variants': _build_variants(img, new_name, storage), 'original': name}
+
+
+def delete_variants(storage, variants):
+    for formats in (variants or {}).values():
+        for name in formats.values():
+            storage.delete(name)
+
+
+def srcset(image_obj):
+    return srcset_from_values(image_obj.image.storage, image_obj.pk, image_obj.status,
+                              image_obj.image.name, image_obj.variants)
+
+
+def srcset_from_values(storage, pk, status, name, variants):
+    variants = variants or {}
+    widths = sorted(variants, key=int)
+    return {
+        'id': pk,
+        'status': status,
+        'original': storage.url(name),
+        **{
+            ext: ', '.join(f"{storage.url(variants[w][ext])} {w}w" for w in widths if ext in variants[w])
+            for ext in FORMATS
+        },
+    }
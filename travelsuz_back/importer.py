@@ -0,0 +1,162 @@
+import csv
+import json
+
+from django.apps import apps
+from django.db import DatabaseError, transaction
+from django.dispatch import Signal
+from django.utils.module_loading import import_string
+from rest_framework import serializers
+
+from travelsuz_back import response_cache
+from travelsuz_back.export import EXPORT_MODELS
+from travelsuz_back.geo import coordinates_from_location
+
+# Katalogni NDJSON/CSV dan ommaviy yuklash. Har bir qator mavjud Create serializer
+# qoidalari bilan tekshiriladi (validate_price, region va h.k.), to'g'ri qatorlar
+# batch_size talik bulk_create bilan yoziladi, xato qatorlar hisobotga tushadi.
+
+IMPORT_SERIALIZERS = {
+    'hotels': 'apps.hotels.api.v0.serializers.HotelCreateSerializer',
+    'travels': 'apps.travels.api.v0.serializers.TravelCreateSerializer',
+    'restaurants': 'apps.restaurants.api.v0.serializers.RestaurantCreateSerializer',
+}
+DEFAULT_BATCH_SIZE = 500
+
+# bulk_create post_save yubormaydi: qidiruv indeksi kabi qo'shimchalar shu signalni tinglaydi
+catalog_imported = Signal()
+
+
+class RegionLookupField(serializers.PrimaryKeyRelatedField):
+    """Har bir qator uchun so'rov yubormaslik uchun regionlar oldindan yuklanadi."""
+
+    def __init__(self, regions, **kwargs):
+        self.regions = regions
+        super().__init__(queryset=apps.get_model(EXPORT_MODELS['regions'])._default_manager.none(), **kwargs)
+
+    def to_internal_value(self, data):
+        try:
+            return self.regions[int(data)]
+        except (TypeError, ValueError):
+            self.fail('incorrect_type', data_type=type(data).__name__)
+        except KeyError:
+            self.fail('does_not_exist', pk_value=data)
+
+
+def read_rows(stream, fmt, kind=None):
+    """(qator raqami, tur, dict yoki xato matni) larni qaytaradi."""
+    if fmt == 'csv':
+        for line, row in enumerate(csv.DictReader(stream), start=2):
+            yield line, kind, {key: value for key, value in row.items() if key and value != ''}
+        return
+    for line, text in enumerate(stream, start=1):
+        if not text.strip():
+            continue
+        try:
+            row = json.loads(text)
+        except ValueError as exc:
+            yield line, kind, f"JSON xato: {exc}"
+            continue
+        if not isinstance(row, dict):
+            yield line, kind, "Har bir qator JSON obyekt bo'lishi kerak"
+            continue
+        yield line, row.pop('type', kind), row
+
+
+def normalize(row) -> dict:
+    row = {key: value for key, value in row.items() if value is not None}
+    if 'region' not in row and 'region_id' in row:
+        row['region'] = row['region_id']
+    location = row.get('location')
+    if isinstance(location, str):
+        try:
+            location = json.loads(location)
+        except ValueError:
+            location = None
+    if isinstance(location, dict):
+        for key in ('latitude', 'longitude'):
+            if location.get(key) is not None:
+                row.setdefault(key, location[key])
+    return row
+
+
+def build_instance(model, validated_data):
+    validated_data.pop('uploaded_images', None)
+    latitude = validated_data.pop('latitude', None)
+    longitude = validated_data.pop('longitude', None)
+    if latitude is not None or longitude is not None:
+        validated_data['location'] = {"latitude": latitude, "longitude": longitude}
+    obj = model(**validated_data)
+    # bulk_create save() ni chaqirmaydi, GeoIndexedModel ustunlari shu yerda to'ldiriladi
+    obj.latitude, obj.longitude = coordinates_from_location(obj.location)
+    return obj
+
+
+class CatalogImporter:
+    def __init__(self, batch_size=DEFAULT_BATCH_SIZE):
+        self.batch_size = batch_size
+        self.regions = apps.get_model(EXPORT_MODELS['regions'])._default_manager.in_bulk()
+        self.created = {kind: 0 for kind in IMPORT_SERIALIZERS}
+        self.errors = []
+        self._pending = {kind: [] for kind in IMPORT_SERIALIZERS}
+
+    def validate(self, line, kind, row):
+        if isinstance(row, str):
+            self.errors.append({'line': line, 'type': kind, 'errors': {'non_field_errors': [row]}})
+            return
+        if kind not in IMPORT_SERIALIZERS:
+            self.errors.append({'line': line, 'type': kind,
+                                'errors': {'type': [f"Mumkin: {', '.join(IMPORT_SERIALIZERS)}"]}})
+            return
+        serializer = import_string(IMPORT_SERIALIZERS[kind])(data=normalize(row))
+        serializer.fields['region'] = RegionLookupField(self.regions)
+        if not serializer.is_valid():
+            self.errors.append({'line': line, 'type': kind, 'errors': serializer.errors})
+            return
+        model = serializer.Meta.model
+        self._pending[kind].append((line, build_instance(model, dict(serializer.validated_data))))
+        if len(self._pending[kind]) >= self.batch_size:
+            self.write(kind)
+
+    def write(self, kind):
+        pending, self._pending[kind] = self._pending[kind], []
+        if not pending:
+            return
+        model = pending[0][1].__class__
+        try:
+            with transaction.atomic():
+                created = model.objects.bulk_create([obj for _, obj in pending])
+        except DatabaseError:
+            # batch dagi bitta yomon qator hammasini to'xtatmasin: qatorma-qator qayta urinish
+            created = []
+            for line, obj in pending:
+                try:
+                    with transaction.atomic():
+                        created += model.objects.bulk_create([obj])
+                except DatabaseError as exc:
+                    self.errors.append({'line': line, 'type': kind, 'errors': {'non_field_errors': [str(exc)]}})
+        self.created[kind] += len(created)
+        if created:
+            catalog_imported.send(sender=model, objects=created)
+
+    def run(self, rows) -> dict:
+        for line, kind, row in rows:
+            self.validate(line, kind, row)
+        for kind in IMPORT_SERIALIZERS:
+            self.write(kind)
+        if any(self.created.values()):
+            response_cache.invalidate()
+        return {'created': self.created, 'errors': self.errors}
+
+
+def detect_format(filename):
+    extension = filename.rsplit('.', 1)[-1].lower() if '.' in filename else ''
+    if extension == 'csv':
+        return 'csv'
+    if extension in ('ndjson', 'jsonl', 'json'):
+        return 'ndjson'
+    return None
+
+
+def import_catalog(stream, fmt, kind=None, batch_size=DEFAULT_BATCH_SIZE) -> dict:
+    """`stream` matn rejimida ochilgan fayl (CSV uchun newline='')."""
+    return CatalogImporter(batch_size).run(read_rows(stream, fmt, kind))
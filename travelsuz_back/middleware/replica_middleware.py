@@ -0,0 +1,44 @@
+from asgiref.sync import iscoroutinefunction, markcoroutinefunction
+from django.conf import settings
+
+from travelsuz_back import db_router
+
+PIN_COOKIE = 'pin_primary'
+READ_METHODS = ('GET', 'HEAD')
+
+
+class ReplicaRoutingMiddleware:
+    """GET/HEAD katalog o'qishlarini replica ga yuboradi, yozgan mijozni primary ga bog'laydi."""
+    sync_capable = True
+    async_capable = True
+
+    def __init__(self, get_response):
+        self.get_response = get_response
+        self.async_mode = iscoroutinefunction(get_response)
+        if self.async_mode:
+            markcoroutinefunction(self)
+
+    def use_replica(self, request) -> bool:
+        return request.method in READ_METHODS and PIN_COOKIE not in request.COOKIES
+
+    def process_response(self, request, response):
+        if request.method not in READ_METHODS + ('OPTIONS',) and response.status_code < 400:
+            # replikatsiya kechikishi: yozgan mijozning keyingi o'qishlari ham primary dan
+            response.set_cookie(PIN_COOKIE, '1', max_age=settings.REPLICA_PIN_SECONDS,
+                                httponly=True, samesite='Lax')
+        return response
+
+    def __call__(self, request):
+        if self.async_mode:
+            return self.__acall__(request)
+        if self.use_replica(request):
+            with db_router.replica_reads():
+                return self.get_response(request)
+        return self.process_response(request, self.get_response(request))
+
+    async def __acall__(self, request):
+        # db_router ContextVar lari sync_to_async ichidagi ORM chaqiruvlariga ham o'tadi
+        if self.use_replica(request):
+            with db_router.replica_reads():
+                return await self.get_response(request)
+        return self.process_response(request, await self.get_response(request))
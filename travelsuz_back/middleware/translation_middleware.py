@@ -1,17 +1,32 @@
-
+from asgiref.sync import iscoroutinefunction, markcoroutinefunction
 from django.utils import translation
 
 class TranslationMiddleware:
+    # ASGI da async view lar thread ga o'ralmasligi uchun ikkala rejimni ham qo'llaydi
+    sync_capable = True
+    async_capable = True
+
     def __init__(self, get_response):
         self.get_response = get_response
+        self.async_mode = iscoroutinefunction(get_response)
+        if self.async_mode:
+            markcoroutinefunction(self)
 
-    def __call__(self, request):
+    def get_language(self, request):
         lang = request.headers.get('Accept-Language', 'uz').lower()
         if lang not in ['uz', 'ru', 'en']:
             lang = 'uz'
+        return lang
 
+    def __call__(self, request):
+        if self.async_mode:
+            return self.__acall__(request)
 
-        with translation.override(lang):
+        with translation.override(self.get_language(request)):
             response = self.get_response(request)
 
         return response
+
+    async def __acall__(self, request):
+        with translation.override(self.get_language(request)):
+            return await self.get_response(request)
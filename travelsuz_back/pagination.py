@@ -0,0 +1,40 @@
+from rest_framework.pagination import CursorPagination, LimitOffsetPagination
+
+
+class OffsetPagination(LimitOffsetPagination):
+    max_limit = 100
+
+
+# (created_at, id) bo'yicha cursor pagination.
+# Admin UI uchun ?offset= yuborilsa oddiy limit/offset paginationga o'tadi.
+class KeysetPagination(CursorPagination):
+    ordering = ('-created_at', '-id')
+    page_size_query_param = 'page_size'
+    max_page_size = 100
+    offset_query_param = 'offset'
+    offset_pagination_class = OffsetPagination
+
+    def __init__(self):
+        self.offset_paginator = None
+
+    def get_ordering(self, request, queryset, view):
+        # filter (masalan near=) o'z tartibini bergan bo'lsa, o'shani saqlaymiz
+        if queryset.query.order_by:
+            return tuple(queryset.query.order_by)
+        return super().get_ordering(request, queryset, view)
+
+    def paginate_queryset(self, queryset, request, view=None):
+        if self.offset_query_param in request.query_params:
+            self.offset_paginator = self.offset_pagination_class()
+            queryset = queryset.order_by(*self.get_ordering(request, queryset, view))
+            return self.offset_paginator.paginate_queryset(queryset, request, view)
+        return super().paginate_queryset(queryset, request, view)
+
+    def get_paginated_response(self, data):
+        if self.offset_paginator is not None:
+            return self.offset_paginator.get_paginated_response(data)
+        return super().get_paginated_response(data)
+
+
+class UserKeysetPagination(KeysetPagination):
+    ordering = ('-date_joined', '-id')
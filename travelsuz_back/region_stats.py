@@ -0,0 +1,97 @@
+from django.db import transaction
+from django.db.models import Avg, Count, Min, Sum
+from django.db.models.signals import post_init, post_save, post_delete
+
+from travelsuz_back.importer import catalog_imported
+
+# Region sahifasidagi sonlar (hotel/travel/restaurant soni, hotel narxlari, jami views) har
+# so'rovda hisoblanmaydi: ular RegionStats jadvalida turadi. Yozuv qo'shilsa, o'zgarsa (region
+# almashsa - eski region ham), o'chirilsa yoki import qilinsa faqat tegishli regionlar qatori
+# har model uchun bitta GROUP BY region_id so'rovi bilan qayta hisoblanadi.
+# Yangilash tranzaksiya commit bo'lgandan keyin ishlaydi: o'chirilgan region qayta yozilmaydi.
+
+# model -> RegionStats dagi son maydoni
+_registry = {}
+ORIGINAL_REGION_ATTR = '_stats_region_id'
+UPDATE_FIELDS = ['hotel_count', 'travel_count', 'restaurant_count', 'hotel_min_price',
+                 'hotel_avg_price', 'total_views', 'updated_at']
+
+
+def _aggregate(model, region_ids) -> dict:
+    annotations = {'count': Count('pk'), 'views': Sum('views')}
+    if model._meta.label_lower == 'hotels.hotel':
+        annotations.update(min_price=Min('price'), avg_price=Avg('price'))
+    queryset = model.objects.order_by().filter(region_id__isnull=False)
+    if region_ids is not None:
+        queryset = queryset.filter(region_id__in=region_ids)
+    return {row.pop('region_id'): row for row in queryset.values('region_id').annotate(**annotations)}
+
+
+def refresh(region_ids=None) -> int:
+    """Berilgan (None bo'lsa barcha) regionlar statistikasini qayta hisoblash."""
+    from apps.hotels.models import Regions, RegionStats
+
+    regions = Regions.objects.order_by()
+    if region_ids is not None:
+        region_ids = {pk for pk in region_ids if pk is not None}
+        if not region_ids:
+            return 0
+        regions = regions.filter(pk__in=region_ids)
+    rows = {pk: RegionStats(region_id=pk) for pk in regions.values_list('pk', flat=True)}
+    if not rows:
+        return 0
+
+    for model, count_field in _registry.items():
+        for region_id, agg in _aggregate(model, region_ids).items():
+            stats = rows.get(region_id)
+            if stats is None:
+                continue
+            setattr(stats, count_field, agg['count'])
+            stats.total_views += agg['views'] or 0
+            if 'min_price' in agg:
+                stats.hotel_min_price, stats.hotel_avg_price = agg['min_price'], agg['avg_price']
+
+    RegionStats.objects.bulk_create(rows.values(), update_conflicts=True, unique_fields=['region'],
+                                    update_fields=UPDATE_FIELDS)
+    return len(rows)
+
+
+def schedule(region_ids) -> None:
+    region_ids = {pk for pk in region_ids if pk is not None}
+    if region_ids:
+        transaction.on_commit(lambda: refresh(region_ids))
+
+
+def refresh_objects(model, pks) -> None:
+    """QuerySet.update() kabi signal yubormaydigan yozishlardan keyin (masalan views flush)."""
+    if model in _registry and pks:
+        schedule(model.objects.filter(pk__in=list(pks)).values_list('region_id', flat=True).distinct())
+
+
+def register(model, count_field) -> None:
+    _registry[model] = count_field
+    label = model._meta.label_lower
+
+    def remember_region(sender, instance, **kwargs):
+        # deferred maydon uchun qo'shimcha so'rov bo'lmasin
+        setattr(instance, ORIGINAL_REGION_ATTR, instance.__dict__.get('region_id'))
+
+    def object_changed(sender, instance, **kwargs):
+        schedule([instance.region_id, getattr(instance, ORIGINAL_REGION_ATTR, None)])
+        setattr(instance, ORIGINAL_REGION_ATTR, instance.region_id)
+
+    def objects_imported(sender, objects, **kwargs):
+        schedule(obj.region_id for obj in objects)
+
+    post_init.connect(remember_region, sender=model, weak=False, dispatch_uid=f'region_stats_init_{label}')
+    post_save.connect(object_changed, sender=model, weak=False, dispatch_uid=f'region_stats_save_{label}')
+    post_delete.connect(object_changed, sender=model, weak=False, dispatch_uid=f'region_stats_delete_{label}')
+    catalog_imported.connect(objects_imported, sender=model, weak=False, dispatch_uid=f'region_stats_import_{label}')
+
+    region_model = model._meta.get_field('region').related_model
+    post_save.connect(region_created, sender=region_model, dispatch_uid='region_stats_region')
+
+
+def region_created(sender, instance, created, **kwargs):
+    if created:
+        schedule([instance.pk])
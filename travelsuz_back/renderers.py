@@ -0,0 +1,79 @@
+from itertools import islice
+
+from django.http import StreamingHttpResponse
+from rest_framework.permissions import IsAdminUser
+from rest_framework.renderers import JSONRenderer
+from rest_framework.utils.encoders import JSONEncoder
+
+try:
+    import orjson
+except ImportError:  # orjson o'rnatilmagan bo'lsa stdlib json ishlatiladi
+    orjson = None
+
+# orjson (C da yozilgan) o'rnatilgan bo'lsa JSON shu bilan yoziladi, aks holda DRF ning
+# odatiy JSONRenderer i. Katta ro'yxatlar ?stream=1 bilan bo'laklab (chunked) yuboriladi,
+# shuning uchun butun javob xotirada yig'ilmaydi. ?stream=1 faqat admin (is_staff) uchun ishlaydi,
+# boshqalar odatiy sahifani oladi.
+
+STREAM_PARAM = 'stream'
+
+
+class FastJSONRenderer(JSONRenderer):
+    def render(self, data, accepted_media_type=None, renderer_context=None):
+        if data is None:
+            return b''
+        if orjson is None or self.get_indent(accepted_media_type, renderer_context or {}):
+            return super().render(data, accepted_media_type, renderer_context)
+        try:
+            ret = orjson.dumps(data, default=JSONEncoder().default)
+        except TypeError:
+            # masalan 64 bitdan katta int: stdlib encoder hammasini biladi
+            return super().render(data, accepted_media_type, renderer_context)
+        # JSONRenderer kabi: U+2028/U+2029 JavaScript satrlarida ruxsat etilmagan
+        return ret.replace(b'\xe2\x80\xa8', b'\\u2028').replace(b'\xe2\x80\xa9', b'\\u2029')
+
+
+def json_array_stream(chunks):
+    """Har bir chunk vergul bilan ajratilgan elementlar (bytes), natija bitta JSON massiv."""
+    yield b'['
+    first = True
+    for chunk in chunks:
+        if not chunk:
+            continue
+        if not first:
+            yield b','
+        yield chunk
+        first = False
+    yield b']'
+
+
+def batched(iterable, size):
+    iterator = iter(iterable)
+    while batch := list(islice(iterator, size)):
+        yield batch
+
+
+class StreamingListMixin:
+    stream_batch_size = 500
+
+    def wants_stream(self, request) -> bool:
+        if getattr(request.accepted_renderer, 'format', None) != 'json':
+            return False
+        if self.paginator is None:
+            return True
+        # sahifasiz butun jadval faqat admin uchun: ommaviy ro'yxatlarda sahifa chegarasi saqlanadi
+        return request.query_params.get(STREAM_PARAM) in ('1', 'true') and IsAdminUser().has_permission(request, self)
+
+    def stream_chunks(self, queryset):
+        renderer = FastJSONRenderer()
+        for batch in batched(queryset.iterator(chunk_size=self.stream_batch_size), self.stream_batch_size):
+            yield renderer.render(self.get_serializer(batch, many=True).data)[1:-1]
+
+    def list(self, request, *args, **kwargs):
+        if not self.wants_stream(request):
+            return super().list(request, *args, **kwargs)
+        queryset = self.filter_queryset(self.get_queryset())
+        if hasattr(self.paginator, 'get_ordering'):
+            queryset = queryset.order_by(*self.paginator.get_ordering(request, queryset, self))
+        return StreamingHttpResponse(json_array_stream(self.stream_chunks(queryset)),
+                                     content_type='application/json')
@@ -0,0 +1,132 @@
+import hashlib
+import uuid
+from urllib.parse import urlencode
+
+from django.conf import settings
+from django.core.cache import cache
+from django.db.models.signals import post_save, post_delete
+from django.http import HttpResponse
+from django.utils import translation
+from django.utils.cache import get_conditional_response
+from django.utils.http import parse_http_date_safe
+from rest_framework.exceptions import NotAcceptable
+
+from travelsuz_back.renderers import STREAM_PARAM
+from travelsuz_back.worker_stats import WorkerCounters
+
+# Public katalog GET javoblari til, path va filter parametrlari bo'yicha keshlanadi.
+# Katalog modellaridan biri o'zgarsa "generation" almashadi va eski yozuvlar ishlatilmaydi.
+
+CACHED_HEADERS = ('ETag', 'Last-Modified', 'Vary')
+
+GENERATION_KEY = 'response_cache:generation'
+HITS_KEY = 'hits'
+MISSES_KEY = 'misses'
+
+# hit/miss hisoblari worker xotirasida (travelsuz_back/worker_stats.py)
+stats = WorkerCounters('response_cache:stats')
+
+
+def get_generation() -> str:
+    generation = cache.get(GENERATION_KEY)
+    if generation is None:
+        cache.add(GENERATION_KEY, uuid.uuid4().hex, None)
+        generation = cache.get(GENERATION_KEY)
+    return generation
+
+
+def invalidate(**kwargs) -> None:
+    cache.set(GENERATION_KEY, uuid.uuid4().hex, None)
+
+
+def invalidate_on_change(*models) -> None:
+    for model in models:
+        post_save.connect(invalidate, sender=model, dispatch_uid=f'response_cache_save_{model._meta.label_lower}')
+        post_delete.connect(invalidate, sender=model, dispatch_uid=f'response_cache_delete_{model._meta.label_lower}')
+
+
+def make_key(request, media_type) -> str:
+    """media_type - muzokara natijasi (Accept sarlavhasining o'zi emas), ?format query da."""
+    query = urlencode(sorted(request.GET.lists()), doseq=True)
+    raw = '|'.join([
+        request.get_host(),
+        request.path,
+        query,
+        translation.get_language() or settings.MODELTRANSLATION_DEFAULT_LANGUAGE,
+        media_type,
+    ])
+    digest = hashlib.md5(raw.encode()).hexdigest()
+    return f'response_cache:v3:{get_generation()}:{digest}'
+
+
+def _count(key: str) -> None:
+    stats.incr(key)
+
+
+def get_stats() -> dict:
+    totals = stats.totals()
+    hits = totals.get(HITS_KEY, 0)
+    misses = totals.get(MISSES_KEY, 0)
+    total = hits + misses
+    return {
+        'hits': hits,
+        'misses': misses,
+        'hit_ratio': round(hits / total, 4) if total else 0.0,
+    }
+
+
+class CachedResponseMixin:
+    cache_timeout = None
+    # keshlangan javob foydalanuvchiga bog'liq emas: JWT claim lari yetarli, CustomUser o'qilmaydi
+    jwt_claims_only = True
+
+    def on_cache_hit(self, request, *args, **kwargs) -> None:
+        pass
+
+    def dispatch(self, request, *args, **kwargs):
+        if request.method != 'GET' or STREAM_PARAM in request.GET:
+            # ?stream javobi foydalanuvchiga bog'liq (faqat admin), keshlanmaydi
+            return super().dispatch(request, *args, **kwargs)
+
+        self.args, self.kwargs = args, kwargs
+        self.format_kwarg = self.get_format_suffix(**kwargs)
+        try:
+            renderer, accepted_media_type = self.perform_content_negotiation(
+                self.initialize_request(request, *args, **kwargs))
+        except NotAcceptable:
+            return super().dispatch(request, *args, **kwargs)
+        media_type = renderer.media_type
+        if hasattr(renderer, 'get_indent'):
+            # "application/json; indent=4" boshqa tana qaytaradi
+            media_type = f'{media_type};indent={renderer.get_indent(accepted_media_type, {})}'
+
+        key = make_key(request, media_type)
+        cached = cache.get(key)
+        if cached is not None:
+            _count(HITS_KEY)
+            self.on_cache_hit(request, *args, **kwargs)
+            content, content_type, headers = cached
+            response = get_conditional_response(
+                request,
+                etag=headers.get('ETag'),
+                last_modified=parse_http_date_safe(headers.get('Last-Modified')),
+            ) or HttpResponse(content, content_type=content_type)
+            for header, value in headers.items():
+                response[header] = value
+            response['X-Cache'] = 'HIT'
+            return response
+
+        _count(MISSES_KEY)
+        response = super().dispatch(request, *args, **kwargs)
+        response['X-Cache'] = 'MISS'
+        if (response.status_code == 200 and not response.streaming
+                and response.get('Content-Type', '').startswith('application/json')):
+            timeout = self.cache_timeout or settings.RESPONSE_CACHE_TIMEOUT
+            store = lambda r: cache.set(key, (
+                r.content, r['Content-Type'], {h: r[h] for h in CACHED_HEADERS if r.has_header(h)}
+            ), timeout)
+            if getattr(response, 'is_rendered', True):
+                store(response)
+            else:
+                response.add_post_render_callback(store)
+        return response
@@ -12,6 +12,8 @@ https://docs.djangoproject.com/en/5.2/ref/settings/
 import os
 from pathlib import Path
 
+from travelsuz_back.database import database_settings
+
 
 # Build paths inside the project like this: BASE_DIR / 'subdir'.
 BASE_DIR = Path(__file__).resolve().parent.parent
@@ -56,6 +58,8 @@ INSTALLED_APPS = [
     'apps.travels',
     'apps.restaurants',
     'apps.users',
+    'apps.search',
+    'apps.trending',
 
 
 
@@ -84,6 +88,7 @@ MIDDLEWARE = [
     'django.middleware.clickjacking.XFrameOptionsMiddleware',
     'travelsuz_back.middleware.translation_middleware.TranslationMiddleware',
     'django.middleware.locale.LocaleMiddleware',  # kerak bo‘lishi mumkin
+    'travelsuz_back.middleware.replica_middleware.ReplicaRoutingMiddleware',
 
 ]
 
@@ -114,15 +119,31 @@ TEMPLATES = [
 
 REST_FRAMEWORK = {
     'DEFAULT_AUTHENTICATION_CLASSES': [
-        'rest_framework_simplejwt.authentication.JWTAuthentication',
+        'apps.users.authentication.CachedJWTAuthentication',
     ],
     'DEFAULT_PERMISSION_CLASSES': [
         'rest_framework.permissions.DjangoModelPermissionsOrAnonReadOnly',
     ],
+    'DEFAULT_RENDERER_CLASSES': [
+        'travelsuz_back.renderers.FastJSONRenderer',
+        'rest_framework.renderers.BrowsableAPIRenderer',
+    ],
     'DEFAULT_SCHEMA_CLASS': 'drf_spectacular.openapi.AutoSchema',
+    # token bucket: "<scope>_ip" / "<scope>_user", travelsuz_back/throttling.py
+    'DEFAULT_THROTTLE_RATES': {
+        'comment_ip': '10/min',
+        'comment_user': '30/min',
+        'register_ip': '5/hour',
+        'login_ip': '20/min',
+    },
+    # ilova oldidagi ishonchli proxy lar soni; 0 bo'lsa X-Forwarded-For e'tiborga olinmaydi va
+    # IP REMOTE_ADDR dan olinadi (aks holda mijoz sarlavhani almashtirib limitni chetlab o'tadi)
+    'NUM_PROXIES': int(os.environ.get('NUM_PROXIES', 0)),
     'DEFAULT_FILTER_BACKENDS': [
         'django_filters.rest_framework.DjangoFilterBackend',
-    ]
+    ],
+    'DEFAULT_PAGINATION_CLASS': 'travelsuz_back.pagination.KeysetPagination',
+    'PAGE_SIZE': 20,
 }
 
 
@@ -147,7 +168,16 @@ SIMPLE_JWT = {
     "AUTH_HEADER_TYPES": ("Bearer",),
     "AUTH_TOKEN_CLASSES": ("rest_framework_simplejwt.tokens.AccessToken",),
     "TOKEN_BLACKLIST_ENABLED": True,
+    # tokenda parol hash idan olingan claim: parol o'zgarsa eski tokenlar bekor (apps/users/authentication.py)
+    "CHECK_REVOKE_TOKEN": True,
+    "TOKEN_REFRESH_SERIALIZER": "apps.users.authentication.VersionedTokenRefreshSerializer",
 }
+AUTH_USER_CACHE_TIMEOUT = 60  # sekund, apps/users/authentication.py
+PERMISSION_CACHE_TIMEOUT = 300  # sekund, apps/users/backends.py
+AUTHENTICATION_BACKENDS = ['apps.users.backends.CachedModelBackend']
+# blacklist Bloom filtri (apps/users/blacklist.py), undan ko'p yozuvda filtr qayta quriladi
+TOKEN_BLACKLIST_BLOOM_CAPACITY = 100_000
+
 WSGI_APPLICATION = 'travelsuz_back.wsgi.application'
 
 # settings.py
@@ -156,12 +186,12 @@ AUTH_USER_MODEL = 'users.CustomUser'
 # Database
 # https://docs.djangoproject.com/en/5.2/ref/settings/#databases
 
-DATABASES = {
-    'default': {
-        'ENGINE': 'django.db.backends.sqlite3',
-        'NAME': BASE_DIR / 'db.sqlite3',
-    }
-}
+# DB_ENGINE=postgres va boshqa o'zgaruvchilar: travelsuz_back/database.py
+DATABASES = database_settings(BASE_DIR)
+
+# Katalog GET o'qishlari "replica" aliasidan (bo'lsa), yozishlar primary dan
+DATABASE_ROUTERS = ['travelsuz_back.db_router.ReplicaRouter']
+REPLICA_PIN_SECONDS = 5  # yozgan mijoz shuncha sekund primary dan o'qiydi
 
 
 # Password validation
@@ -205,6 +235,50 @@ STATIC_ROOT = os.path.join(BASE_DIR, 'static')
 MEDIA_URL = '/media/'
 MEDIA_ROOT = os.path.join(BASE_DIR, 'media')
 
+# Rasm nusxalari (thumbnail) kengliklari, px
+IMAGE_VARIANT_WIDTHS = (320, 640, 1280)
+# True bo'lsa rasmlar request ichida qayta ishlanadi, aks holda `manage.py process_images` worker
+IMAGE_PROCESSING_EAGER = False
+# sekund: shundan uzoq "processing" da turgan rasm to'xtab qolgan worker niki deb navbatga qaytariladi
+IMAGE_PROCESSING_CLAIM_TIMEOUT = 600
+
+# Cache: Redis shart emas, fayl backend barcha gunicorn workerlar uchun umumiy
+CACHES = {
+    'default': {
+        'BACKEND': 'django.core.cache.backends.filebased.FileBasedCache',
+        'LOCATION': os.path.join(BASE_DIR, 'var', 'cache'),
+    },
+    # throttle bucketlari (travelsuz_back/throttling.py) worker ichidagi lock bilan yangilanadi,
+    # shuning uchun bu alias LocMem bo'lib qoladi: limit har worker uchun alohida
+    'throttle': {
+        'BACKEND': 'django.core.cache.backends.locmem.LocMemCache',
+        'LOCATION': 'throttle',
+    },
+    # to'liq CustomUser obyektlari (parol hash i bilan) diskka yozilmaydi, apps/users/authentication.py
+    'auth': {
+        'BACKEND': 'django.core.cache.backends.locmem.LocMemCache',
+        'LOCATION': 'auth',
+    },
+}
+RESPONSE_CACHE_TIMEOUT = 300  # sekund
+# Metrika hisoblagichlari (travelsuz_back/worker_stats.py)
+WORKER_STATS_INTERVAL = 10  # sekund: worker hisobini cache ga yozish oralig'i
+WORKER_STATS_TTL = 24 * 3600  # sekund: shuncha vaqt yozmagan worker metrikadan chiqadi
+
+# Views hisoblagichi (travelsuz_back/view_counter.py)
+VIEW_COUNTER_FLUSH_INTERVAL = 10  # sekund: worker xotiradagi hisobni shuncha vaqtda spool ga tashlaydi
+VIEW_COUNTER_CLAIM_TIMEOUT = 600  # sekund: shundan eski ".claimed" spool fayllar qayta olinadi
+VIEW_COUNTER_APPLIED_RETENTION = 7 * 24 * 3600  # sekund: qo'shilgan spool nomlari shuncha saqlanadi
+
+# `manage.py test`: LocMem cache va vaqtinchalik spool papka (travelsuz_back/test_runner.py)
+TEST_RUNNER = 'travelsuz_back.test_runner.IsolatedTestRunner'
+VIEW_COUNTER_SPOOL_DIR = os.path.join(BASE_DIR, 'var', 'views')
+
+# Trending reytingi (apps/trending/ranking.py, `manage.py compute_trending`)
+TRENDING_HALF_LIFE_HOURS = 24  # ko'rishlar og'irligi shuncha soatda ikki baravar kamayadi
+TRENDING_COMMENT_WINDOW_DAYS = 7
+TRENDING_COMMENT_WEIGHT = 10.0  # kuniga bitta comment ~ 10 ta yangi ko'rish
+
 # Default primary key field type
 # https://docs.djangoproject.com/en/5.2/ref/settings/#default-auto-field
 
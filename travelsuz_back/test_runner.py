@@ -0,0 +1,42 @@
+import tempfile
+
+from django.test.runner import DiscoverRunner
+from django.test.utils import override_settings
+
+from travelsuz_back import view_counter
+
+# Testlar loyihaning var/ papkasiga tegmaydi va devor soatiga bog'liq bo'lmaydi: cache xotirada,
+# views spool vaqtinchalik papkada, hisob test o'rtasida o'z-o'zidan spool ga tushmaydi.
+TEST_CACHES = {
+    'default': {
+        'BACKEND': 'django.core.cache.backends.locmem.LocMemCache',
+        'LOCATION': 'test-default',
+    },
+    'throttle': {
+        'BACKEND': 'django.core.cache.backends.locmem.LocMemCache',
+        'LOCATION': 'test-throttle',
+    },
+    'auth': {
+        'BACKEND': 'django.core.cache.backends.locmem.LocMemCache',
+        'LOCATION': 'test-auth',
+    },
+}
+
+
+class IsolatedTestRunner(DiscoverRunner):
+    def setup_test_environment(self, **kwargs):
+        super().setup_test_environment(**kwargs)
+        self._spool_dir = tempfile.TemporaryDirectory()
+        self._settings = override_settings(
+            CACHES=TEST_CACHES,
+            VIEW_COUNTER_SPOOL_DIR=self._spool_dir.name,
+            VIEW_COUNTER_FLUSH_INTERVAL=3600,
+        )
+        self._settings.enable()
+
+    def teardown_test_environment(self, **kwargs):
+        # atexit dagi spool test hisoblarini haqiqiy var/views ga yozmasin
+        view_counter._pending.clear()
+        self._settings.disable()
+        self._spool_dir.cleanup()
+        super().teardown_test_environment(**kwargs)
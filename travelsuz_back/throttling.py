@@ -0,0 +1,107 @@
+import math
+import threading
+import time
+
+from django.core.cache import caches
+from rest_framework.settings import api_settings
+from rest_framework.throttling import BaseThrottle
+
+from travelsuz_back.worker_stats import WorkerCounters
+
+# Anonim yozish endpointlari (comment, register, login) uchun token bucket throttle (GCRA).
+# Kalitda "theoretical arrival time" (TAT, ms) turadi: har so'rov uni max(TAT, hozir) dan
+# bitta token narxiga (period / capacity) suradi, TAT hozirdan period dan ko'p oldinda bo'lsa rad.
+# O'qish-hisoblash-yozish bitta lock ostida bajariladi, shuning uchun parallel so'rovlar
+# bir-birining yozuvini yo'qotmaydi va bucket ortiqcha token bermaydi. "throttle" cache
+# aliasi shu sababli worker ichidagi LocMemCache bo'lishi kerak (limit har worker uchun).
+#
+# Tezliklar REST_FRAMEWORK['DEFAULT_THROTTLE_RATES'] da: "<scope>_ip" va "<scope>_user",
+# masalan 'comment_ip': '10/min' - 10 ta so'rovgacha birdaniga, keyin har 6 sekundda bittadan.
+# IP REST_FRAMEWORK['NUM_PROXIES'] bo'yicha aniqlanadi (DRF get_ident).
+
+CACHE_ALIAS = 'throttle'
+DURATIONS = {'s': 1, 'm': 60, 'h': 3600, 'd': 86400}
+
+_bucket_lock = threading.Lock()
+# allowed/rejected hisoblari worker xotirasida (travelsuz_back/worker_stats.py)
+stats = WorkerCounters('throttle:stats')
+
+
+def parse_rate(rate):
+    """'10/min' -> (capacity, period sekundda)."""
+    num, period = rate.split('/')
+    return int(num), DURATIONS[period[0]]
+
+
+def _count(scope, decision) -> None:
+    stats.incr(f'{scope}:{decision}')
+
+
+def get_stats() -> dict:
+    totals = stats.totals()
+    result = {}
+    for scope in api_settings.DEFAULT_THROTTLE_RATES or {}:
+        allowed = totals.get(f'{scope}:allowed', 0)
+        rejected = totals.get(f'{scope}:rejected', 0)
+        if allowed or rejected:
+            result[scope] = {'allowed': allowed, 'rejected': rejected}
+    return result
+
+
+class TokenBucketThrottle(BaseThrottle):
+    kind = None
+
+    def __init__(self):
+        self.retry_after = None
+
+    def get_ident_key(self, request):
+        raise NotImplementedError
+
+    def allow_request(self, request, view):
+        scope = getattr(view, 'throttle_scope', None)
+        rate = (api_settings.DEFAULT_THROTTLE_RATES or {}).get(f'{scope}_{self.kind}') if scope else None
+        ident = self.get_ident_key(request) if rate else None
+        if ident is None:
+            return True
+
+        capacity, period = parse_rate(rate)
+        period_ms = period * 1000
+        cost = max(period_ms // capacity, 1)
+        key = f'throttle:{scope}_{self.kind}:{ident}'
+        bucket = caches[CACHE_ALIAS]
+
+        with _bucket_lock:
+            now = int(time.time() * 1000)
+            tat = max(bucket.get(key, now), now) + cost
+            allowed = tat - now <= period_ms
+            if allowed:
+                # bucket to'lgan paytda kalit o'zi o'chadi
+                bucket.set(key, tat, math.ceil((tat - now) / 1000) + 1)
+
+        if not allowed:
+            self.retry_after = (tat - now - period_ms) / 1000
+            _count(f'{scope}_{self.kind}', 'rejected')
+            return False
+        _count(f'{scope}_{self.kind}', 'allowed')
+        return True
+
+    def wait(self):
+        return math.ceil(self.retry_after) if self.retry_after is not None else None
+
+
+class IPTokenBucketThrottle(TokenBucketThrottle):
+    kind = 'ip'
+
+    def get_ident_key(self, request):
+        return self.get_ident(request)
+
+
+class UserTokenBucketThrottle(TokenBucketThrottle):
+    kind = 'user'
+
+    def get_ident_key(self, request):
+        user = getattr(request, 'user', None)
+        return user.pk if user is not None and user.is_authenticated else None
+
+
+WRITE_THROTTLES = [IPTokenBucketThrottle, UserTokenBucketThrottle]
@@ -14,6 +14,8 @@ from rest_framework_simplejwt.views import (
     TokenRefreshView,
 )
 
+from travelsuz_back.views import MetricsView, CatalogExportView, CatalogImportView
+
 urlpatterns = [
     # Admin
     path('admin/', admin.site.urls),
@@ -28,6 +30,11 @@ urlpatterns = [
     path('api/v0/restaurants/', include('apps.restaurants.api.v0.urls')),
     path('api/v0/travels/', include('apps.travels.api.v0.urls')),
     path('api/v0/users/', include('apps.users.api.v0.urls')),
+    path('api/v0/search/', include('apps.search.api.v0.urls')),
+    path('api/v0/trending/', include('apps.trending.api.v0.urls')),
+    path('api/v0/metrics/', MetricsView.as_view(), name='metrics'),
+    path('api/v0/export/', CatalogExportView.as_view(), name='catalog_export'),
+    path('api/v0/import/', CatalogImportView.as_view(), name='catalog_import'),
 
     # drf-spectacular schema va docs
     path('api/schema/', SpectacularAPIView.as_view(), name='schema'),
@@ -0,0 +1,203 @@
+import atexit
+import json
+import logging
+import os
+import threading
+import time
+import uuid
+from collections import Counter
+from datetime import timedelta
+
+from asgiref.sync import sync_to_async
+from django.apps import apps
+from django.conf import settings
+from django.db import transaction
+from django.db.models import F
+from django.db.models.functions import Now
+from django.utils import timezone
+
+from travelsuz_back import cards, region_stats
+
+logger = logging.getLogger(__name__)
+
+# Detail GET'lar views ni bazaga yozmaydi: har bir worker o'z hisoblagichini xotirada
+# yig'adi va VIEW_COUNTER_FLUSH_INTERVAL sekundda bir marta spool papkaga tashlaydi.
+# Spool fayllarni so'rovdan tashqarida `manage.py flush_views` (cron yoki --interval)
+# batched F('views') + n UPDATE'lar bilan bazaga qo'shadi. updated_at ham yangilanadi:
+# javobdagi views o'zgargani uchun ETag/Last-Modified ham o'zgarishi kerak.
+# flush() olgan fayl ".claimed" bo'ladi; jarayon yiqilib qolsa, VIEW_COUNTER_CLAIM_TIMEOUT
+# sekunddan eski ".claimed" fayllarni keyingi flush() qayta oladi. Qo'shilgan spool nomi UPDATE
+# bilan bitta tranzaksiyada AppliedViewSpool ga yoziladi: commit dan keyin o'chirilmay qolgan
+# fayl qayta olinsa, views ikkinchi marta qo'shilmaydi.
+
+UPDATE_BATCH_SIZE = 500
+
+_lock = threading.Lock()
+_pending = Counter()
+_last_flush = time.monotonic()
+
+
+def _spool_dir() -> str:
+    directory = str(settings.VIEW_COUNTER_SPOOL_DIR)
+    os.makedirs(directory, exist_ok=True)
+    return directory
+
+
+def _count(model, pk) -> bool:
+    """Xotiradagi hisobni oshiradi; spool ga tashlash vaqti kelgan bo'lsa True."""
+    global _last_flush
+    key = (model._meta.label_lower, int(pk))
+    with _lock:
+        _pending[key] += 1
+        due = time.monotonic() - _last_flush >= settings.VIEW_COUNTER_FLUSH_INTERVAL
+        if due:
+            _last_flush = time.monotonic()
+    return due
+
+
+def _spool_safely() -> None:
+    try:
+        _spool_pending()
+    except OSError:
+        logger.exception("View counter spool write failed")
+
+
+def record_view(model, pk) -> None:
+    """Faqat xotira va spool fayl: so'rov ichida bazaga yozilmaydi."""
+    if _count(model, pk):
+        _spool_safely()
+
+
+async def arecord_view(model, pk) -> None:
+    """Async view lar uchun: fayl yozish event loop ni to'xtatmasin."""
+    if _count(model, pk):
+        await sync_to_async(_spool_safely)()
+
+
+def _spool_pending() -> None:
+    with _lock:
+        counts = dict(_pending)
+        _pending.clear()
+    if not counts:
+        return
+
+    data = {}
+    for (label, pk), n in counts.items():
+        data.setdefault(label, {})[str(pk)] = n
+
+    directory = _spool_dir()
+    name = f"{os.getpid()}-{uuid.uuid4().hex}"
+    tmp_path = os.path.join(directory, f"{name}.tmp")
+    with open(tmp_path, 'w') as f:
+        json.dump(data, f)
+    os.replace(tmp_path, os.path.join(directory, f"{name}.json"))
+
+
+def _claim(path, claimed_path) -> bool:
+    try:
+        # vaqt belgisi claim paytini ko'rsatadi (rename mtime ni o'zgartirmaydi)
+        os.utime(path)
+        os.rename(path, claimed_path)
+    except FileNotFoundError:
+        # boshqa worker bu faylni allaqachon olib ketgan
+        return False
+    return True
+
+
+def _spool_name(path) -> str:
+    # qayta olingan faylga qo'shilgan suffiksiz: "<pid>-<uuid>"
+    return '-'.join(os.path.basename(path).split('.')[0].split('-')[:2])
+
+
+def _claim_spool() -> list:
+    directory = _spool_dir()
+    stale_before = time.time() - settings.VIEW_COUNTER_CLAIM_TIMEOUT
+    claimed = []
+    for name in sorted(os.listdir(directory)):
+        path = os.path.join(directory, name)
+        if name.endswith('.claimed'):
+            # flush o'rtasida to'xtagan jarayonning fayli
+            try:
+                if os.path.getmtime(path) >= stale_before:
+                    continue
+            except FileNotFoundError:
+                continue
+            claimed_path = os.path.join(directory, f"{name.split('.')[0]}-{uuid.uuid4().hex[:8]}.claimed")
+        elif name.endswith('.json'):
+            claimed_path = f"{path[:-len('.json')]}.claimed"
+        else:
+            continue
+        if _claim(path, claimed_path):
+            claimed.append(claimed_path)
+    return claimed
+
+
+def _apply(spools: dict) -> int:
+    """spools: {spool nomi: {label: {pk: n}}}; avval qo'shilganlari o'tkazib yuboriladi."""
+    from apps.hotels.models import AppliedViewSpool
+
+    updated = 0
+    with transaction.atomic():
+        applied = set(AppliedViewSpool.objects.filter(name__in=list(spools)).values_list('name', flat=True))
+        new = [name for name in spools if name not in applied]
+        # shu nomni parallel flush ham yozayotgan bo'lsa, bittasi IntegrityError bilan to'liq bekor bo'ladi
+        AppliedViewSpool.objects.bulk_create([AppliedViewSpool(name=name) for name in new])
+
+        totals = {}
+        for name in new:
+            for label, counts in spools[name].items():
+                bucket = totals.setdefault(label, Counter())
+                for pk, n in counts.items():
+                    bucket[int(pk)] += n
+
+        for label, counts in totals.items():
+            model = apps.get_model(label)
+            by_increment = {}
+            for pk, n in counts.items():
+                by_increment.setdefault(n, []).append(pk)
+            for n, pks in by_increment.items():
+                for start in range(0, len(pks), UPDATE_BATCH_SIZE):
+                    updated += model.objects.filter(
+                        pk__in=pks[start:start + UPDATE_BATCH_SIZE]
+                    ).update(views=F('views') + n, updated_at=Now())
+            cards.invalidate(model, list(counts))
+            region_stats.refresh_objects(model, list(counts))
+
+        retention = timezone.now() - timedelta(seconds=settings.VIEW_COUNTER_APPLIED_RETENTION)
+        AppliedViewSpool.objects.filter(applied_at__lt=retention).delete()
+    return updated
+
+
+def flush() -> int:
+    _spool_pending()
+    claimed = _claim_spool()
+    if not claimed:
+        return 0
+
+    spools = {}
+    for path in list(claimed):
+        try:
+            with open(path) as f:
+                data = json.load(f)
+        except ValueError:
+            # buzilgan faylni har flush da qayta o'qimaslik uchun chetga olamiz
+            logger.error("Broken view counter spool file %s", path)
+            os.rename(path, f"{path[:-len('.claimed')]}.broken")
+            claimed.remove(path)
+            continue
+        spools[_spool_name(path)] = data
+
+    try:
+        updated = _apply(spools)
+    except Exception:
+        # xato turi qanday bo'lmasin, fayllar keyingi flush uchun qaytariladi
+        for path in claimed:
+            os.rename(path, f"{path[:-len('.claimed')]}.json")
+        raise
+
+    for path in claimed:
+        os.remove(path)
+    return updated
+
+
+atexit.register(_spool_pending)
@@ -0,0 +1,84 @@
+import io
+
+from django.http import StreamingHttpResponse
+from django.utils import timezone
+from drf_spectacular.types import OpenApiTypes
+from drf_spectacular.utils import extend_schema, OpenApiParameter
+from rest_framework.exceptions import ValidationError
+from rest_framework.parsers import MultiPartParser, FormParser
+from rest_framework.permissions import IsAdminUser, IsAuthenticated
+from rest_framework.response import Response
+from rest_framework.views import APIView
+
+from travelsuz_back import export, importer, response_cache, throttling
+
+
+class MetricsView(APIView):
+    permission_classes = [IsAdminUser]
+
+    @extend_schema(tags=["Metrics"], summary="Cache va boshqa ichki metrikalar")
+    def get(self, request):
+        return Response({
+            'response_cache': response_cache.get_stats(),
+            'throttle': throttling.get_stats(),
+        })
+
+
+class CatalogExportView(APIView):
+    permission_classes = [IsAuthenticated]
+
+    def perform_content_negotiation(self, request, force=False):
+        # javob text/csv yoki NDJSON bo'lsa ham Accept sarlavhasi 406 bermasin
+        return super().perform_content_negotiation(request, force=True)
+
+    @extend_schema(
+        tags=["Export"],
+        summary="Katalogni NDJSON/CSV ko'rinishida eksport qilish",
+        parameters=[
+            OpenApiParameter('output', str, enum=export.FORMATS, description="ndjson (default) yoki csv"),
+            OpenApiParameter('type', str, description="regions,hotels,travels,restaurants (vergul bilan)"),
+            OpenApiParameter('since', OpenApiTypes.DATETIME, description="Shu vaqtdan keyin o'zgarganlar"),
+        ],
+        responses={200: OpenApiTypes.BINARY},
+    )
+    def get(self, request):
+        fmt = request.query_params.get('output', 'ndjson')
+        if fmt not in export.FORMATS:
+            raise ValidationError({'output': f"Mumkin: {', '.join(export.FORMATS)}"})
+        kinds = export.parse_kinds(request.query_params.get('type'))
+        since = export.parse_since(request.query_params.get('since'))
+
+        started_at = timezone.now()
+        response = StreamingHttpResponse(export.export_lines(fmt, kinds, since),
+                                         content_type=export.CONTENT_TYPES[fmt])
+        response['Content-Disposition'] = f'attachment; filename="catalog-{"-".join(kinds)}.{fmt}"'
+        # keyingi incremental eksport uchun ?since= qiymati
+        response['X-Export-Timestamp'] = started_at.isoformat()
+        return response
+
+
+class CatalogImportView(APIView):
+    permission_classes = [IsAdminUser]
+    parser_classes = (MultiPartParser, FormParser)
+
+    @extend_schema(
+        tags=["Export"],
+        summary="Katalogni NDJSON/CSV fayldan ommaviy yuklash",
+        request={'multipart/form-data': {'type': 'object', 'properties': {
+            'file': {'type': 'string', 'format': 'binary', 'description': ".ndjson/.jsonl yoki .csv fayl"},
+            'type': {'type': 'string', 'description': "CSV uchun: hotels, travels yoki restaurants"},
+        }}},
+    )
+    def post(self, request):
+        upload = request.FILES.get('file')
+        if upload is None:
+            raise ValidationError({'file': "Faylni yuklang"})
+        fmt = importer.detect_format(upload.name)
+        if fmt is None:
+            raise ValidationError({'file': "Faqat .ndjson, .jsonl yoki .csv fayl qabul qilinadi"})
+        kind = request.data.get('type') or None
+        if fmt == 'csv' and kind not in importer.IMPORT_SERIALIZERS:
+            raise ValidationError({'type': f"CSV uchun turini kiriting: {', '.join(importer.IMPORT_SERIALIZERS)}"})
+
+        stream = io.TextIOWrapper(upload.file, encoding='utf-8-sig', newline='')
+        return Response(importer.import_catalog(stream, fmt, kind))
@@ -0,0 +1,73 @@
+import os
+import threading
+import time
+import uuid
+from collections import Counter
+
+from django.conf import settings
+from django.core.cache import cache
+
+# Metrika hisoblagichlari (hit/miss, throttle allowed/rejected) har so'rovda umumiy cache ga
+# yozilmaydi: worker ularni xotirada yig'adi va WORKER_STATS_INTERVAL sekundda bir marta
+# o'zining kalitiga to'liq qiymatni yozadi. Kalitni faqat shu worker yozadi, shuning uchun
+# hisob yo'qolmaydi. Kalitlar WORKER_STATS_TTL bilan yoziladi va har yozishda yangilanadi:
+# to'xtagan (qayta ishga tushgan) worker ning kaliti muddati o'tib o'chadi va ro'yxatdan chiqadi.
+
+
+class WorkerCounters:
+    def __init__(self, prefix):
+        self.prefix = prefix
+        self.workers_key = f'{prefix}:workers'
+        self._lock = threading.Lock()
+        self._pid = None
+        self._worker_id = None
+        self._counts = Counter()
+        self._written = 0.0
+
+    def _worker_key(self, worker_id) -> str:
+        return f'{self.prefix}:{worker_id}'
+
+    def _check_fork(self) -> None:
+        # gunicorn --preload: fork dan keyin har bir worker o'z id si va hisobi bilan boshlaydi
+        pid = os.getpid()
+        if pid != self._pid:
+            self._pid, self._worker_id = pid, f'{pid}-{uuid.uuid4().hex[:8]}'
+            self._counts.clear()
+            self._written = 0.0
+
+    def incr(self, name) -> None:
+        with self._lock:
+            self._check_fork()
+            self._counts[name] += 1
+            due = time.monotonic() - self._written >= settings.WORKER_STATS_INTERVAL
+        if due:
+            self.write()
+
+    def clear(self) -> None:
+        with self._lock:
+            self._counts.clear()
+
+    def write(self) -> None:
+        with self._lock:
+            self._check_fork()
+            counts, worker_id = dict(self._counts), self._worker_id
+            self._written = time.monotonic()
+        ttl = settings.WORKER_STATS_TTL
+        cache.set(self._worker_key(worker_id), counts, ttl)
+        workers = cache.get(self.workers_key) or []
+        if worker_id not in workers:
+            workers = workers + [worker_id]
+        cache.set(self.workers_key, workers, ttl)
+
+    def totals(self) -> dict:
+        """Barcha tirik workerlar bo'yicha {nom: soni}."""
+        self.write()
+        workers = cache.get(self.workers_key) or []
+        values = cache.get_many([self._worker_key(worker_id) for worker_id in workers])
+        alive = [worker_id for worker_id in workers if self._worker_key(worker_id) in values]
+        if len(alive) != len(workers):
+            cache.set(self.workers_key, alive, settings.WORKER_STATS_TTL)
+        totals = Counter()
+        for counts in values.values():
+            totals.update(counts)
+        return dict(totals)